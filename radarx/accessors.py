@@ -18,6 +18,7 @@ This module contains the functionality to create those accessors.
 
    {}
 """
+
 from __future__ import annotations  # noqa: F401
 
 __all__ = ["create_radarx_dataarray_accessor"]
@@ -25,7 +26,8 @@ __all__ = ["create_radarx_dataarray_accessor"]
 __doc__ = __doc__.format("\n   ".join(__all__))
 
 import xarray as xr
-from .grid import grid_radar  # noqa
+
+from .grid import grid_product, grid_radar  # noqa
 from .vis import plot_maxcappi  # noqa
 
 
@@ -128,6 +130,14 @@ class RadarxDataTreeAccessor(RadarxAccessor):
         x_smth=0.2,
         y_smth=0.2,
         z_smth=1,
+        cache=False,
+        return_timings=False,
+        geo=True,
+        fill_method="nearest_above",
+        fill_max_depth=None,
+        cull=True,
+        method="barnes",
+        engine_kwargs=None,
     ):
 
         dtree = grid_radar(
@@ -143,5 +153,37 @@ class RadarxDataTreeAccessor(RadarxAccessor):
             x_smth,
             y_smth,
             z_smth,
+            cache=cache,
+            return_timings=return_timings,
+            geo=geo,
+            fill_method=fill_method,
+            fill_max_depth=fill_max_depth,
+            cull=cull,
+            method=method,
+            engine_kwargs=engine_kwargs,
         )
         return dtree
+
+    def to_product(
+        self,
+        data_vars=None,
+        product="max",
+        x_lim=(-100e3, 100e3),
+        y_lim=(-100e3, 100e3),
+        x_step=500,
+        y_step=500,
+        height=None,
+        max_dz=None,
+    ):
+        """Compute a 2-D product straight from the polar gates."""
+        return grid_product(
+            self.xarray_obj,
+            data_vars,
+            product,
+            x_lim,
+            y_lim,
+            x_step,
+            y_step,
+            height=height,
+            max_dz=max_dz,
+        )
@@ -10,8 +10,20 @@ Radarx Grid
     :maxdepth: 4
 
 .. automodule:: radarx.grid.grid
+.. automodule:: radarx.grid.operator
+.. automodule:: radarx.grid.fill
+.. automodule:: radarx.grid.engines
+.. automodule:: radarx.grid.tiles
+.. automodule:: radarx.grid.batch
+.. automodule:: radarx.grid.products
 """
 
 from .grid import *  # noqa
+from .operator import *  # noqa
+from .fill import *  # noqa
+from .engines import *  # noqa
+from .tiles import *  # noqa
+from .batch import *  # noqa
+from .products import *  # noqa
 
 __all__ = [s for s in dir() if not s.startswith("_")]
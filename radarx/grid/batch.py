@@ -0,0 +1,156 @@
+#!/usr/bin/env python
+# Copyright (c) 2024-2025, radarx developers.
+# Distributed under the MIT License. See LICENSE for more info.
+
+"""
+Radarx Batch Gridding
+=====================
+
+This sub-module contains the gridding of radar volume time series. The
+target grid, coordinate transforms and georeferencing of the grid are
+computed once per site and shared by all volumes.
+
+.. autosummary::
+   :nosignatures:
+   :toctree: generated/
+
+   {}
+"""
+
+__all__ = [
+    "grid_radar_batch",
+]
+
+__doc__ = __doc__.format("\n   ".join(__all__))
+
+import logging
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+import xarray as xr
+
+from .grid import _grid_setup, _grid_volume
+
+logger = logging.getLogger(__name__)
+
+_SETUP_KWARGS = (
+    "geo",
+    "x_lim",
+    "y_lim",
+    "z_lim",
+    "x_step",
+    "y_step",
+    "z_step",
+    "x_smth",
+    "y_smth",
+    "z_smth",
+)
+
+# errors of unreadable or ungriddable volumes, any other error is raised
+_VOLUME_ERRORS = (OSError, ValueError, KeyError, IndexError)
+
+
+def _open_source(source, reader):
+    """Return a DataTree, reading it first if a path is given."""
+    if isinstance(source, (str, os.PathLike)):
+        return (reader or xr.open_datatree)(source)
+    return source
+
+
+def _grid_source(source, reader, setup, kwargs):
+    """Grid a single volume, as run by the workers."""
+    ds = _grid_volume(_open_source(source, reader), setup, **kwargs)
+    return ds.set_coords("time").expand_dims("time")
+
+
+def grid_radar_batch(sources, reader=None, max_workers=None, **kwargs):
+    """
+    Grid a time series of radar volumes onto a common grid.
+
+    Parameters
+    ----------
+    sources : sequence of xarray.DataTree or str
+        Radar volumes, or paths to them, all from the same site.
+    reader : callable, optional
+        Function reading a path into a radar DataTree, e.g.
+        :func:`radarx.io.read_volume` or an ``xradar.io`` reader.
+        Defaults to :func:`xarray.open_datatree`.
+    max_workers : int, optional
+        Number of worker processes. At most two volumes per worker are in
+        flight at any time. Defaults to None (serial).
+    **kwargs : dict
+        Keyword arguments of :func:`~radarx.grid.grid_radar`, e.g. the grid
+        limits, steps, ``method`` or ``cache``.
+
+    Returns
+    -------
+    xarray.Dataset
+        Gridded volumes stacked along ``time``, sorted by time. Volumes
+        which could not be read or gridded (``OSError``, ``ValueError``,
+        ``KeyError`` or ``IndexError``) are skipped, their sources and
+        errors are stored in the ``failed_sources`` and ``failed_errors``
+        attributes. Any other error is raised.
+
+    Notes
+    -----
+    With ``cache=True`` every worker process keeps its own operator cache,
+    so the sparse operator is built once per worker and scan geometry.
+    """
+    if "return_timings" in kwargs:
+        raise ValueError("`return_timings` is not supported in batch mode.")
+    setup_kwargs = {k: kwargs.pop(k) for k in _SETUP_KWARGS if k in kwargs}
+    sources = list(sources)
+    labels = [
+        str(src) if isinstance(src, (str, os.PathLike)) else f"volume {i}"
+        for i, src in enumerate(sources)
+    ]
+    results, failed = [], []
+
+    def collect(label, func, *args):
+        try:
+            results.append(func(*args))
+        except _VOLUME_ERRORS as err:
+            logger.warning(f"Gridding {label} failed: {err!r}")
+            failed.append((label, repr(err)))
+
+    # the target grid is computed once from the first readable volume
+    setup = None
+    while setup is None and sources:
+        label, source = labels.pop(0), sources.pop(0)
+        try:
+            first = _open_source(source, reader)
+            setup = _grid_setup(first["sweep_0"].to_dataset(), **setup_kwargs)
+        except _VOLUME_ERRORS as err:
+            logger.warning(f"Reading {label} failed: {err!r}")
+            failed.append((label, repr(err)))
+            continue
+        collect(label, _grid_source, first, reader, setup, kwargs)
+
+    if max_workers is None:
+        for label, source in zip(labels, sources):
+            collect(label, _grid_source, source, reader, setup, kwargs)
+    else:
+        pending = deque()
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            for label, source in zip(labels, sources):
+                future = executor.submit(_grid_source, source, reader, setup, kwargs)
+                pending.append((label, future))
+                if len(pending) >= 2 * max_workers:
+                    label, future = pending.popleft()
+                    collect(label, future.result)
+            while pending:
+                label, future = pending.popleft()
+                collect(label, future.result)
+
+    if not results:
+        raise RuntimeError(f"Gridding failed for all {len(failed)} volumes.")
+    logger.info(f"Gridded {len(results)} of {len(results) + len(failed)} volumes.")
+
+    ds = xr.concat(
+        results, dim="time", data_vars="minimal", coords="minimal", compat="override"
+    ).sortby("time")
+    ds.attrs = dict(results[0].attrs)
+    ds.attrs["failed_sources"] = [src for src, _ in failed]
+    ds.attrs["failed_errors"] = [err for _, err in failed]
+    return ds
@@ -0,0 +1,98 @@
+#!/usr/bin/env python
+# Copyright (c) 2024-2025, radarx developers.
+# Distributed under the MIT License. See LICENSE for more info.
+
+"""
+Radarx Vertical Fill
+====================
+
+This sub-module contains a vectorised vertical gap-fill for gridded radar
+volumes, as used to build pseudo-CAPPIs.
+
+.. autosummary::
+   :nosignatures:
+   :toctree: generated/
+
+   {}
+"""
+
+__all__ = [
+    "fill_vertical",
+]
+
+__doc__ = __doc__.format("\n   ".join(__all__))
+
+import numpy as np
+
+FILL_METHODS = ("nearest_above", "lowest_valid")
+
+
+def fill_vertical(field, z=None, method="nearest_above", max_depth=None):
+    """
+    Fill missing values of a gridded volume from the levels above, in place.
+
+    Parameters
+    ----------
+    field : numpy.ndarray
+        Gridded volume with shape ``(nz, ny, nx)``. Missing values are NaN.
+        The array is modified in place.
+    z : array-like, optional
+        Height of each level (meters). Required if ``max_depth`` is given.
+    method : {'nearest_above', 'lowest_valid'}, optional
+        Fill strategy. ``'nearest_above'`` fills every missing cell with the
+        nearest valid value above it. ``'lowest_valid'`` fills only the cells
+        below the lowest valid echo of each column with that echo, leaving
+        gaps between echoes untouched. Defaults to ``'nearest_above'``.
+    max_depth : float, optional
+        Maximum vertical distance (meters) between a filled cell and its
+        source level. Defaults to None (no limit).
+
+    Returns
+    -------
+    numpy.ndarray
+        Boolean mask of the cells which have been filled.
+
+    Notes
+    -----
+    The source level of every cell is found with a reverse cumulative
+    minimum of the valid level indices along z, so no Python loop over the
+    levels and no copy of the volume is needed.
+    """
+    if method not in FILL_METHODS:
+        raise ValueError(
+            f"Unknown fill method {method!r}, expected one of {FILL_METHODS}."
+        )
+    if max_depth is not None and z is None:
+        raise ValueError("Heights `z` are required to apply `max_depth`.")
+
+    nz = field.shape[0]
+    valid = np.isfinite(field)
+    if nz == 0:
+        return np.zeros_like(valid)
+
+    # index of the source level of each cell, nz marks "no source"
+    itype = np.int16 if nz < np.iinfo(np.int16).max else np.int32
+    levels = np.arange(nz, dtype=itype).reshape((nz,) + (1,) * (field.ndim - 1))
+    src = np.where(valid, levels, itype(nz))
+
+    if method == "nearest_above":
+        # reverse cumulative minimum gives the nearest valid level above
+        rev = src[::-1]
+        np.minimum.accumulate(rev, axis=0, out=rev)
+    else:
+        lowest = src.min(axis=0)
+        src = np.where(levels < lowest, lowest, itype(nz))
+
+    filled = ~valid & (src < nz)
+    idx = np.nonzero(filled)
+    src_idx = src[idx]
+    if max_depth is not None:
+        z = np.asarray(z, dtype=np.float64)
+        too_deep = z[src_idx] - z[idx[0]] > max_depth
+        filled[tuple(i[too_deep] for i in idx)] = False
+        idx = tuple(i[~too_deep] for i in idx)
+        src_idx = src_idx[~too_deep]
+
+    # copy only the filled cells from their source level
+    field[idx] = field[(src_idx,) + idx[1:]]
+    return filled
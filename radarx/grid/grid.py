@@ -23,21 +23,29 @@ __all__ = [
 
 __doc__ = __doc__.format("\n   ".join(__all__))
 
+import logging
+
 import numpy as np
+import pandas as pd
 import xarray as xr
+import xradar as xd
 
-try:  # pragma: no cover
-    from fastbarnes import interpolation
-    from fastbarnes.interpolation import get_half_kernel_size
-
-    FASTBARNES_AVAILABLE = True
-except ImportError:  # pragma: no cover
-    FASTBARNES_AVAILABLE = False
+from ..utils import find_multidim_vars, get_geocoords  #  noqa
+from .engines import get_engine, grid_fields
+from .fill import fill_vertical
+from .operator import (
+    _OPERATOR_CACHE,
+    OperatorCache,
+    _sort_rays,
+    build_grid_operator,
+    get_grid_operator,
+    operator_key,
+)
 
-from ..utils import get_geocoords, find_multidim_vars  #  noqa
+logger = logging.getLogger(__name__)
 
 
-def stack_data(dtree, data_vars=None, geo=False):
+def stack_data(dtree, data_vars=None, geo=False, multiindex=True, bounds=None):
     """
     Stack data from a radar DataTree into a single xarray Dataset.
 
@@ -50,11 +58,31 @@ def stack_data(dtree, data_vars=None, geo=False):
         than one dimension are included.
     geo : bool, optional
         If True, converts coordinates to geographic (lon, lat, alt).
+    multiindex : bool, optional
+        If True (default), the ``npoints`` dimension carries an
+        (azimuth, range) MultiIndex and a per-gate ``time`` coordinate. If
+        False, these are not built and ``time`` is the scalar mean time of
+        all gates, which keeps memory use to the stacked buffers only.
+    bounds : tuple of tuple of float, optional
+        Domain ``((xmin, xmax), (ymin, ymax), (zmin, zmax))`` in the radar's
+        native Cartesian coordinates (meters). If given, the range tail of
+        each sweep which cannot reach this domain is dropped before
+        stacking. Defaults to None (keep all gates).
 
     Returns
     -------
     xarray.Dataset
         A stacked dataset with the specified or all multidimensional variables.
+
+    Notes
+    -----
+    The gates of all sweeps are copied once into a contiguous float32
+    ``(npoints, 3)`` coordinate buffer and a ``(nvars, npoints)`` data
+    buffer. The data variables of the returned Dataset are views of the
+    latter. Gates of sweeps missing a variable are set to NaN.
+
+    With ``bounds``, the number of gates kept per sweep is logged and stored
+    in the ``gates_per_sweep`` attribute of the returned Dataset.
     """
     dtree = dtree.xradar.georeference()
     if geo:
@@ -63,49 +91,101 @@ def stack_data(dtree, data_vars=None, geo=False):
     else:
         x, y, z = "x", "y", "z"
 
-    swp_list = []
-    data_vars_dict = {}
-
-    # Loop through sweeps
-    for swp in dtree.match("sweep_*"):
-        ds = dtree[swp].to_dataset()
-
-        # Find variables to include if data_vars is None
-        if data_vars is None:  # pragma
-            vars_to_stack = find_multidim_vars(ds, ndim=2)
-        else:  # pragma: no cover
-            vars_to_stack = data_vars
-
-        # Stack coordinates
-        xyz = (
-            xr.concat(
-                [
-                    ds.coords[x].reset_coords(drop=True),
-                    ds.coords[y].reset_coords(drop=True),
-                    ds.coords[z].reset_coords(drop=True),
-                ],
-                "xyz",
+    sweeps = [dtree[swp].to_dataset() for swp in dtree.match("sweep_*")]
+
+    # Drop range tails outside the domain before anything is copied
+    if bounds is not None:
+        culled = []
+        for swp, ds in zip(dtree.match("sweep_*"), sweeps):
+            nrange = _range_limit(ds, bounds)
+            logger.info(
+                f"{swp}: kept {nrange * ds.sizes['azimuth']} of "
+                f"{ds.sizes['range'] * ds.sizes['azimuth']} gates."
             )
-            .stack(npoints=("azimuth", "range"))
-            .transpose(..., "xyz")
+            culled.append(ds.isel(range=slice(0, nrange)))
+        sweeps = culled
+
+    # Find variables to include if data_vars is None
+    if data_vars is None:  # pragma
+        vars_to_stack = []
+        for ds in sweeps:
+            vars_to_stack += [
+                v for v in find_multidim_vars(ds, ndim=2) if v not in vars_to_stack
+            ]
+    else:  # pragma: no cover
+        vars_to_stack = list(data_vars)
+
+    # Preallocate contiguous buffers for all sweeps
+    sizes = [ds.sizes["azimuth"] * ds.sizes["range"] for ds in sweeps]
+    offsets = np.concatenate([[0], np.cumsum(sizes)])
+    npoints = int(offsets[-1])
+    xyz = np.empty((npoints, 3), dtype=np.float32)
+    data = np.full((len(vars_to_stack), npoints), np.nan, dtype=np.float32)
+
+    # Fill the buffers sweep by sweep with raw NumPy views
+    time_ref = sweeps[0]["time"].values.min().astype("datetime64[ns]")
+    time_sum = 0.0
+    for ds, start, stop in zip(sweeps, offsets[:-1], offsets[1:]):
+        for i, c in enumerate((x, y, z)):
+            xyz[start:stop, i] = _gate_values(ds[c])
+        for i, v in enumerate(vars_to_stack):
+            if v in ds:
+                data[i, start:stop] = _gate_values(ds[v])
+        ray_time = (ds["time"].values - time_ref).astype("timedelta64[ns]")
+        time_sum += ray_time.astype(np.float64).sum() * ds.sizes["range"]
+
+    coords = {"xyz": (("npoints", "xyz"), xyz)}
+    if multiindex:
+        azimuth = np.concatenate(
+            [np.repeat(ds["azimuth"].values, ds.sizes["range"]) for ds in sweeps]
+        )
+        rng = np.concatenate(
+            [np.tile(ds["range"].values, ds.sizes["azimuth"]) for ds in sweeps]
+        )
+        ray_time = np.concatenate(
+            [np.repeat(ds["time"].values, ds.sizes["range"]) for ds in sweeps]
         )
-        swp_list.append(xyz)
+        index = xr.Coordinates.from_pandas_multiindex(
+            pd.MultiIndex.from_arrays([azimuth, rng], names=["azimuth", "range"]),
+            "npoints",
+        )
+        coords.update(index)
+        coords["time"] = ("npoints", ray_time)
+    else:
+        mean_offset = np.timedelta64(int(round(time_sum / max(npoints, 1))), "ns")
+        coords["time"] = time_ref + mean_offset
+
+    dataset = xr.Dataset(
+        {v: ("npoints", data[i]) for i, v in enumerate(vars_to_stack)},
+        coords=coords,
+    )
+    if bounds is not None:
+        dataset.attrs["gates_per_sweep"] = [int(n) for n in sizes]
+    return dataset
+
 
-        # Stack data for each variable
-        for v in vars_to_stack:
-            if v not in data_vars_dict:
-                data_vars_dict[v] = []
-            data = ds[v].stack(npoints=("azimuth", "range"))
-            data_vars_dict[v].append(data)
+def _range_limit(ds, bounds):
+    """
+    Number of leading range gates of a sweep which can reach a domain.
 
-    # Combine stacked data
-    xyz = xr.concat(swp_list, "npoints")
-    dataset = xr.Dataset(coords={"xyz": xyz})
+    Ground distance and height of the gates grow with range, so the whole
+    range tail beyond the farthest domain corner or above the domain top is
+    cut at once.
+    """
+    (xmin, xmax), (ymin, ymax), (_, zmax) = bounds
+    max_dist = max(np.hypot(xx, yy) for xx in (xmin, xmax) for yy in (ymin, ymax))
+    ground = np.hypot(ds["x"].values, ds["y"].values)
+    height = ds["z"].values
+    axis = ds["x"].dims.index("azimuth")
+    reachable = (ground.min(axis=axis) <= max_dist) & (height.min(axis=axis) <= zmax)
+    if not reachable.any():
+        return 0
+    return int(np.flatnonzero(reachable)[-1]) + 1
 
-    for v, data_list in data_vars_dict.items():
-        dataset[v] = xr.concat(data_list, "npoints")
 
-    return dataset
+def _gate_values(da):
+    """Return an (azimuth, range) sweep variable as a flat array."""
+    return da.transpose("azimuth", "range").values.reshape(-1)
 
 
 def make_3d_grid(
@@ -197,6 +277,14 @@ def grid_radar(
     x_smth=0.2,
     y_smth=0.2,
     z_smth=1,
+    cache=False,
+    return_timings=False,
+    geo=True,
+    fill_method="nearest_above",
+    fill_max_depth=None,
+    cull=True,
+    method="barnes",
+    engine_kwargs=None,
 ):
     """
     Interpolate radar data to a 3D grid and optionally create a pseudo-CAPPI.
@@ -219,11 +307,11 @@ def grid_radar(
         (-100e3, 100e3).
     z_lim : tuple of float, optional
         Range of z-coordinates (meters) for the Cartesian grid. Defaults to
-        (0, 16e3).
+        (0, 10e3).
     x_step : int, optional
-        Grid resolution in the x-direction (meters). Defaults to 500.
+        Grid resolution in the x-direction (meters). Defaults to 1000.
     y_step : int, optional
-        Grid resolution in the y-direction (meters). Defaults to 500.
+        Grid resolution in the y-direction (meters). Defaults to 1000.
     z_step : int, optional
         Grid resolution in the z-direction (meters). Defaults to 250.
     x_smth : float, optional
@@ -232,117 +320,332 @@ def grid_radar(
         Smoothing factor for the y-dimension. Defaults to 0.2.
     z_smth : float, optional
         Smoothing factor for the z-dimension. Defaults to 1.
+    cache : bool or OperatorCache, optional
+        If True, grid with a sparse Barnes operator taken from the
+        process-wide operator cache, which is built once per scan geometry
+        and grid definition. An :class:`~radarx.grid.OperatorCache` may be
+        given to use a separate (e.g. disk-backed) cache. Defaults to False.
+    return_timings : bool, optional
+        If True, also return the interpolation wall time. Defaults to False.
+    geo : bool, optional
+        If True (default), gates are converted to geographic coordinates and
+        interpolated on a longitude/latitude grid. If False, interpolation is
+        done directly in the radar's native AEQD x/y/z (meters) with exactly
+        uniform steps, and 2-D ``lon``/``lat`` coordinates are attached to the
+        final grid only.
+    fill_method : {'nearest_above', 'lowest_valid'}, optional
+        Vertical fill strategy of the pseudo-CAPPI, see
+        :func:`~radarx.grid.fill_vertical`. Defaults to 'nearest_above'.
+    fill_max_depth : float, optional
+        Maximum depth (meters) filled below a valid echo in the pseudo-CAPPI.
+        Defaults to None (no limit).
+    cull : bool, optional
+        If True (default), drop the range tail of each sweep which lies
+        beyond the grid domain plus the kernel support radius before
+        interpolation.
+    method : str, optional
+        Gridding engine, one of 'barnes' (default), 'nearest', 'cressman',
+        'idw' or 'bin', or any engine added with
+        :func:`~radarx.grid.register_engine`. See :mod:`radarx.grid.engines`.
+    engine_kwargs : dict, optional
+        Keyword arguments passed to the engine, e.g. ``max_dist`` (radius of
+        influence in units of the smoothing length) or ``statistic`` for the
+        'bin' engine.
 
     Returns
     -------
     xarray.Dataset
         Interpolated dataset with the specified variables and 3D grid.
         Includes longitude and latitude coordinates for the grid.
+    dict
+        Interpolation time in seconds of every variable, or of the names
+        gridded together in one pass joined with ``"+"``, see
+        :func:`~radarx.grid.grid_fields`. Only returned if
+        ``return_timings`` is True.
 
     Notes
     -----
     - The pseudo-CAPPI is created by extrapolating data from higher altitudes
       to fill missing values at lower altitudes.
-    - Interpolation is performed using Barnes interpolation.
+    - Interpolation is performed using Barnes interpolation by default. All
+      variables are gridded in a single pass sharing gate coordinates, grid
+      set-up and, where they agree, the finite-value masks.
+    - With ``cache`` enabled, the operator is reused as long as the site
+      location and the scan strategy (sweep fixed angles, ray counts,
+      azimuth resolution and range gates) match. The rays of every sweep
+      are sorted into nominal azimuth order first, so ray jitter and the
+      start azimuth of a sweep do not matter.
+      Only engines with a sparse operator kernel ('barnes', 'cressman' and
+      'idw') use the cache.
 
     """
-    if not FASTBARNES_AVAILABLE:  # pragma: no cover
-        raise ImportError(
-            "The 'fastbarnes' package is required for this function. "
-            "Install it via 'pip install fast-barnes-py'."
-        )  # pragma: no cover
-    ds = stack_data(dtree, data_vars=data_vars, geo=True)
-    lat, lon, trgx, trgy, z, trg_crs = make_3d_grid(
+    setup = _grid_setup(
         dtree["sweep_0"].to_dataset(),
+        geo=geo,
         x_lim=x_lim,
         y_lim=y_lim,
+        z_lim=z_lim,
         x_step=x_step,
         y_step=y_step,
-        z_lim=z_lim,
         z_step=z_step,
+        x_smth=x_smth,
+        y_smth=y_smth,
+        z_smth=z_smth,
+    )
+    return _grid_volume(
+        dtree,
+        setup,
+        data_vars=data_vars,
+        pseudo_cappi=pseudo_cappi,
+        cache=cache,
+        return_timings=return_timings,
+        fill_method=fill_method,
+        fill_max_depth=fill_max_depth,
+        cull=cull,
+        method=method,
+        engine_kwargs=engine_kwargs,
     )
 
-    x = lon
-    y = lat
 
-    x0 = np.asarray([x.min(), y.min(), z.min()], dtype=np.float64)
-    xstep = np.diff(x).mean()  # Longitude step in degrees
-    ystep = np.diff(y).mean()  # Latitude step in degrees
+def _grid_setup(
+    ds,
+    geo=True,
+    x_lim=(-100e3, 100e3),
+    y_lim=(-100e3, 100e3),
+    z_lim=(0, 10e3),
+    x_step=1000,
+    y_step=1000,
+    z_step=250,
+    x_smth=0.2,
+    y_smth=0.2,
+    z_smth=1,
+):
+    """
+    Compute the target grid of a radar site.
 
-    size = (len(x), len(y), len(z))
+    The grid axes, interpolation arguments and (for the native grid) the
+    2-D geographic coordinates only depend on the site location and the
+    grid arguments, so they can be shared by all volumes of a site.
 
-    # Adjust sigma to match grid steps
-    sigma_lon = x_smth * xstep  # Smoothing across 2 longitude grid steps
-    sigma_lat = y_smth * ystep  # Smoothing across 2 latitude grid steps
-    sigma_alt = z_smth * z_step  # Smoothing across 2 altitude grid steps
-    sigma = np.array([sigma_lon, sigma_lat, sigma_alt], dtype=np.float64)
+    Parameters
+    ----------
+    ds : xarray.Dataset
+        Radar sweep dataset defining the site location.
+    geo, x_lim, y_lim, z_lim, x_step, y_step, z_step, x_smth, y_smth, z_smth
+        See :func:`grid_radar`.
 
-    ds_out_fast = xr.Dataset({"z": ("z", z), "y": ("y", y), "x": ("x", x)})
+    Returns
+    -------
+    dict
+        Grid axes, Barnes arguments and the grid arguments.
+    """
+    lat, lon, trgx, trgy, z, trg_crs = make_3d_grid(
+        ds,
+        x_lim=x_lim,
+        y_lim=y_lim,
+        x_step=x_step,
+        y_step=y_step,
+        z_lim=z_lim,
+        z_step=z_step,
+    )
 
-    # Perform Barnes interpolation
-    if data_vars is None:  # pragma: no cover
-        data_vars = list(ds.data_vars)
+    if geo:
+        x = lon
+        y = lat
+        xstep = np.diff(x).mean()  # Longitude step in degrees
+        ystep = np.diff(y).mean()  # Latitude step in degrees
+    else:
+        # Native AEQD grid, steps are exactly uniform
+        x = trgx
+        y = trgy
+        xstep = x_step
+        ystep = y_step
 
-    for var in data_vars:
-        data_orig = ds[var].values.flatten()
-        x_flat = ds["xyz"][:, 0].values.flatten()  # Longitude
-        y_flat = ds["xyz"][:, 1].values.flatten()  # Latitude
-        z_flat = ds["xyz"][:, 2].values.flatten()  # Altitude
+    # Adjust sigma to match grid steps
+    sigma_x = x_smth * xstep  # Smoothing across x grid steps
+    sigma_y = y_smth * ystep  # Smoothing across y grid steps
+    sigma_z = z_smth * z_step  # Smoothing across z grid steps
+
+    setup = {
+        "x": x,
+        "y": y,
+        "z": z,
+        "trgx": trgx,
+        "trgy": trgy,
+        "x0": np.asarray([x.min(), y.min(), z.min()], dtype=np.float64),
+        "step": [xstep, ystep, z_step],
+        "size": (len(x), len(y), len(z)),
+        "sigma": np.array([sigma_x, sigma_y, sigma_z], dtype=np.float64),
+        "site": tuple(round(float(ds[c].values), 6) for c in ("latitude", "longitude")),
+        "grid_kwargs": dict(
+            geo=geo,
+            x_lim=x_lim,
+            y_lim=y_lim,
+            z_lim=z_lim,
+            x_step=x_step,
+            y_step=y_step,
+            z_step=z_step,
+            x_smth=x_smth,
+            y_smth=y_smth,
+            z_smth=z_smth,
+        ),
+    }
+    if not geo:
+        # Georeference the 2-D grid axes only
+        setup["lon"], setup["lat"] = _grid_geocoords(ds, trgx, trgy)
+    return setup
+
+
+def _grid_volume(
+    dtree,
+    setup,
+    data_vars=None,
+    pseudo_cappi=True,
+    cache=False,
+    return_timings=False,
+    fill_method="nearest_above",
+    fill_max_depth=None,
+    cull=True,
+    method="barnes",
+    engine_kwargs=None,
+):
+    """Grid one volume onto a target grid computed by :func:`_grid_setup`."""
+    engine = get_engine(method)
+    engine_kwargs = dict(engine_kwargs or {})
+    grid_kwargs = setup["grid_kwargs"]
+    geo = grid_kwargs["geo"]
+    x, y, z = setup["x"], setup["y"], setup["z"]
+    sigma, x0, step, size = setup["sigma"], setup["x0"], setup["step"], setup["size"]
+
+    site = tuple(
+        round(float(dtree["sweep_0"][c].values), 6) for c in ("latitude", "longitude")
+    )
+    if site != setup["site"]:
+        raise ValueError(
+            f"Radar site {site} does not match the grid set-up {setup['site']}."
+        )
 
-        mask = np.isfinite(data_orig)
-        if np.sum(mask) == 0:
-            print(f"No valid data points for variable {var}. Skipping...")
-            continue
+    # an empty OperatorCache is falsy, so test for it explicitly
+    use_cache = cache is True or isinstance(cache, OperatorCache)
+    if use_cache and engine.kernel is None:
+        logger.warning(f"Gridding method {method!r} does not use the cache.")
+        use_cache = False
+    max_dist = engine_kwargs.get("max_dist", 4)
+    bounds = None
+    if cull:
+        # Keep every gate within the kernel support of the domain
+        margin = max_dist * np.array(
+            [grid_kwargs[f"{dim}_smth"] * grid_kwargs[f"{dim}_step"] for dim in "xyz"]
+        )
+        bounds = tuple(
+            (lim[0] - m, lim[1] + m)
+            for lim, m in zip(
+                (grid_kwargs["x_lim"], grid_kwargs["y_lim"], grid_kwargs["z_lim"]),
+                margin,
+            )
+        )
+    if use_cache:
+        # match the rays to the cached operator by their nominal azimuth
+        dtree = _sort_rays(dtree)
+    ds = stack_data(
+        dtree, data_vars=data_vars, geo=geo, multiindex=False, bounds=bounds
+    )
 
-        xyz_data = np.vstack((x_flat[mask], y_flat[mask], z_flat[mask])).T
-        data_values = data_orig[mask]
+    ds_out_fast = xr.Dataset({"z": ("z", z), "y": ("y", y), "x": ("x", x)})
 
-        # Validate kernel size
-        kernel_size = (
-            2 * get_half_kernel_size(sigma, [xstep, ystep, z_step], num_iter=4) + 1
+    operator = None
+    if use_cache:
+        key = operator_key(
+            dtree, cull=cull, method=method, max_dist=max_dist, **grid_kwargs
         )
-        if any(kernel_size > np.array(size)):  # pragma: no cover
-            print(
-                f"Kernel size {kernel_size} exceeds grid size {size}. Skipping..."
-            )  # pragma: no cover
-            continue
-
-        # Perform interpolation
-        field = interpolation.barnes(
-            xyz_data,
-            data_values,
-            sigma,
-            x0,
-            [xstep, ystep, z_step],
-            size,
-            max_dist=4,
+
+        def builder():
+            return build_grid_operator(
+                ds["xyz"].values,
+                sigma,
+                x0,
+                step,
+                size,
+                max_dist=max_dist,
+                kernel=engine.kernel,
+            )
+
+        operator = get_grid_operator(
+            key, builder, cache=cache if isinstance(cache, OperatorCache) else None
         )
+        if operator.ngates != ds.sizes["npoints"]:  # pragma: no cover
+            # gate count drifted, e.g. a range gate culled differently
+            logger.warning(f"Gate count changed, rebuilding grid operator {key}.")
+            operator = builder()
+            (cache if isinstance(cache, OperatorCache) else _OPERATOR_CACHE).put(
+                key, operator
+            )
+
+    # Perform the interpolation
+    if data_vars is None:  # pragma: no cover
+        data_vars = list(ds.data_vars)
+
+    fields, timings = grid_fields(
+        ds["xyz"].values,
+        {var: ds[var].values for var in data_vars},
+        sigma,
+        x0,
+        step,
+        size,
+        method=method,
+        operator=operator,
+        **engine_kwargs,
+    )
+    for var, field in fields.items():
         if pseudo_cappi:
-            # Create pseudo-CAPPI by extrapolating to lower levels
-            pseudo_cappi_field = field.copy()
-            for z_idx in range(
-                len(z) - 3, -1, -1
-            ):  # Iterate from higher levels to lower levels
-                upper_level = pseudo_cappi_field[
-                    z_idx + 1, :, :
-                ]  # Data from the level above
-                current_level = pseudo_cappi_field[z_idx, :, :]  # Current level
-                mask = np.isnan(current_level)  # Identify missing values at this level
-                pseudo_cappi_field[z_idx, mask] = upper_level[
-                    mask
-                ]  # Fill missing with the level above
-
-            # Add pseudo-CAPPI field to the output dataset
-            ds_out_fast[var] = (("z", "y", "x"), pseudo_cappi_field)
-        else:  # pragma: no cover
-            ds_out_fast[var] = (("z", "y", "x"), field)
+            # Create pseudo-CAPPI by extrapolating to lower levels in place,
+            # the top level is kept as is and not used as a source
+            fill_vertical(
+                field[:-1], z[:-1], method=fill_method, max_depth=fill_max_depth
+            )
+        ds_out_fast[var] = (("z", "y", "x"), field)
+
     # Assign metadata
     ds_out_fast["time"] = ds.time.mean()
-    ds_out_fast = ds_out_fast.rename({"x": "lon", "y": "lat"})
-    ds_out_fast["x"] = xr.DataArray(trgx, dims="lon")
-    ds_out_fast["y"] = xr.DataArray(trgy, dims="lat")
-    ds_out_fast = ds_out_fast.set_coords(["x", "y"])
-    ds_out_fast = ds_out_fast.swap_dims({"lon": "x", "lat": "y"})
+    if geo:
+        ds_out_fast = ds_out_fast.rename({"x": "lon", "y": "lat"})
+        ds_out_fast["x"] = xr.DataArray(setup["trgx"], dims="lon")
+        ds_out_fast["y"] = xr.DataArray(setup["trgy"], dims="lat")
+        ds_out_fast = ds_out_fast.set_coords(["x", "y"])
+        ds_out_fast = ds_out_fast.swap_dims({"lon": "x", "lat": "y"})
+    else:
+        ds_out_fast = ds_out_fast.assign_coords(
+            lon=(("y", "x"), setup["lon"], xd.model.get_longitude_attrs()),
+            lat=(("y", "x"), setup["lat"], xd.model.get_latitude_attrs()),
+        )
     ds_out_fast.attrs = dtree.attrs
     ds_out_fast.attrs["radar_name"] = ds_out_fast.attrs.get("instrument_name", "")
+    if return_timings:
+        return ds_out_fast, timings
     return ds_out_fast
+
+
+def _grid_geocoords(ds, x, y):
+    """
+    Compute longitude and latitude of a horizontal AEQD grid.
+
+    Parameters
+    ----------
+    ds : xarray.Dataset
+        Radar sweep dataset defining the AEQD projection.
+    x, y : numpy.ndarray
+        Cartesian grid axes (meters).
+
+    Returns
+    -------
+    lon, lat : numpy.ndarray
+        Longitude and latitude with shape ``(len(y), len(x))``.
+    """
+    from pyproj import CRS, Transformer
+
+    src_crs = ds.xradar.georeference().xradar.get_crs()
+    trg_crs = CRS.from_user_input(4326)  # EPSG:4326 (WGS 84)
+    transformer = Transformer.from_crs(src_crs, trg_crs)
+    xx, yy = np.meshgrid(x, y)
+    lat, lon = transformer.transform(xx, yy)
+    return lon, lat
@@ -0,0 +1,463 @@
+#!/usr/bin/env python
+# Copyright (c) 2024-2025, radarx developers.
+# Distributed under the MIT License. See LICENSE for more info.
+
+"""
+Radarx Grid Operator
+====================
+
+This sub-module contains a reusable sparse gate-to-grid interpolation
+operator. For a fixed scan geometry the Barnes weights of every gate onto
+every grid cell are computed once and stored in a sparse matrix, so that
+each new volume is gridded with a single sparse matrix-vector product.
+
+.. autosummary::
+   :nosignatures:
+   :toctree: generated/
+
+   {}
+"""
+
+__all__ = [
+    "GridOperator",
+    "OperatorCache",
+    "build_grid_operator",
+    "get_grid_operator",
+    "load_grid_operator",
+    "operator_key",
+]
+
+__doc__ = __doc__.format("\n   ".join(__all__))
+
+import hashlib
+import itertools
+import logging
+import os
+import shutil
+import tempfile
+from collections import OrderedDict
+
+import numpy as np
+from scipy import sparse
+
+logger = logging.getLogger(__name__)
+
+_ARRAYS = ("data", "indices", "indptr", "shape", "grid_shape")
+
+
+def _barnes_weights(d2, max_dist):
+    return np.exp(-0.5 * d2)
+
+
+def _cressman_weights(d2, max_dist):
+    r2 = max_dist**2
+    return (r2 - d2) / (r2 + d2)
+
+
+def _idw_weights(d2, max_dist):
+    # inverse squared distance, bounded for gates on top of a grid cell
+    return 1.0 / np.maximum(d2, 1e-6)
+
+
+KERNELS = {
+    "barnes": _barnes_weights,
+    "cressman": _cressman_weights,
+    "idw": _idw_weights,
+}
+
+
+class GridOperator:
+    """
+    Sparse gate-to-grid interpolation operator.
+
+    Parameters
+    ----------
+    weights : scipy.sparse.csr_matrix
+        Weight matrix with shape ``(ncells, ngates)``. Row ``i`` holds the
+        weights of all gates contributing to grid cell ``i``.
+    grid_shape : tuple of int
+        Shape ``(nz, ny, nx)`` of the target grid.
+    key : str, optional
+        Geometry key the operator was built for.
+    """
+
+    def __init__(self, weights, grid_shape, key=None):
+        self.weights = sparse.csr_matrix(weights)
+        self.grid_shape = tuple(int(s) for s in grid_shape)
+        self.key = key
+
+    def __repr__(self):
+        return (
+            f"<GridOperator grid_shape={self.grid_shape} "
+            f"ngates={self.ngates} nnz={self.weights.nnz}>"
+        )
+
+    @property
+    def ngates(self):
+        """Number of gates (columns) the operator expects."""
+        return self.weights.shape[1]
+
+    def apply(self, values):
+        """
+        Interpolate gate values onto the grid.
+
+        Missing values (NaN) are excluded from the weighted average, so
+        fields with different masks can be gridded with the same operator.
+
+        Parameters
+        ----------
+        values : array-like
+            Gate values with shape ``(ngates,)`` or ``(ngates, nfields)``.
+
+        Returns
+        -------
+        numpy.ndarray
+            Gridded field with shape ``(nz, ny, nx)``, or
+            ``(nfields, nz, ny, nx)`` for two-dimensional input.
+        """
+        values = np.asarray(values)
+        if values.shape[0] != self.ngates:
+            raise ValueError(
+                f"Operator expects {self.ngates} gates, got {values.shape[0]}."
+            )
+        single = values.ndim == 1
+        values = values.reshape(self.ngates, -1)
+
+        valid = np.isfinite(values)
+        num = self.weights @ np.where(valid, values, 0).astype(np.float64)
+        den = self.weights @ valid.astype(np.float64)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            field = np.where(den > 0, num / den, np.nan)
+
+        field = field.T.reshape((-1,) + self.grid_shape)
+        return field[0] if single else field
+
+    def save(self, path):
+        """
+        Save the operator to disk.
+
+        Parameters
+        ----------
+        path : str or pathlib.Path
+            Target path. A path ending in ``.npz`` is written as a single
+            NumPy archive, any other path as a directory of ``.npy`` files
+            which can be memory-mapped by :func:`load_grid_operator`.
+        """
+        path = os.fspath(path)
+        arrays = {
+            "data": self.weights.data,
+            "indices": self.weights.indices,
+            "indptr": self.weights.indptr,
+            "shape": np.asarray(self.weights.shape),
+            "grid_shape": np.asarray(self.grid_shape),
+            "key": np.asarray(self.key or ""),
+        }
+        if path.endswith(".npz"):
+            np.savez(path, **arrays)
+            return
+
+        # write to a temporary directory first, so concurrent readers
+        # never see a partially written operator
+        parent = os.path.dirname(os.path.abspath(path))
+        os.makedirs(parent, exist_ok=True)
+        tmp = tempfile.mkdtemp(dir=parent, prefix=".tmp-operator-")
+        for name, arr in arrays.items():
+            np.save(os.path.join(tmp, f"{name}.npy"), arr)
+        try:
+            os.replace(tmp, path)
+        except OSError:  # pragma: no cover
+            # another process stored the same operator in the meantime
+            shutil.rmtree(tmp, ignore_errors=True)
+
+
+def load_grid_operator(path, mmap_mode=None):
+    """
+    Load a :class:`GridOperator` saved with :meth:`GridOperator.save`.
+
+    Parameters
+    ----------
+    path : str or pathlib.Path
+        Path to a ``.npz`` archive or an operator directory.
+    mmap_mode : {None, 'r', 'r+', 'c'}, optional
+        Memory-map the weight arrays of an operator directory, so that
+        several processes share the same pages. Ignored for ``.npz``.
+
+    Returns
+    -------
+    GridOperator
+        The loaded operator.
+    """
+    path = os.fspath(path)
+    if path.endswith(".npz"):
+        with np.load(path) as npz:
+            arrays = {name: npz[name] for name in _ARRAYS + ("key",)}
+    else:
+        arrays = {
+            name: np.load(os.path.join(path, f"{name}.npy"), mmap_mode=mmap_mode)
+            for name in _ARRAYS
+        }
+        arrays["key"] = np.load(os.path.join(path, "key.npy"))
+
+    weights = sparse.csr_matrix(
+        (arrays["data"], arrays["indices"], arrays["indptr"]),
+        shape=tuple(arrays["shape"]),
+        copy=False,
+    )
+    return GridOperator(weights, arrays["grid_shape"], key=str(arrays["key"]) or None)
+
+
+def build_grid_operator(
+    points, sigma, x0, step, size, max_dist=4, key=None, kernel="barnes"
+):
+    """
+    Build the sparse weight operator for a set of gates.
+
+    Each gate contributes to the grid cells within ``max_dist`` sigma,
+    where ``d`` is the distance scaled by ``sigma``. With the default
+    Barnes kernel the weight is ``exp(-d**2 / 2)``, the Cressman kernel
+    uses ``(R**2 - d**2) / (R**2 + d**2)`` with ``R = max_dist`` and the
+    ``'idw'`` kernel the inverse squared distance ``1 / d**2``. The
+    arguments follow the conventions of :func:`fastbarnes.interpolation.barnes`.
+
+    Parameters
+    ----------
+    points : numpy.ndarray
+        Gate coordinates with shape ``(ngates, 3)`` in (x, y, z) order.
+    sigma : array-like
+        Gaussian width in each dimension.
+    x0 : array-like
+        Coordinates of the first grid cell.
+    step : array-like
+        Grid spacing in each dimension.
+    size : array-like
+        Number of grid cells ``(nx, ny, nz)``.
+    max_dist : float, optional
+        Support radius of the weights in units of sigma. Defaults to 4.
+    key : str, optional
+        Geometry key stored with the operator.
+    kernel : {'barnes', 'cressman', 'idw'}, optional
+        Weight function of the scaled distance. Defaults to 'barnes'.
+
+    Returns
+    -------
+    GridOperator
+        The sparse interpolation operator.
+    """
+    if kernel not in KERNELS:
+        raise ValueError(
+            f"Unknown kernel {kernel!r}, expected one of {tuple(KERNELS)}."
+        )
+    weight = KERNELS[kernel]
+    points = np.asarray(points, dtype=np.float64)
+    sigma = np.asarray(sigma, dtype=np.float64)
+    x0 = np.asarray(x0, dtype=np.float64)
+    step = np.asarray(step, dtype=np.float64)
+    size = np.asarray(size, dtype=np.int64)
+
+    # fractional grid index of each gate and its nearest grid cell
+    frac = (points - x0) / step
+    base = np.rint(frac).astype(np.int64)
+    scale = step / sigma
+    half = np.floor(max_dist / scale + 0.5).astype(int)
+    gates = np.arange(len(points))
+
+    rows, cols, vals = [], [], []
+    for offset in itertools.product(*(range(-h, h + 1) for h in half)):
+        idx = base + np.asarray(offset)
+        d2 = (((idx - frac) * scale) ** 2).sum(axis=1)
+        keep = (d2 <= max_dist**2) & np.all((idx >= 0) & (idx < size), axis=1)
+        idx = idx[keep]
+        rows.append((idx[:, 2] * size[1] + idx[:, 1]) * size[0] + idx[:, 0])
+        cols.append(gates[keep])
+        vals.append(weight(d2[keep], max_dist).astype(np.float32))
+
+    ncells = int(np.prod(size))
+    weights = sparse.coo_matrix(
+        (np.concatenate(vals), (np.concatenate(rows), np.concatenate(cols))),
+        shape=(ncells, len(points)),
+    ).tocsr()
+    return GridOperator(weights, size[::-1], key=key)
+
+
+def _azimuth_bins(azimuth):
+    """
+    Number of nominal azimuth bins of a sweep and the bin of every ray.
+
+    The bin width is the mean spacing of neighbouring rays, leaving out the
+    gap of a sector scan, so that it is exact for a full circle of rays.
+    The bins are centred on the circular mean phase of the rays, so that a
+    ray stays in its bin as long as it jitters by less than half a bin.
+    """
+    azimuth = np.mod(np.asarray(azimuth, dtype=np.float64), 360.0)
+    gaps = np.diff(np.sort(azimuth), append=azimuth.min() + 360.0)
+    gaps = gaps[gaps <= 3 * np.median(gaps)] if azimuth.size > 1 else gaps[:0]
+    spacing = gaps.mean() if gaps.size else 0.0
+    nbins = int(np.rint(360.0 / spacing)) if spacing > 0 else max(azimuth.size, 1)
+    width = 360.0 / nbins
+    phase = np.angle(np.exp(2j * np.pi * azimuth / width).mean()) * width / (2 * np.pi)
+    offset = (azimuth - phase) / width
+    bins = np.mod(np.rint(offset), nbins).astype(np.int64)
+    return nbins, bins, offset - np.rint(offset)
+
+
+def _ray_order(azimuth):
+    """Permutation sorting the rays of a sweep into nominal azimuth order."""
+    _, bins, residual = _azimuth_bins(azimuth)
+    return np.lexsort((residual, bins))
+
+
+def _sort_rays(dtree):
+    """Return ``dtree`` with the rays of every sweep in nominal azimuth order."""
+    dtree = dtree.copy()
+    for swp in dtree.match("sweep_*"):
+        ds = dtree[swp].to_dataset(inherit=False)
+        order = _ray_order(ds["azimuth"].values)
+        if np.any(order != np.arange(order.size)):
+            dtree[swp] = ds.isel(azimuth=order)
+    return dtree
+
+
+def operator_key(dtree, **grid_kwargs):
+    """
+    Compute the scan strategy key of a radar DataTree.
+
+    The key combines the site location, the fixed angle, ray count,
+    azimuth resolution and range gates of every sweep and the given grid
+    arguments. The ray angles themselves do not enter the key, as they
+    jitter from volume to volume. Instead, the rays are sorted into nominal
+    azimuth order before gridding with a cached operator, so that volumes
+    of the same scan strategy share it whatever azimuth their sweeps start
+    at.
+
+    Parameters
+    ----------
+    dtree : xarray.DataTree
+        Input radar DataTree containing radar sweeps.
+    **grid_kwargs : dict
+        Grid arguments (e.g. ``x_lim``, ``x_step``, ``x_smth``) which
+        define the target grid and the interpolation weights.
+
+    Returns
+    -------
+    str
+        Hexadecimal digest identifying the scan strategy.
+    """
+    sweeps = list(dtree.match("sweep_*"))
+    ds0 = dtree[sweeps[0]].to_dataset()
+    site = [
+        round(float(ds0[c].values), 6) for c in ("latitude", "longitude", "altitude")
+    ]
+    geometry = []
+    for swp in sweeps:
+        ds = dtree[swp].to_dataset()
+        rng = ds["range"].values
+        nbins, _, _ = _azimuth_bins(ds["azimuth"].values)
+        geometry.append(
+            (
+                round(float(ds["sweep_fixed_angle"].values), 2),
+                ds.sizes["azimuth"],
+                nbins,
+                rng.size,
+                round(float(rng[0]), 2),
+                round(float(np.diff(rng).mean()), 2) if rng.size > 1 else 0.0,
+            )
+        )
+    grid = sorted((k, repr(v)) for k, v in grid_kwargs.items())
+    token = repr((site, geometry, grid)).encode("utf-8")
+    return hashlib.sha1(token).hexdigest()
+
+
+class OperatorCache:
+    """
+    In-memory LRU cache of :class:`GridOperator` objects.
+
+    Parameters
+    ----------
+    maxsize : int, optional
+        Maximum number of operators kept in memory. Defaults to 8.
+    cache_dir : str or pathlib.Path, optional
+        Directory where operators are persisted, so that they can be
+        shared with other processes. Defaults to None (memory only).
+    """
+
+    def __init__(self, maxsize=8, cache_dir=None):
+        self.maxsize = maxsize
+        self.cache_dir = cache_dir
+        self._operators = OrderedDict()
+
+    def __len__(self):
+        return len(self._operators)
+
+    def __contains__(self, key):
+        return key in self._operators
+
+    def get(self, key, builder=None):
+        """
+        Return the operator for ``key``, building it on a cache miss.
+
+        Parameters
+        ----------
+        key : str
+            Geometry key as returned by :func:`operator_key`.
+        builder : callable, optional
+            Function without arguments returning a new :class:`GridOperator`.
+            If None, a cache miss returns None.
+
+        Returns
+        -------
+        GridOperator or None
+        """
+        if key in self._operators:
+            self._operators.move_to_end(key)
+            return self._operators[key]
+
+        op = None
+        path = os.path.join(self.cache_dir, key) if self.cache_dir else None
+        if path is not None and os.path.isdir(path):
+            logger.info(f"Loading grid operator {key} from {self.cache_dir}.")
+            op = load_grid_operator(path, mmap_mode="r")
+        elif builder is not None:
+            logger.info(f"Building grid operator {key}.")
+            op = builder()
+            op.key = key
+            if path is not None:
+                op.save(path)
+
+        if op is not None:
+            self.put(key, op)
+        return op
+
+    def put(self, key, op):
+        """Insert an operator, evicting the least recently used one."""
+        self._operators[key] = op
+        self._operators.move_to_end(key)
+        while len(self._operators) > self.maxsize:
+            self._operators.popitem(last=False)
+
+    def clear(self):
+        """Remove all operators from memory."""
+        self._operators.clear()
+
+
+_OPERATOR_CACHE = OperatorCache()
+
+
+def get_grid_operator(key, builder=None, cache=None):
+    """
+    Fetch a grid operator from the process-wide (or a given) cache.
+
+    Parameters
+    ----------
+    key : str
+        Geometry key as returned by :func:`operator_key`.
+    builder : callable, optional
+        Function without arguments returning a new :class:`GridOperator`.
+    cache : OperatorCache, optional
+        Cache to use. Defaults to the process-wide cache.
+
+    Returns
+    -------
+    GridOperator or None
+    """
+    cache = _OPERATOR_CACHE if cache is None else cache
+    return cache.get(key, builder)
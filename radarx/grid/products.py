@@ -0,0 +1,184 @@
+#!/usr/bin/env python
+# Copyright (c) 2024-2025, radarx developers.
+# Distributed under the MIT License. See LICENSE for more info.
+
+"""
+Radarx 2-D Products
+===================
+
+This sub-module contains horizontal products computed straight from the
+polar gates, without building the 3-D grid. Every gate is mapped onto the
+horizontal grid cell it falls into and the gates of each cell are reduced
+with a sorted-segment reduction.
+
+=========  ============================================================
+Product    Description
+=========  ============================================================
+``max``    Column maximum (MAX-CAPPI).
+``mean``   Column mean.
+``cappi``  Gate nearest to a constant altitude (CAPPI).
+``lowest`` Lowest valid gate of each column.
+=========  ============================================================
+
+.. autosummary::
+   :nosignatures:
+   :toctree: generated/
+
+   {}
+"""
+
+__all__ = [
+    "grid_product",
+]
+
+__doc__ = __doc__.format("\n   ".join(__all__))
+
+import logging
+
+import numpy as np
+import xarray as xr
+import xradar as xd
+
+from .grid import _grid_geocoords, make_3d_grid, stack_data
+
+logger = logging.getLogger(__name__)
+
+PRODUCTS = ("max", "mean", "cappi", "lowest")
+
+
+def _segment_select(cell, values, key, ncells, last=False):
+    """
+    Select one value per cell, the one with the smallest (or largest) key.
+
+    Gates are sorted by (cell, key), so every cell forms a contiguous
+    segment whose first (or last) element is selected.
+    """
+    field = np.full(ncells, np.nan)
+    if not cell.size:
+        return field
+    order = np.lexsort((key, cell))
+    cell = cell[order]
+    if last:
+        sel = np.append(cell[1:] != cell[:-1], True)
+    else:
+        sel = np.insert(cell[1:] != cell[:-1], 0, True)
+    field[cell[sel]] = values[order][sel]
+    return field
+
+
+def grid_product(
+    dtree,
+    data_vars=None,
+    product="max",
+    x_lim=(-100e3, 100e3),
+    y_lim=(-100e3, 100e3),
+    x_step=500,
+    y_step=500,
+    height=None,
+    max_dz=None,
+):
+    """
+    Compute a 2-D product on a horizontal grid straight from polar gates.
+
+    Parameters
+    ----------
+    dtree : xradar.DataTree
+        Input radar DataTree containing radar sweeps.
+    data_vars : list of str, optional
+        List of variables to grid. If None, all variables in the dataset
+        are used. Defaults to None.
+    product : {'max', 'mean', 'cappi', 'lowest'}, optional
+        Reduction over the gates of each column. Defaults to 'max'.
+    x_lim : tuple of float, optional
+        Range of x-coordinates (meters) for the Cartesian grid. Defaults to
+        (-100e3, 100e3).
+    y_lim : tuple of float, optional
+        Range of y-coordinates (meters) for the Cartesian grid. Defaults to
+        (-100e3, 100e3).
+    x_step : int, optional
+        Grid resolution in the x-direction (meters). Defaults to 500.
+    y_step : int, optional
+        Grid resolution in the y-direction (meters). Defaults to 500.
+    height : float, optional
+        Altitude (meters) of the 'cappi' product. Required for 'cappi'.
+    max_dz : float, optional
+        Maximum vertical distance (meters) between a 'cappi' gate and
+        ``height``. Defaults to None (no limit).
+
+    Returns
+    -------
+    xarray.Dataset
+        Product on the native AEQD grid with dimensions ``(y, x)`` and 2-D
+        ``lon``/``lat`` coordinates.
+
+    Notes
+    -----
+    Gates are binned, not interpolated, so at long range, where the beams
+    are farther apart than the grid resolution, cells without any gate
+    remain missing.
+    """
+    if product not in PRODUCTS:
+        raise ValueError(f"Unknown product {product!r}, expected one of {PRODUCTS}.")
+    if product == "cappi" and height is None:
+        raise ValueError("A `height` is required for the 'cappi' product.")
+
+    zlim = (-np.inf, np.inf)
+    if product == "cappi" and max_dz is not None:
+        zlim = (height - max_dz, height + max_dz)
+    bounds = (
+        (x_lim[0] - x_step / 2, x_lim[1] + x_step / 2),
+        (y_lim[0] - y_step / 2, y_lim[1] + y_step / 2),
+        zlim,
+    )
+    ds = stack_data(
+        dtree, data_vars=data_vars, geo=False, multiindex=False, bounds=bounds
+    )
+    if data_vars is None:  # pragma: no cover
+        data_vars = list(ds.data_vars)
+
+    ds0 = dtree["sweep_0"].to_dataset()
+    _, _, x, y, _, _ = make_3d_grid(
+        ds0, x_lim=x_lim, y_lim=y_lim, x_step=x_step, y_step=y_step
+    )
+    nx, ny = len(x), len(y)
+
+    # flat (y, x) index of the cell every gate falls into
+    xyz = ds["xyz"].values
+    ix = np.rint((xyz[:, 0] - x[0]) / x_step).astype(np.int64)
+    iy = np.rint((xyz[:, 1] - y[0]) / y_step).astype(np.int64)
+    inside = (ix >= 0) & (ix < nx) & (iy >= 0) & (iy < ny)
+    if product == "cappi" and max_dz is not None:
+        inside &= np.abs(xyz[:, 2] - height) <= max_dz
+    cell = iy * nx + ix
+    gate_z = xyz[:, 2].astype(np.float64)
+
+    ds_out = xr.Dataset(coords={"y": ("y", y), "x": ("x", x)})
+    for var in data_vars:
+        values = ds[var].values.astype(np.float64)
+        keep = inside & np.isfinite(values)
+        c, v, h = cell[keep], values[keep], gate_z[keep]
+        if product == "max":
+            field = _segment_select(c, v, v, nx * ny, last=True)
+        elif product == "mean":
+            count = np.bincount(c, minlength=nx * ny)
+            with np.errstate(invalid="ignore", divide="ignore"):
+                field = np.bincount(c, weights=v, minlength=nx * ny) / count
+        elif product == "cappi":
+            field = _segment_select(c, v, np.abs(h - height), nx * ny)
+        else:
+            field = _segment_select(c, v, h, nx * ny)
+        ds_out[var] = (("y", "x"), field.reshape(ny, nx))
+        logger.info(f"Computed {product} of {var} from {keep.sum()} gates.")
+
+    lon2d, lat2d = _grid_geocoords(ds0, x, y)
+    ds_out = ds_out.assign_coords(
+        lon=(("y", "x"), lon2d, xd.model.get_longitude_attrs()),
+        lat=(("y", "x"), lat2d, xd.model.get_latitude_attrs()),
+    )
+    ds_out["time"] = ds.time
+    ds_out.attrs = dict(dtree.attrs)
+    ds_out.attrs["radar_name"] = ds_out.attrs.get("instrument_name", "")
+    ds_out.attrs["product"] = product
+    if height is not None:
+        ds_out.attrs["product_height"] = height
+    return ds_out
@@ -0,0 +1,392 @@
+#!/usr/bin/env python
+# Copyright (c) 2024-2025, radarx developers.
+# Distributed under the MIT License. See LICENSE for more info.
+
+"""
+Radarx Tiled Gridding
+=====================
+
+This sub-module contains a tiled variant of :func:`~radarx.grid.grid_radar`
+for large, high-resolution domains. The horizontal domain is split into
+tiles which are gridded independently, so that only one tile of the
+``(z, y, x)`` cube has to be held in memory at a time.
+
+.. autosummary::
+   :nosignatures:
+   :toctree: generated/
+
+   {}
+"""
+
+__all__ = [
+    "grid_radar_tiled",
+    "tile_slices",
+]
+
+__doc__ = __doc__.format("\n   ".join(__all__))
+
+import logging
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import xarray as xr
+import xradar as xd
+
+from .engines import FASTBARNES_AVAILABLE, get_engine, grid_fields
+from .fill import fill_vertical
+from .grid import _grid_geocoords, make_3d_grid, stack_data
+
+if FASTBARNES_AVAILABLE:  # pragma: no cover
+    from fastbarnes.interpolation import get_half_kernel_size
+
+logger = logging.getLogger(__name__)
+
+
+def tile_slices(nx, ny, tile_size):
+    """
+    Split a horizontal grid into tiles.
+
+    Parameters
+    ----------
+    nx, ny : int
+        Number of grid cells in x and y.
+    tile_size : int or tuple of int
+        Tile size ``(tx, ty)`` in grid cells.
+
+    Returns
+    -------
+    list of tuple of slice
+        ``(yslice, xslice)`` of every tile, row by row.
+    """
+    tx, ty = np.broadcast_to(tile_size, 2)
+    return [
+        (slice(j, min(j + ty, ny)), slice(i, min(i + tx, nx)))
+        for j in range(0, ny, ty)
+        for i in range(0, nx, tx)
+    ]
+
+
+def _tile_overlap(method, sigma, step, max_dist):
+    """Overlap (cells) in x and y needed for seamless tiles."""
+    if method == "barnes" and FASTBARNES_AVAILABLE:  # pragma: no cover
+        half = get_half_kernel_size(sigma, step, num_iter=4)
+    else:
+        half = np.ceil(max_dist * np.asarray(sigma) / np.asarray(step))
+    return int(half[0]), int(half[1])
+
+
+def _grid_tile(
+    points,
+    fields,
+    sigma,
+    x0,
+    step,
+    size,
+    crop,
+    z,
+    method,
+    engine_kwargs,
+    pseudo_cappi,
+    fill_method,
+    fill_max_depth,
+):
+    """Grid the gates of one tile and crop the overlap."""
+    gridded, _ = grid_fields(
+        points, fields, sigma, x0, step, size, method=method, **engine_kwargs
+    )
+    shape = (size[2], size[1], size[0])
+    result = {}
+    for var in fields:
+        field = gridded.get(var)
+        if field is None:
+            field = np.full(shape, np.nan)
+        field = np.ascontiguousarray(field[(slice(None),) + crop])
+        if pseudo_cappi:
+            fill_vertical(
+                field[:-1], z[:-1], method=fill_method, max_depth=fill_max_depth
+            )
+        result[var] = field
+    return result
+
+
+def _tile_args(points, values, ys, xs, grid):
+    """
+    Select the gates of a tile and return the arguments of `_grid_tile`.
+
+    The tile is extended by the overlap, clipped to the domain, and the
+    gates within the kernel margin of the extended tile are selected.
+    """
+    x, y, z = grid["x"], grid["y"], grid["z"]
+    ox, oy = grid["overlap"]
+    margin = grid["margin"]
+    i0, i1 = max(xs.start - ox, 0), min(xs.stop + ox, len(x))
+    j0, j1 = max(ys.start - oy, 0), min(ys.stop + oy, len(y))
+    x0 = np.array([x[i0], y[j0], z[0]], dtype=np.float64)
+    size = (i1 - i0, j1 - j0, len(z))
+    lo = x0 - margin
+    hi = np.array([x[i1 - 1], y[j1 - 1], z[-1]]) + margin
+    keep = np.all((points >= lo) & (points <= hi), axis=1)
+    crop = (
+        slice(ys.start - j0, ys.stop - j0),
+        slice(xs.start - i0, xs.stop - i0),
+    )
+    return (
+        points[keep],
+        {var: v[keep] for var, v in values.items()},
+        grid["sigma"],
+        x0,
+        grid["step"],
+        size,
+        crop,
+        z,
+        grid["method"],
+        grid["engine_kwargs"],
+        grid["pseudo_cappi"],
+        grid["fill_method"],
+        grid["fill_max_depth"],
+    )
+
+
+def _grid_region(points, values, ys, xs, grid):
+    """Select the gates of a tile and grid them, as run by the tasks."""
+    return _grid_tile(*_tile_args(points, values, ys, xs, grid))
+
+
+def grid_radar_tiled(
+    dtree,
+    data_vars=None,
+    pseudo_cappi=True,
+    x_lim=(-100e3, 100e3),
+    y_lim=(-100e3, 100e3),
+    z_lim=(0, 10e3),
+    x_step=1000,
+    y_step=1000,
+    z_step=250,
+    x_smth=0.2,
+    y_smth=0.2,
+    z_smth=1,
+    tile_size=200,
+    store=None,
+    max_workers=None,
+    fill_method="nearest_above",
+    fill_max_depth=None,
+    method="barnes",
+    engine_kwargs=None,
+):
+    """
+    Interpolate radar data to a 3D grid tile by tile.
+
+    Gridding is done on the radar's native AEQD x/y/z grid, as
+    ``grid_radar(..., geo=False)``. The horizontal domain is split into
+    tiles of ``tile_size`` cells, each extended by the kernel half-size on
+    every side, so that the cropped tiles are seamless at their borders.
+
+    Parameters
+    ----------
+    dtree : xradar.DataTree
+        Input radar DataTree containing radar sweeps.
+    data_vars : list of str, optional
+        List of variables to interpolate. If None, all variables in the dataset
+        are used. Defaults to None.
+    pseudo_cappi : bool, optional
+        If True, extrapolates data to lower altitudes to create a pseudo-CAPPI.
+        Defaults to True.
+    x_lim, y_lim, z_lim : tuple of float, optional
+        Range of the Cartesian grid coordinates (meters). Default to
+        (-100e3, 100e3), (-100e3, 100e3) and (0, 10e3), as in
+        :func:`~radarx.grid.grid_radar`.
+    x_step, y_step, z_step : int, optional
+        Grid resolution (meters). Default to 1000, 1000 and 250.
+    x_smth, y_smth, z_smth : float, optional
+        Smoothing factors in units of the grid resolution.
+    tile_size : int or tuple of int, optional
+        Tile size ``(tx, ty)`` in grid cells. Defaults to 200.
+    store : str or MutableMapping, optional
+        Zarr store the tiles are written to as soon as they are gridded.
+        Requires ``dask`` and ``zarr``. If None (default), a lazy
+        dask-backed Dataset with one chunk per tile is returned instead.
+    max_workers : int, optional
+        Number of worker processes gridding tiles concurrently when writing
+        to ``store``. Defaults to None (serial). With a lazy result, use the
+        scheduler of :meth:`xarray.Dataset.compute` instead.
+    fill_method : {'nearest_above', 'lowest_valid'}, optional
+        Vertical fill strategy of the pseudo-CAPPI.
+    fill_max_depth : float, optional
+        Maximum depth (meters) filled below a valid echo in the pseudo-CAPPI.
+    method : str, optional
+        Gridding engine, see :mod:`radarx.grid.engines`. Defaults to 'barnes'.
+    engine_kwargs : dict, optional
+        Keyword arguments passed to the engine.
+
+    Returns
+    -------
+    xarray.Dataset
+        Gridded dataset with dimensions ``(z, y, x)`` and 2-D ``lon``/``lat``
+        coordinates, chunked by tile.
+    """
+    try:
+        import dask
+        import dask.array as da
+    except ImportError:  # pragma: no cover
+        raise ImportError(
+            "The 'dask' package is required for tiled gridding. "
+            "Install it via 'pip install dask'."
+        ) from None
+
+    get_engine(method)
+    engine_kwargs = dict(engine_kwargs or {})
+    max_dist = engine_kwargs.get("max_dist", 4)
+
+    ds0 = dtree["sweep_0"].to_dataset()
+    _, _, x, y, z, _ = make_3d_grid(
+        ds0,
+        x_lim=x_lim,
+        y_lim=y_lim,
+        x_step=x_step,
+        y_step=y_step,
+        z_lim=z_lim,
+        z_step=z_step,
+    )
+    step = np.array([x_step, y_step, z_step], dtype=np.float64)
+    sigma = np.array([x_smth, y_smth, z_smth]) * step
+    margin = max_dist * sigma
+    bounds = tuple(
+        (lim[0] - m, lim[1] + m) for lim, m in zip((x_lim, y_lim, z_lim), margin)
+    )
+
+    # Gates are stacked once and shared by all tiles
+    ds = stack_data(
+        dtree, data_vars=data_vars, geo=False, multiindex=False, bounds=bounds
+    )
+    if data_vars is None:  # pragma: no cover
+        data_vars = list(ds.data_vars)
+    points = ds["xyz"].values
+    values = {var: ds[var].values for var in data_vars}
+
+    ox, oy = _tile_overlap(method, sigma, step, max_dist)
+    logger.info(f"Gridding {len(x)} x {len(y)} cells in tiles, overlap {ox}, {oy}.")
+
+    grid = {
+        "x": x,
+        "y": y,
+        "z": z,
+        "overlap": (ox, oy),
+        "margin": margin,
+        "sigma": sigma,
+        "step": step,
+        "method": method,
+        "engine_kwargs": engine_kwargs,
+        "pseudo_cappi": pseudo_cappi,
+        "fill_method": fill_method,
+        "fill_max_depth": fill_max_depth,
+    }
+
+    tiles = tile_slices(len(x), len(y), tile_size)
+    lon2d, lat2d = _grid_geocoords(ds0, x, y)
+    coords = {
+        "z": ("z", z),
+        "y": ("y", y),
+        "x": ("x", x),
+        "lon": (("y", "x"), lon2d, xd.model.get_longitude_attrs()),
+        "lat": (("y", "x"), lat2d, xd.model.get_latitude_attrs()),
+    }
+    tx, ty = np.broadcast_to(tile_size, 2)
+    chunks = (len(z), int(ty), int(tx))
+
+    if store is None:
+        # one delayed task per tile, shared by all variables
+        ncols = len(range(0, len(x), int(tx)))
+        # the gates enter the graph once, each task selects its own
+        points_key = dask.delayed(points, pure=True)
+        values_key = dask.delayed(values, pure=True)
+        delayed = [
+            dask.delayed(_grid_region, pure=True)(points_key, values_key, ys, xs, grid)
+            for ys, xs in tiles
+        ]
+        data = {}
+        for var in data_vars:
+            blocks = [
+                da.from_delayed(
+                    task[var],
+                    shape=(len(z), ys.stop - ys.start, xs.stop - xs.start),
+                    dtype=np.float64,
+                )
+                for task, (ys, xs) in zip(delayed, tiles)
+            ]
+            rows = [blocks[i : i + ncols] for i in range(0, len(blocks), ncols)]
+            data[var] = (("z", "y", "x"), da.block(rows))
+        ds_out = xr.Dataset(data, coords=coords)
+    else:
+        ds_out = _write_tiles(
+            store,
+            tiles,
+            points,
+            values,
+            grid,
+            data_vars,
+            coords,
+            chunks,
+            max_workers,
+        )
+
+    ds_out["time"] = ds.time
+    ds_out.attrs = dtree.attrs
+    ds_out.attrs["radar_name"] = ds_out.attrs.get("instrument_name", "")
+    return ds_out
+
+
+def _write_tiles(
+    store, tiles, points, values, grid, data_vars, coords, chunks, max_workers
+):
+    """Grid tiles and write each into its region of a Zarr store."""
+    import dask.array as da
+
+    try:
+        import zarr  # noqa
+    except ImportError:  # pragma: no cover
+        raise ImportError(
+            "The 'zarr' package is required to write tiles to a store. "
+            "Install it via 'pip install zarr'."
+        ) from None
+
+    shape = tuple(len(coords[dim][1]) for dim in ("z", "y", "x"))
+    template = xr.Dataset(
+        {
+            var: (("z", "y", "x"), da.full(shape, np.nan, chunks=chunks))
+            for var in data_vars
+        },
+        coords=coords,
+    )
+    template.to_zarr(store, compute=False, mode="w")
+
+    def write(ys, xs, result):
+        region = xr.Dataset({var: (("z", "y", "x"), result[var]) for var in data_vars})
+        region.to_zarr(store, region={"z": slice(None), "y": ys, "x": xs})
+        logger.info(f"Wrote tile y={ys.start}:{ys.stop}, x={xs.start}:{xs.stop}.")
+
+    if max_workers is None:
+        for ys, xs in tiles:
+            write(ys, xs, _grid_region(points, values, ys, xs, grid))
+    else:
+        # keep at most two tiles per worker in flight to bound memory
+        pending = deque()
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            for ys, xs in tiles:
+                pending.append(
+                    (
+                        ys,
+                        xs,
+                        executor.submit(
+                            _grid_tile, *_tile_args(points, values, ys, xs, grid)
+                        ),
+                    )
+                )
+                if len(pending) >= 2 * max_workers:
+                    ys, xs, future = pending.popleft()
+                    write(ys, xs, future.result())
+            while pending:
+                ys, xs, future = pending.popleft()
+                write(ys, xs, future.result())
+
+    return xr.open_zarr(store)
@@ -11,9 +11,15 @@ Radarx IO
 
 .. automodule:: radarx.io.imd
 .. automodule:: radarx.io.aws_data
+.. automodule:: radarx.io.catalog
+.. automodule:: radarx.io.watch
+.. automodule:: radarx.io.cache
 """
 
 from .imd import *  # noqa
 from .aws_data import *  # noqa
+from .catalog import *  # noqa
+from .watch import *  # noqa
+from .cache import *  # noqa
 
 __all__ = [s for s in dir() if not s.startswith("_")]
@@ -27,13 +27,38 @@ Usage Examples
        files = list_available_files('noaa-nexrad-level2', '2016/10/06/KAMX/')
        print(files)
 
-2. Download a file::
+2. List files under many prefixes concurrently::
+
+       from radarx.io.aws_data import list_prefixes
+       prefixes = [f'2016/10/{{day:02d}}/KAMX/' for day in range(1, 32)]
+       files = list_prefixes('noaa-nexrad-level2', prefixes)
+
+3. Download a file::
 
        from radarx.io.aws_data import download_file
        file_path = download_file('noaa-nexrad-level2',
            '2016/10/06/KAMX/KAMX20161006_170414_V06', './downloads')
        print('File downloaded to', file_path)
 
+4. Download many files concurrently::
+
+       from radarx.io.aws_data import download_files
+       paths = download_files('noaa-nexrad-level2', files, './downloads')
+
+5. Download through a local cache shared by several workers::
+
+       from radarx.io import DownloadCache, download_files
+       cache = DownloadCache('/scratch/radarx', max_size=20 * 2**30)
+       paths = download_files('noaa-nexrad-level2', files, cache=cache)
+
+6. Read a file straight from S3, without writing it to disk::
+
+       import xradar as xd
+       from radarx.io.aws_data import open_remote
+       dtree = open_remote('noaa-nexrad-level2',
+           '2016/10/06/KAMX/KAMX20161006_170414_V06',
+           reader=xd.io.open_nexradlevel2_datatree)
+
 This sub-module contains functions necessary to grid the radar data.
 
 .. autosummary::
@@ -45,15 +70,27 @@ This sub-module contains functions necessary to grid the radar data.
 
 __all__ = [
     "get_s3_client",
+    "clear_s3_clients",
     "list_available_files",
+    "list_prefixes",
     "download_file",
+    "download_files",
+    "open_remote",
 ]
 
 __doc__ = __doc__.format("\n   ".join(__all__))
 
+import io
+import logging
+import mmap
+import os
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
 import boto3
 import botocore
-import os
 
 # AWS Buckets for different radar data
 AWS_BUCKETS = {
@@ -63,15 +100,49 @@ AWS_BUCKETS = {
     "MRMS": "noaa-mrms-pds",
 }
 
+# Default connection pool size of the cached S3 clients
+S3_MAX_POOL_CONNECTIONS = 10
+
+logger = logging.getLogger(__name__)
+
+_CLIENTS = {}
+_CLIENTS_LOCK = threading.Lock()
 
-def get_s3_client(anonymous=True):
+# Errors worth retrying, client errors (e.g. a missing key) are not
+_RETRY_ERRORS = (
+    botocore.exceptions.EndpointConnectionError,
+    botocore.exceptions.ConnectionClosedError,
+    botocore.exceptions.ReadTimeoutError,
+    botocore.exceptions.ResponseStreamingError,
+    botocore.exceptions.IncompleteReadError,
+    ConnectionError,
+    TimeoutError,
+)
+
+
+def get_s3_client(
+    anonymous=True, region=None, endpoint_url=None, max_pool_connections=None
+):
     """
-    Create an S3 client.
+    Return a shared S3 client.
+
+    Clients are cached per process and reused for the same ``anonymous``,
+    ``region`` and ``endpoint_url``, so that credentials, endpoints and
+    connections are set up once. Clients are thread-safe and can be shared
+    by all threads.
 
     Parameters
     ----------
     anonymous : bool, optional
         If True, creates an anonymous S3 client. Default is True.
+    region : str, optional
+        AWS region of the client. Defaults to the boto3 configuration.
+    endpoint_url : str, optional
+        URL of an S3 compatible endpoint. Defaults to AWS S3.
+    max_pool_connections : int, optional
+        Minimum size of the connection pool of the client. A cached client
+        with a smaller pool is replaced. Defaults to
+        ``S3_MAX_POOL_CONNECTIONS``.
 
     Returns
     -------
@@ -88,20 +159,41 @@ def get_s3_client(anonymous=True):
 
         >>> s3 = get_s3_client(anonymous=False)
     """
-    if anonymous:
-        session = boto3.session.Session()
-        return session.client(
-            service_name="s3",
-            config=botocore.client.Config(signature_version=botocore.UNSIGNED),
-        )
-    else:
-        return boto3.client("s3")  # pragma: no cover
-
-
-def list_available_files(bucket, prefix, anonymous=True):
+    pool = max(max_pool_connections or 0, S3_MAX_POOL_CONNECTIONS)
+    # clients must not be shared with forked processes
+    key = (os.getpid(), bool(anonymous), region, endpoint_url)
+    with _CLIENTS_LOCK:
+        cached = _CLIENTS.get(key)
+        if cached is None or cached[1] < pool:
+            config = botocore.client.Config(max_pool_connections=pool)
+            if anonymous:
+                config = config.merge(
+                    botocore.client.Config(signature_version=botocore.UNSIGNED)
+                )
+            session = boto3.session.Session()
+            client = session.client(
+                service_name="s3",
+                region_name=region,
+                endpoint_url=endpoint_url,
+                config=config,
+            )
+            cached = _CLIENTS[key] = (client, pool)
+        return cached[0]
+
+
+def clear_s3_clients():
+    """Drop all cached S3 clients, see :func:`get_s3_client`."""
+    with _CLIENTS_LOCK:
+        _CLIENTS.clear()
+
+
+def list_available_files(bucket, prefix, anonymous=True, client=None):
     """
     List files in an S3 bucket with the given prefix.
 
+    All keys are listed, following the continuation tokens of the
+    ``list_objects_v2`` pages of at most 1000 keys.
+
     Parameters
     ----------
     bucket : str
@@ -110,6 +202,8 @@ def list_available_files(bucket, prefix, anonymous=True):
         Prefix path in the bucket to search for files.
     anonymous : bool, optional
         If True, uses anonymous access. Default is True.
+    client : botocore.client.S3, optional
+        S3 client to use. Defaults to a new client, see :func:`get_s3_client`.
 
     Returns
     -------
@@ -130,17 +224,67 @@ def list_available_files(bucket, prefix, anonymous=True):
             "CONUS/ReflectivityAtLowestAltitude_00.50/")
         >>> print(files)
     """
-    s3 = get_s3_client(anonymous=anonymous)
-    try:  # pragma: no cover
-        response = s3.list_objects_v2(Bucket=bucket, Prefix=prefix)
-        files = [item["Key"] for item in response.get("Contents", [])]
+    s3 = client or get_s3_client(anonymous=anonymous)
+    try:
+        paginator = s3.get_paginator("list_objects_v2")
+        files = []
+        for page in paginator.paginate(Bucket=bucket, Prefix=prefix):
+            files.extend(item["Key"] for item in page.get("Contents", []))
         return files
-    except botocore.exceptions.ClientError as e:  # pragma: no cover
-        print(f"Failed to list files: {e}")  # pragma: no cover
-        return []  # pragma: no cover
+    except botocore.exceptions.ClientError as e:
+        print(f"Failed to list files: {e}")
+        return []
 
 
-def download_file(bucket, file_key, save_dir, anonymous=True):
+def list_prefixes(bucket, prefixes, anonymous=True, max_workers=8, client=None):
+    """
+    List files in an S3 bucket under many prefixes concurrently.
+
+    Every prefix is listed with :func:`list_available_files` on a thread
+    pool sharing one S3 client, e.g. to list all days of a month for many
+    radar sites.
+
+    Parameters
+    ----------
+    bucket : str
+        Name of the AWS S3 bucket.
+    prefixes : list of str
+        Prefix paths in the bucket to search for files.
+    anonymous : bool, optional
+        If True, uses anonymous access. Default is True.
+    max_workers : int, optional
+        Number of prefixes listed concurrently. Default is 8.
+    client : botocore.client.S3, optional
+        S3 client to use. Defaults to a new client, see :func:`get_s3_client`.
+
+    Returns
+    -------
+    list
+        File paths of all prefixes, in the order of the prefixes, without
+        duplicates.
+
+    Examples
+    --------
+    List a month of NEXRAD Level II files of two sites:
+
+        >>> prefixes = [
+        ...     f"2016/10/{day:02d}/{site}/"
+        ...     for site in ("KAMX", "KBYX")
+        ...     for day in range(1, 32)
+        ... ]
+        >>> files = list_prefixes("noaa-nexrad-level2", prefixes)
+    """
+    s3 = client or get_s3_client(anonymous=anonymous, max_pool_connections=max_workers)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        listings = executor.map(
+            lambda prefix: list_available_files(bucket, prefix, client=s3),
+            prefixes,
+        )
+        files = [key for listing in listings for key in listing]
+    return list(dict.fromkeys(files))
+
+
+def download_file(bucket, file_key, save_dir=None, anonymous=True, cache=None):
     """
     Download a file from S3.
 
@@ -150,15 +294,18 @@ def download_file(bucket, file_key, save_dir, anonymous=True):
         Name of the AWS S3 bucket.
     file_key : str
         Key of the file to download.
-    save_dir : str
-        Directory to save the downloaded file.
+    save_dir : str, optional
+        Directory to save the downloaded file. Required without ``cache``.
     anonymous : bool, optional
         If True, uses anonymous access. Default is True.
+    cache : radarx.io.DownloadCache, optional
+        Cache to serve the file from, or to download it into on a miss.
+        ``save_dir`` is ignored. Default is None.
 
     Returns
     -------
     str
-        Path to the downloaded file.
+        Path to the downloaded (or cached) file.
 
     Examples
     --------
@@ -181,13 +328,352 @@ def download_file(bucket, file_key, save_dir, anonymous=True):
         ... )
         >>> print(f"File downloaded to: {file_path}")
     """
+    if cache is None and save_dir is None:
+        raise ValueError("Either a `save_dir` or a `cache` is required.")
     s3 = get_s3_client(anonymous=anonymous)
-    os.makedirs(save_dir, exist_ok=True)
-    local_file = os.path.join(save_dir, os.path.basename(file_key))
     try:
+        if cache is not None:
+            return cache.fetch(bucket, file_key, client=s3)
+        os.makedirs(save_dir, exist_ok=True)
+        local_file = os.path.join(save_dir, os.path.basename(file_key))
         s3.download_file(bucket, file_key, local_file)
         print(f"Downloaded: {local_file}")  # pragma: no cover
         return local_file  # pragma: no cover
     except botocore.exceptions.ClientError as e:
         print(f"Failed to download {file_key}: {e}")
         return None
+
+
+def _is_retryable(err):
+    """Whether a failed request should be retried."""
+    if isinstance(err, botocore.exceptions.ClientError):
+        status = err.response.get("ResponseMetadata", {}).get("HTTPStatusCode", 0)
+        code = err.response.get("Error", {}).get("Code", "")
+        return status >= 500 or code in ("SlowDown", "RequestTimeout", "Throttling")
+    return isinstance(err, _RETRY_ERRORS)
+
+
+def _with_retries(func, retries, backoff):
+    """Call ``func``, retrying transient errors with exponential backoff."""
+    for attempt in range(retries + 1):
+        try:
+            return func()
+        except Exception as err:
+            if attempt == retries or not _is_retryable(err):
+                raise
+            delay = backoff * 2**attempt
+            logger.info(f"Retrying in {delay:.1f} s after {err!r}")
+            time.sleep(delay)
+
+
+def _head_object(s3, bucket, key, retries, backoff):
+    """Request the metadata of an object, with retries."""
+    return _with_retries(
+        lambda: s3.head_object(Bucket=bucket, Key=key), retries, backoff
+    )
+
+
+def _fetch_ranges(
+    s3, bucket, key, f, done, total, chunk_size, retries, backoff, progress, etag=None
+):
+    """
+    Write the bytes ``done`` to ``total`` of an object to ``f`` in ranged parts.
+
+    With an ``etag``, every part is requested with ``IfMatch``, so that S3
+    answers 412 instead of mixing in the bytes of a changed object.
+    """
+    conditions = {} if etag is None else {"IfMatch": etag}
+    while done < total:
+        end = min(done + chunk_size, total) - 1
+
+        def fetch(start=done, end=end):
+            response = s3.get_object(
+                Bucket=bucket, Key=key, Range=f"bytes={start}-{end}", **conditions
+            )
+            return response["Body"].read()
+
+        data = _with_retries(fetch, retries, backoff)
+        f.write(data)
+        f.flush()
+        done += len(data)
+        if progress is not None:
+            progress(key, done, total)
+
+
+def _is_precondition_failed(err):
+    """Whether a request failed because the object no longer matches."""
+    if not isinstance(err, botocore.exceptions.ClientError):
+        return False
+    status = err.response.get("ResponseMetadata", {}).get("HTTPStatusCode", 0)
+    code = err.response.get("Error", {}).get("Code", "")
+    return status == 412 or code == "PreconditionFailed"
+
+
+def _discard(*paths):
+    """Remove files if they exist."""
+    for path in paths:
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+
+def _download_one(
+    s3,
+    bucket,
+    key,
+    local_file,
+    chunk_size,
+    retries,
+    backoff,
+    progress,
+    head=None,
+    restart=True,
+):
+    """
+    Download one object into ``local_file`` in ranged parts.
+
+    Parts are appended to ``local_file + ".part"``, which is renamed when
+    complete, so an interrupted download resumes from the bytes on disk.
+    The ETag of the object is kept in ``local_file + ".part.etag"``, and a
+    partial file of another version of the object is discarded. Parts are
+    requested with ``IfMatch``; if the object changes during the download,
+    it is started over once (with ``restart``). ``head`` is the response of
+    a previous `head_object` request, if any.
+    """
+    if head is None:
+        head = _head_object(s3, bucket, key, retries, backoff)
+    total = head["ContentLength"]
+    etag = head.get("ETag")
+    if os.path.exists(local_file) and os.path.getsize(local_file) == total:
+        logger.info(f"Skipping {key}, already downloaded.")
+        if progress is not None:
+            progress(key, total, total)
+        return local_file
+
+    part_file = local_file + ".part"
+    etag_file = part_file + ".etag"
+    done = os.path.getsize(part_file) if os.path.exists(part_file) else 0
+    if done:
+        try:
+            with open(etag_file) as f:
+                part_etag = f.read()
+        except FileNotFoundError:
+            part_etag = None
+        if done > total or etag is None or part_etag != etag:
+            logger.info(f"Discarding partial {key}, the object changed.")
+            done = 0
+    if done:
+        logger.info(f"Resuming {key} at byte {done} of {total}.")
+    elif etag is not None:
+        with open(etag_file, "w") as f:
+            f.write(etag)
+
+    try:
+        with open(part_file, "ab" if done else "wb") as f:
+            _fetch_ranges(
+                s3,
+                bucket,
+                key,
+                f,
+                done,
+                total,
+                chunk_size,
+                retries,
+                backoff,
+                progress,
+                etag=etag,
+            )
+    except botocore.exceptions.ClientError as err:
+        if not _is_precondition_failed(err):
+            raise
+        _discard(part_file, etag_file)
+        if not restart:
+            raise
+        logger.info(f"Restarting {key}, the object changed during the download.")
+        return _download_one(
+            s3,
+            bucket,
+            key,
+            local_file,
+            chunk_size,
+            retries,
+            backoff,
+            progress,
+            restart=False,
+        )
+    os.replace(part_file, local_file)
+    _discard(etag_file)
+    return local_file
+
+
+def download_files(
+    bucket,
+    file_keys,
+    save_dir=None,
+    anonymous=True,
+    max_workers=8,
+    retries=3,
+    backoff=1.0,
+    chunk_size=8 * 2**20,
+    progress=None,
+    client=None,
+    cache=None,
+):
+    """
+    Download many files from S3 concurrently.
+
+    Objects are fetched in ranged parts of ``chunk_size`` bytes, every part
+    is retried on transient errors with exponential backoff, and partly
+    downloaded files are resumed. Files already downloaded completely are
+    skipped.
+
+    Parameters
+    ----------
+    bucket : str
+        Name of the AWS S3 bucket.
+    file_keys : list of str
+        Keys of the files to download.
+    save_dir : str, optional
+        Directory to save the downloaded files. Required without ``cache``.
+    anonymous : bool, optional
+        If True, uses anonymous access. Default is True.
+    max_workers : int, optional
+        Number of files downloaded concurrently. Default is 8.
+    retries : int, optional
+        Number of retries of every request. Default is 3.
+    backoff : float, optional
+        Delay (seconds) before the first retry, doubled for every further
+        retry. Default is 1.
+    chunk_size : int, optional
+        Size (bytes) of the ranged parts. Default is 8 MiB.
+    progress : callable, optional
+        Function called as ``progress(key, bytes_done, bytes_total)`` after
+        every part.
+    client : botocore.client.S3, optional
+        S3 client to use. Defaults to a new client, see :func:`get_s3_client`.
+    cache : radarx.io.DownloadCache, optional
+        Cache to serve the files from, or to download them into on a miss.
+        ``save_dir`` is ignored. Default is None.
+
+    Returns
+    -------
+    list
+        Path to every downloaded (or cached) file, in the order of the keys, None for
+        the files which failed.
+
+    Examples
+    --------
+    Download a day of NEXRAD Level II files:
+
+        >>> files = list_available_files("noaa-nexrad-level2",
+            "2016/10/06/KAMX/")
+        >>> paths = download_files("noaa-nexrad-level2", files, "./downloads")
+    """
+    if cache is None and save_dir is None:
+        raise ValueError("Either a `save_dir` or a `cache` is required.")
+    s3 = client or get_s3_client(anonymous=anonymous, max_pool_connections=max_workers)
+    if cache is None:
+        os.makedirs(save_dir, exist_ok=True)
+
+    def download(key):
+        try:
+            if cache is not None:
+                return cache.fetch(
+                    bucket,
+                    key,
+                    client=s3,
+                    retries=retries,
+                    backoff=backoff,
+                    chunk_size=chunk_size,
+                    progress=progress,
+                )
+            local_file = os.path.join(save_dir, os.path.basename(key))
+            return _download_one(
+                s3, bucket, key, local_file, chunk_size, retries, backoff, progress
+            )
+        except Exception as err:
+            logger.warning(f"Failed to download {key}: {err!r}")
+            return None
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        paths = list(executor.map(download, file_keys))
+    failed = sum(path is None for path in paths)
+    logger.info(f"Downloaded {len(paths) - failed} of {len(paths)} files.")
+    return paths
+
+
+def open_remote(
+    bucket,
+    key,
+    anonymous=True,
+    reader=None,
+    max_memory=256 * 2**20,
+    spool_dir=None,
+    retries=3,
+    backoff=1.0,
+    chunk_size=8 * 2**20,
+    progress=None,
+    client=None,
+):
+    """
+    Read a file from S3 into memory, without writing it to disk.
+
+    Objects of up to ``max_memory`` bytes are read into an in-memory
+    buffer, larger ones are spooled to an anonymous temporary file which is
+    memory mapped. Both are file-like objects, which can be passed to the
+    ``xradar`` readers or to :func:`~radarx.io.read_sweep`.
+
+    Parameters
+    ----------
+    bucket : str
+        Name of the AWS S3 bucket.
+    key : str
+        Key of the file to read.
+    anonymous : bool, optional
+        If True, uses anonymous access. Default is True.
+    reader : callable, optional
+        Function the buffer is passed to, e.g. :func:`~radarx.io.read_sweep`
+        or ``xradar.io.open_nexradlevel2_datatree``. Default is None.
+    max_memory : int, optional
+        Size (bytes) of the largest object read into memory. Default is
+        256 MiB. If None, every object is read into memory.
+    spool_dir : str, optional
+        Directory of the temporary files of larger objects. Defaults to the
+        system temporary directory.
+    retries, backoff, chunk_size, progress : optional
+        Transfer options, see :func:`download_files`.
+    client : botocore.client.S3, optional
+        S3 client to use. Defaults to a shared client, see
+        :func:`get_s3_client`.
+
+    Returns
+    -------
+    io.BytesIO or mmap.mmap
+        Buffer holding the file, positioned at its start, or what ``reader``
+        returns for it.
+
+    Examples
+    --------
+    Read an IMD sweep without a local copy:
+
+        >>> import radarx as rx
+        >>> ds = open_remote("bucket", "GOA210515003646-IMD-C.nc",
+        ...                  reader=rx.io.read_sweep)
+    """
+    s3 = client or get_s3_client(anonymous=anonymous)
+    head = _head_object(s3, bucket, key, retries, backoff)
+    total = head["ContentLength"]
+    args = (0, total, chunk_size, retries, backoff, progress, head.get("ETag"))
+    if max_memory is None or total <= max_memory:
+        buffer = io.BytesIO()
+        _fetch_ranges(s3, bucket, key, buffer, *args)
+    else:
+        with tempfile.TemporaryFile(dir=spool_dir) as f:
+            _fetch_ranges(s3, bucket, key, f, *args)
+            buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    buffer.seek(0)
+    logger.info(f"Read {key} ({total} bytes) into memory.")
+    if reader is not None:
+        return reader(buffer)
+    return buffer
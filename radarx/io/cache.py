@@ -0,0 +1,344 @@
+#!/usr/bin/env python
+# Copyright (c) 2024-2025, radarx developers.
+# Distributed under the MIT License. See LICENSE for more info.
+
+"""
+Download Cache
+==============
+
+This sub-module provides a size bounded local cache of S3 objects. Objects
+are stored under a name derived from their bucket, key and ETag, so that
+unchanged objects are served from disk while changed ones are fetched
+again. The least recently used objects are evicted once the cache exceeds
+its maximum size. Several processes may share one cache directory.
+
+Example::
+
+    import radarx as rx
+    cache = rx.io.DownloadCache("/scratch/radarx", max_size=20 * 2**30)
+    paths = rx.io.download_files("noaa-nexrad-level2", keys, cache=cache)
+
+.. autosummary::
+   :nosignatures:
+   :toctree: generated/
+
+   {}
+"""
+
+__all__ = [
+    "DownloadCache",
+]
+
+__doc__ = __doc__.format("\n   ".join(__all__))
+
+import hashlib
+import logging
+import os
+import shutil
+import time
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover
+    fcntl = None
+    import msvcrt
+
+from .aws_data import _download_one, _head_object, get_s3_client
+
+logger = logging.getLogger(__name__)
+
+
+@contextmanager
+def _file_lock(path, blocking=True):
+    """
+    Hold an exclusive lock on the file ``path``, shared across processes.
+
+    Yields whether the lock was acquired, which is always the case when
+    ``blocking``.
+    """
+    with open(path, "a+b") as f:
+        try:
+            if fcntl is not None:
+                fcntl.flock(f, fcntl.LOCK_EX | (0 if blocking else fcntl.LOCK_NB))
+            else:  # pragma: no cover
+                mode = msvcrt.LK_LOCK if blocking else msvcrt.LK_NBLCK
+                msvcrt.locking(f.fileno(), mode, 1)
+        except OSError:
+            if blocking:
+                raise
+            yield False
+            return
+        try:
+            yield True
+        finally:
+            if fcntl is not None:
+                fcntl.flock(f, fcntl.LOCK_UN)
+            else:  # pragma: no cover
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+def _is_partial(name):
+    """Whether ``name`` is a partial download or its ETag."""
+    return name.endswith((".part", ".part.etag"))
+
+
+class DownloadCache:
+    """
+    Local cache of S3 objects, keyed by bucket, key and ETag.
+
+    Parameters
+    ----------
+    directory : str or pathlib.Path
+        Cache directory, created if missing.
+    max_size : int, optional
+        Maximum total size (bytes) of the cached objects. Defaults to 10 GiB.
+
+    Notes
+    -----
+    Every object is stored as ``objects/<hash>/<basename of key>``, where the
+    hash is the SHA-256 of ``bucket/key/etag``. Objects are downloaded next
+    to their final path and renamed when complete, while a file lock keeps
+    other processes from downloading the same object. A cache hit updates
+    the modification time of the object, the least recently used objects
+    are evicted first. Evicted objects stay readable by processes which
+    already opened them. Partial downloads count towards the size of the
+    cache, those left behind by interrupted processes are evicted once
+    they are older than :attr:`stale_after`.
+    """
+
+    #: number of lock files the objects are distributed over
+    nlocks = 256
+    #: age (seconds) after which an unlocked partial download is evicted
+    stale_after = 3600
+
+    def __init__(self, directory, max_size=10 * 2**30):
+        self.directory = os.path.abspath(os.path.expanduser(os.fspath(directory)))
+        self.max_size = max_size
+        self._objects = os.path.join(self.directory, "objects")
+        self._locks = os.path.join(self.directory, "locks")
+        os.makedirs(self._objects, exist_ok=True)
+        os.makedirs(self._locks, exist_ok=True)
+
+    def __repr__(self):
+        return (
+            f"<DownloadCache {self.directory!r} objects={len(self)} "
+            f"size={self.size} max_size={self.max_size}>"
+        )
+
+    def __len__(self):
+        return len(self._entries())
+
+    @property
+    def size(self):
+        """Total size (bytes) of the cached objects and partial downloads."""
+        entries = self._entries() + self._entries(partial=True)
+        return sum(stat.st_size for _, _, stat in entries)
+
+    def _entries(self, partial=False):
+        """Digest, path and stat of every complete object or partial file."""
+        entries = []
+        for digest in os.listdir(self._objects):
+            folder = os.path.join(self._objects, digest)
+            try:
+                names = os.listdir(folder)
+            except OSError:
+                continue
+            for name in names:
+                if _is_partial(name) != partial:
+                    continue
+                path = os.path.join(folder, name)
+                try:
+                    entries.append((digest, path, os.stat(path)))
+                except OSError:
+                    continue
+        return entries
+
+    def _lock(self, digest, blocking=True):
+        """Lock shared by all objects of the same digest prefix."""
+        index = int(digest[:8], 16) % self.nlocks
+        return _file_lock(os.path.join(self._locks, f"{index}.lock"), blocking)
+
+    @staticmethod
+    def _digest(bucket, key, etag):
+        etag = (etag or "").strip('"')
+        return hashlib.sha256(f"{bucket}/{key}/{etag}".encode()).hexdigest()
+
+    def path(self, bucket, key, etag):
+        """
+        Return the cache path of an object, whether it is cached or not.
+
+        Parameters
+        ----------
+        bucket : str
+            Name of the AWS S3 bucket.
+        key : str
+            Key of the object.
+        etag : str
+            ETag of the object, with or without quotes.
+
+        Returns
+        -------
+        str
+            Path of the object within the cache.
+        """
+        digest = self._digest(bucket, key, etag)
+        return os.path.join(self._objects, digest, os.path.basename(key))
+
+    def get(self, bucket, key, etag):
+        """
+        Return the path of a cached object and mark it as recently used.
+
+        Parameters
+        ----------
+        bucket, key, etag : str
+            Identity of the object, see :meth:`path`.
+
+        Returns
+        -------
+        str or None
+            Path of the cached object, None if it is not cached.
+        """
+        path = self.path(bucket, key, etag)
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        return path
+
+    def fetch(
+        self,
+        bucket,
+        key,
+        anonymous=True,
+        client=None,
+        retries=3,
+        backoff=1.0,
+        chunk_size=8 * 2**20,
+        progress=None,
+    ):
+        """
+        Return the path of a cached object, downloading it on a miss.
+
+        The ETag of the object is requested first, so that a changed object
+        is downloaded again. The least recently used objects are evicted
+        after a download when the cache exceeds ``max_size``.
+
+        Parameters
+        ----------
+        bucket : str
+            Name of the AWS S3 bucket.
+        key : str
+            Key of the object.
+        anonymous : bool, optional
+            If True, uses anonymous access. Default is True.
+        client : botocore.client.S3, optional
+            S3 client to use. Defaults to a shared client, see
+            :func:`~radarx.io.get_s3_client`.
+        retries, backoff, chunk_size, progress : optional
+            Download options, see :func:`~radarx.io.download_files`.
+
+        Returns
+        -------
+        str
+            Path of the cached object.
+        """
+        s3 = client or get_s3_client(anonymous=anonymous)
+        head = _head_object(s3, bucket, key, retries, backoff)
+        etag = head.get("ETag")
+        path = self.get(bucket, key, etag)
+        if path is not None:
+            logger.debug(f"Cache hit of {key}.")
+            if progress is not None:
+                progress(key, head["ContentLength"], head["ContentLength"])
+            return path
+
+        path = self.path(bucket, key, etag)
+        with self._lock(self._digest(bucket, key, etag)):
+            # another process may have downloaded it meanwhile
+            if self.get(bucket, key, etag) is None:
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                _download_one(
+                    s3,
+                    bucket,
+                    key,
+                    path,
+                    chunk_size,
+                    retries,
+                    backoff,
+                    progress,
+                    head=head,
+                )
+                logger.info(f"Cached {key} in {path}.")
+        self.evict(keep=(path,))
+        return path
+
+    def evict(self, max_size=None, keep=(), stale_after=None):
+        """
+        Remove the least recently used objects until the cache fits.
+
+        Partial downloads older than ``stale_after`` are removed first,
+        unless the download still holds their lock.
+
+        Parameters
+        ----------
+        max_size : int, optional
+            Size (bytes) to shrink the cache to. Defaults to ``max_size`` of
+            the cache.
+        keep : sequence of str, optional
+            Paths of objects which are not removed.
+        stale_after : float, optional
+            Age (seconds) of partial downloads to remove. Defaults to
+            ``stale_after`` of the cache.
+
+        Returns
+        -------
+        int
+            Number of objects and partial downloads removed.
+        """
+        max_size = self.max_size if max_size is None else max_size
+        stale_after = self.stale_after if stale_after is None else stale_after
+        removed = 0
+        with _file_lock(os.path.join(self.directory, "evict.lock")):
+            size = 0
+            expires = time.time() - stale_after
+            for digest, path, stat in self._entries(partial=True):
+                if stat.st_mtime > expires:
+                    size += stat.st_size
+                    continue
+                with self._lock(digest, blocking=False) as locked:
+                    if not locked:
+                        size += stat.st_size
+                        continue
+                    try:
+                        os.remove(path)
+                    except OSError:
+                        continue
+                removed += path.endswith(".part")
+                try:
+                    os.rmdir(os.path.dirname(path))
+                except OSError:
+                    pass
+
+            entries = self._entries()
+            size += sum(stat.st_size for _, _, stat in entries)
+            entries.sort(key=lambda entry: entry[2].st_mtime)
+            for digest, path, stat in entries:
+                if size <= max_size:
+                    break
+                if path in keep:
+                    continue
+                with self._lock(digest, blocking=False) as locked:
+                    if not locked:
+                        continue
+                    shutil.rmtree(os.path.dirname(path), ignore_errors=True)
+                size -= stat.st_size
+                removed += 1
+        if removed:
+            logger.info(f"Evicted {removed} objects from {self.directory}.")
+        return removed
+
+    def clear(self):
+        """Remove all cached objects and unlocked partial downloads."""
+        return self.evict(max_size=0, stale_after=0)
@@ -0,0 +1,354 @@
+#!/usr/bin/env python
+# Copyright (c) 2024-2025, radarx developers.
+# Distributed under the MIT License. See LICENSE for more info.
+
+"""
+Sweep Catalog
+=============
+
+This sub-module provides a persistent SQLite catalog of IMD sweep files.
+The header metadata of every file is recorded once, so that volume grouping
+and time range queries run against the index instead of the NetCDF files.
+
+Example::
+
+    import radarx as rx
+    catalog = rx.io.SweepCatalog("goa.sqlite")
+    catalog.update("/data/imd/goa")
+    files = catalog.files(start="2024-01-01T00:00", end="2024-01-01T06:00")
+    dtree = rx.io.read_volume(files)
+
+.. autosummary::
+   :nosignatures:
+   :toctree: generated/
+
+   {}
+"""
+
+__all__ = [
+    "SweepCatalog",
+]
+
+__doc__ = __doc__.format("\n   ".join(__all__))
+
+import glob
+import logging
+import os
+import re
+import sqlite3
+from concurrent.futures import ProcessPoolExecutor
+
+import pandas as pd
+
+from .imd import _header_metadata, _header_scalar
+
+logger = logging.getLogger(__name__)
+
+# format of the sweep start times stored in the catalog
+_TIME_FORMAT = "%Y-%m-%dT%H:%M:%S"
+
+_COLUMNS = (
+    "path",
+    "site",
+    "start_time",
+    "elevation_number",
+    "elevation",
+    "nsweeps",
+    "nrays",
+    "ngates",
+    "first_gate",
+    "gate_size",
+    "latitude",
+    "longitude",
+    "size",
+    "mtime",
+)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS sweeps (
+    path TEXT PRIMARY KEY,
+    site TEXT,
+    start_time TEXT,
+    elevation_number INTEGER,
+    elevation REAL,
+    nsweeps INTEGER,
+    nrays INTEGER,
+    ngates INTEGER,
+    first_gate REAL,
+    gate_size REAL,
+    latitude REAL,
+    longitude REAL,
+    size INTEGER,
+    mtime REAL
+);
+CREATE INDEX IF NOT EXISTS sweeps_site_time ON sweeps (site, start_time);
+"""
+
+
+def _site_name(path):
+    """Site code of an IMD file name, e.g. ``GOA`` of ``GOA2105150036...``."""
+    match = re.match(r"[A-Za-z]+", os.path.basename(path))
+    return match.group(0).upper() if match else ""
+
+
+def _scan_record(path):
+    """
+    Read the catalog record of a sweep file.
+
+    Parameters
+    ----------
+    path : str
+        Path to a radar sweep file.
+
+    Returns
+    -------
+    tuple
+        Values of all catalog columns.
+    """
+    import netCDF4
+
+    stat = os.stat(path)
+    with netCDF4.Dataset(path) as nc:
+        meta = _header_metadata(nc)
+        dims = nc.dimensions
+        nrays = len(dims["radial"]) if "radial" in dims else None
+        ngates = len(dims["bin"]) if "bin" in dims else None
+        number = _header_scalar(nc, ("elevationNumber", "sweep_number"))
+        first_gate = _header_scalar(nc, ("firstGateRange",))
+        gate_size = _header_scalar(nc, ("gateSize",))
+        latitude = _header_scalar(nc, ("siteLat", "latitude"))
+        longitude = _header_scalar(nc, ("siteLon", "longitude"))
+
+    return (
+        path,
+        _site_name(path),
+        meta["time"],
+        None if number is None else int(number),
+        meta["elevation"],
+        meta["nsweeps"],
+        nrays,
+        ngates,
+        first_gate,
+        gate_size,
+        latitude,
+        longitude,
+        stat.st_size,
+        stat.st_mtime,
+    )
+
+
+def _try_scan_record(path):
+    """Scan a record, returning None for unreadable files."""
+    try:
+        return _scan_record(path)
+    except (OSError, KeyError, ValueError) as e:
+        logger.warning(f"Skipping {path}, could not read its header. Error: {e}")
+        return None
+
+
+def _starts_volume(group, record):
+    """Whether ``record`` starts a new volume after the records ``group``."""
+    last = group[-1]
+    nsweeps = group[0]["nsweeps"]
+    if nsweeps and len(group) >= nsweeps:
+        return True
+    if last["elevation_number"] is not None and record["elevation_number"] is not None:
+        return record["elevation_number"] <= last["elevation_number"]
+    if last["elevation"] is None or record["elevation"] is None:
+        return False
+    return record["elevation"] < last["elevation"]
+
+
+class SweepCatalog:
+    """
+    Persistent SQLite catalog of IMD sweep files.
+
+    Parameters
+    ----------
+    path : str or pathlib.Path
+        Path of the SQLite database, created if missing. Use ``":memory:"``
+        for a temporary catalog.
+    """
+
+    def __init__(self, path):
+        self.path = os.fspath(path)
+        self._conn = sqlite3.connect(self.path)
+        self._conn.executescript(_SCHEMA)
+
+    def __repr__(self):
+        return f"<SweepCatalog {self.path!r} files={len(self)}>"
+
+    def __len__(self):
+        return self._conn.execute("SELECT COUNT(*) FROM sweeps").fetchone()[0]
+
+    def __contains__(self, path):
+        row = self._conn.execute(
+            "SELECT 1 FROM sweeps WHERE path = ?", (os.fspath(path),)
+        ).fetchone()
+        return row is not None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def close(self):
+        """Close the database connection."""
+        self._conn.close()
+
+    def update(self, paths, pattern="*.nc*", max_workers=None, prune=True):
+        """
+        Add new and changed sweep files to the catalog.
+
+        Only files which are not yet recorded, or whose size or modification
+        time changed, are scanned.
+
+        Parameters
+        ----------
+        paths : str or pathlib.Path or list
+            Directory, or list of files and directories, to index.
+        pattern : str, optional
+            Glob pattern of sweep files within directories. Defaults to
+            ``"*.nc*"``.
+        max_workers : int, optional
+            Number of worker processes scanning headers. Defaults to None
+            (sequential).
+        prune : bool, optional
+            If True (default), remove records of files within the given
+            directories which no longer exist.
+
+        Returns
+        -------
+        int
+            Number of files scanned.
+        """
+        if isinstance(paths, (str, os.PathLike)):
+            paths = [paths]
+        files, dirs = [], []
+        for path in map(os.fspath, paths):
+            if os.path.isdir(path):
+                dirs.append(os.path.abspath(path))
+                files.extend(sorted(glob.glob(os.path.join(path, pattern))))
+            else:
+                files.append(path)
+        files = [os.path.abspath(file) for file in files]
+
+        known = {
+            path: (size, mtime)
+            for path, size, mtime in self._conn.execute(
+                "SELECT path, size, mtime FROM sweeps"
+            )
+        }
+        todo, present = [], set()
+        for file in files:
+            try:
+                stat = os.stat(file)
+            except FileNotFoundError:
+                # removed since it was listed
+                continue
+            present.add(file)
+            if known.get(file) != (stat.st_size, stat.st_mtime):
+                todo.append(file)
+
+        if max_workers is None:
+            records = [_try_scan_record(file) for file in todo]
+        else:
+            with ProcessPoolExecutor(max_workers=max_workers) as pool:
+                records = list(pool.map(_try_scan_record, todo))
+        records = [record for record in records if record is not None]
+
+        with self._conn:
+            self._conn.executemany(
+                f"INSERT OR REPLACE INTO sweeps ({', '.join(_COLUMNS)}) "
+                f"VALUES ({', '.join('?' * len(_COLUMNS))})",
+                records,
+            )
+            if prune and dirs:
+                stale = [
+                    (path,)
+                    for path in known
+                    if path not in present
+                    and os.path.dirname(path) in dirs
+                    and not os.path.exists(path)
+                ]
+                self._conn.executemany("DELETE FROM sweeps WHERE path = ?", stale)
+                if stale:
+                    logger.info(f"Removed {len(stale)} missing files from catalog.")
+
+        logger.info(f"Catalog: scanned {len(records)} of {len(present)} files.")
+        return len(records)
+
+    def query(self, start=None, end=None, site=None):
+        """
+        Return the catalog records within a time range.
+
+        Parameters
+        ----------
+        start, end : str or datetime-like, optional
+            Times bounding the sweep start times, inclusive. Partial ISO
+            strings are completed with zeros, e.g. ``"2024-01-01T06:00"``
+            is read as ``2024-01-01T06:00:00``.
+        site : str, optional
+            Site code, e.g. ``"GOA"``.
+
+        Returns
+        -------
+        list of dict
+            Records ordered by site, start time and elevation number.
+        """
+        clauses, params = [], []
+        if start is not None:
+            clauses.append("start_time >= ?")
+            params.append(pd.Timestamp(start).ceil("s").strftime(_TIME_FORMAT))
+        if end is not None:
+            clauses.append("start_time <= ?")
+            params.append(pd.Timestamp(end).floor("s").strftime(_TIME_FORMAT))
+        if site is not None:
+            clauses.append("site = ?")
+            params.append(site.upper())
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        rows = self._conn.execute(
+            f"SELECT {', '.join(_COLUMNS)} FROM sweeps {where} "
+            "ORDER BY site, start_time, elevation_number, path",
+            params,
+        )
+        return [dict(zip(_COLUMNS, row)) for row in rows]
+
+    def files(self, start=None, end=None, site=None):
+        """
+        Return the sweep files within a time range, see :meth:`query`.
+
+        Returns
+        -------
+        list of str
+            File paths ordered by site, start time and elevation number.
+        """
+        return [record["path"] for record in self.query(start, end, site)]
+
+    def volumes(self, start=None, end=None, site=None):
+        """
+        Group the sweep files within a time range into volumes.
+
+        Like :func:`~radarx.io.read_volume`, but without opening any file, a
+        new volume starts where the elevation number resets, or, if it is
+        unknown, where the elevation angle decreases. Volumes are also split
+        after the recorded number of sweeps, so that a missing sweep or a
+        time range starting within a volume does not shift later volumes.
+
+        Returns
+        -------
+        list of list of str
+            Files of every volume, see :meth:`query` for the arguments.
+        """
+        groups = []
+        records = self.query(start, end, site)
+        for code in dict.fromkeys(record["site"] for record in records):
+            group = []
+            for record in (r for r in records if r["site"] == code):
+                if group and _starts_volume(group, record):
+                    groups.append([r["path"] for r in group])
+                    group = []
+                group.append(record)
+            groups.append([r["path"] for r in group])
+        return groups
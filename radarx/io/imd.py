@@ -23,8 +23,17 @@ Example::
    {}
 """
 
-import logging
+import functools
+import inspect
 import itertools
+import logging
+import mmap
+import os
+import re
+import threading
+from collections.abc import Mapping
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
 import numpy as np
 import xarray as xr
 from xarray import DataTree
@@ -34,7 +43,6 @@ from xradar.io.backends.cfradial1 import (
     _get_subgroup,
     _get_sweep_groups,
 )
-
 from xradar.model import (
     georeferencing_correction_subgroup,
     radar_parameters_subgroup,
@@ -42,17 +50,67 @@ from xradar.model import (
 
 logger = logging.getLogger(__name__)
 
+# xradar renamed the `site_coords` argument of `_get_sweep_groups`
+_SITE_COORDS_KWARG = (
+    "site_as_coords"
+    if "site_as_coords" in inspect.signature(_get_sweep_groups).parameters
+    else "site_coords"
+)
+
 __all__ = [
     "read_sweep",
     "read_volume",
+    "iter_volumes",
+    "unpack",
     "to_cfradial2",
     "to_cfradial2_volumes",
+    "LazyVolumes",
 ]
 
 __doc__ = __doc__.format("\n   ".join(__all__))
 
 
-def read_sweep(file):
+# IMD moment names and their CfRadial counterparts
+_MOMENTS = {
+    "T": "DBT",  # Total power
+    "Z": "DBZ",  # Reflectivity
+    "V": "VEL",  # Velocity
+    "W": "WIDTH",  # Spectrum width
+}
+
+
+def _open_netcdf(file, **kwargs):
+    """
+    Open a NetCDF file with :func:`xarray.open_dataset`, also from memory.
+
+    Bytes-like objects (e.g. ``bytes`` or ``mmap.mmap``) and binary
+    file-like objects are opened in memory by ``netCDF4``.
+    """
+    if isinstance(file, (str, os.PathLike)):
+        return xr.open_dataset(file, engine="netcdf4", **kwargs)
+
+    import netCDF4
+
+    if isinstance(file, (bytes, bytearray, memoryview, mmap.mmap)):
+        memory = file
+    elif hasattr(file, "getvalue"):
+        memory = file.getvalue()
+    else:
+        if file.seekable():
+            file.seek(0)
+        memory = file.read()
+    nc = netCDF4.Dataset("inmemory.nc", memory=memory)
+    return xr.open_dataset(xr.backends.NetCDF4DataStore(nc), **kwargs)
+
+
+def _file_name(file):
+    """Name of a file path or in-memory file, as shown in log messages."""
+    if isinstance(file, (str, os.PathLike)):
+        return os.fspath(file)
+    return getattr(file, "name", type(file).__name__)
+
+
+def read_sweep(file, variables=None, max_range=None, chunks=None, decode="float"):
     """
     Read and process a single radar file from the Indian Meteorological
     Department (IMD).
@@ -63,8 +121,22 @@ def read_sweep(file):
 
     Parameters
     ----------
-    file : str or pathlib.Path
-        The file path to the radar data file.
+    file : str or pathlib.Path or bytes or file-like
+        The file path to the radar data file, or the file held in memory,
+        e.g. as returned by :func:`~radarx.io.open_remote`.
+    variables : list of str, optional
+        Moments to read, by CfRadial (e.g. ``"DBZ"``) or IMD (e.g. ``"Z"``)
+        name. Defaults to None (all moments).
+    max_range : float, optional
+        Maximum range (meters) of the gates to read. Defaults to None (all
+        gates).
+    chunks : int, dict, 'auto' or None, optional
+        Dask chunks of the moments, as in :func:`xarray.open_dataset`.
+        Defaults to None (lazily indexed NumPy arrays).
+    decode : {'float', 'packed'}, optional
+        If 'packed', the moments keep their packed integers as stored on
+        disk, with ``scale_factor``, ``add_offset`` and ``_FillValue`` as
+        attributes, see :func:`unpack`. Defaults to 'float' (unpacked).
 
     Returns
     -------
@@ -73,16 +145,45 @@ def read_sweep(file):
         and coordinates appropriately renamed and additional fields
         calculated.
 
+    Notes
+    -----
+    The moments stay lazy. Unselected moments are dropped and the range
+    tail is sliced off before any data is read, so they are never decoded.
+
     Examples
     --------
     >>> import radarx as rx
     >>> ds = rx.io.read_sweep("path/to/radar/file")
+    >>> ds = rx.io.read_sweep("path/to/radar/file", ["DBZ"], max_range=150e3)
+    >>> ds = rx.io.read_sweep("path/to/radar/file", decode="packed")
+    >>> ds = rx.io.read_sweep(open("path/to/radar/file", "rb").read())
 
     See Also
     --------
     read_volume : Reads and processes radar volume data from multiple sweeps.
     """
-    ds = xr.open_dataset(file, engine="netcdf4")
+    if decode not in ("float", "packed"):
+        raise ValueError(f"Unknown decode {decode!r}, expected 'float' or 'packed'.")
+    mask_and_scale = True
+    if decode == "packed":
+        mask_and_scale = {m: False for m in (*_MOMENTS, *_MOMENTS.values())}
+    ds = _open_netcdf(file, chunks=chunks, mask_and_scale=mask_and_scale)
+
+    # Drop unselected moments and the range tail before anything is read
+    if variables is not None:
+        wanted = {_MOMENTS.get(v, v) for v in variables}
+        fields = [v for v, da in ds.data_vars.items() if set(da.dims) >= {"bin"}]
+        missing = wanted - {_MOMENTS.get(v, v) for v in fields}
+        if missing:
+            logger.warning(
+                f"Variables {sorted(missing)} not found in {_file_name(file)}."
+            )
+        ds = ds.drop_vars([v for v in fields if _MOMENTS.get(v, v) not in wanted])
+    if max_range is not None:
+        first_gate = float(ds["firstGateRange"].values)
+        gate_size = float(ds["gateSize"].values)
+        ngates = max(int(np.floor((max_range - first_gate) / gate_size)) + 1, 0)
+        ds = ds.isel(bin=slice(0, ngates))
 
     # Rename dimensions and variables for consistency with CF-Radial format
     ds = ds.rename_dims({"radial": "azimuth", "bin": "range"})
@@ -115,17 +216,9 @@ def read_sweep(file):
         attrs={"long_name": "gate_spacing_for_ray", "units": "meters"},
     )
 
-    # Rename moments for radar variables
-    moments = {
-        "T": "DBT",  # Total power
-        "Z": "DBZ",  # Reflectivity
-        "V": "VEL",  # Velocity
-        "W": "WIDTH",  # Spectrum width
-    }
-
     # Goes First in order
     # # Rename only the variables that exist in the dataset
-    ds = ds.rename_vars({k: v for k, v in moments.items() if k in ds})
+    ds = ds.rename_vars({k: v for k, v in _MOMENTS.items() if k in ds})
 
     # Compute range and assign to dataset, Goes 2nd
     ds = ds.pipe(_compute_range)
@@ -152,7 +245,16 @@ def read_sweep(file):
     return ds
 
 
-def read_volume(files):
+def read_volume(
+    files,
+    max_workers=None,
+    executor=None,
+    variables=None,
+    max_range=None,
+    chunks=None,
+    cfradial2=False,
+    decode="float",
+):
     """
     Read and process multiple radar files to create a volume scan dataset.
     This function reads a list of radar files (or a list of lists, in the
@@ -164,6 +266,24 @@ def read_volume(files):
     files : list of str or pathlib.Path or list of list of str or pathlib.Path
         A list of radar file paths or a list of lists, where each sublist represents
         a separate sweep in the radar volume scan.
+    max_workers : int, optional
+        Number of worker processes decoding sweeps concurrently. Defaults to
+        None (sequential).
+    executor : concurrent.futures.Executor, optional
+        Executor used to decode sweeps, e.g. a ``ThreadPoolExecutor``.
+        Takes precedence over ``max_workers``. The executor is not shut down.
+    variables : list of str, optional
+        Moments to read, see :func:`read_sweep`. Defaults to None (all).
+    max_range : float, optional
+        Maximum range (meters) of the gates to read, see :func:`read_sweep`.
+    chunks : int, dict, 'auto' or None, optional
+        Dask chunks of the moments, see :func:`read_sweep`.
+    cfradial2 : bool, optional
+        If True, every volume is a CfRadial2 DataTree built straight from its
+        sweeps, see :func:`create_cfradial2_volume`, as returned by
+        :func:`to_cfradial2_volumes`. Defaults to False.
+    decode : {'float', 'packed'}, optional
+        Storage of the moments, see :func:`read_sweep`. Defaults to 'float'.
 
     Returns
     -------
@@ -185,7 +305,21 @@ def read_volume(files):
         files = _merge_file_lists(files)
 
     # Determine volume groups from files
-    grouped_dataset_list = _determine_volumes(files)
+    grouped_dataset_list = _determine_volumes(
+        files,
+        max_workers=max_workers,
+        executor=executor,
+        variables=variables,
+        max_range=max_range,
+        chunks=chunks,
+        decode=decode,
+    )
+
+    if cfradial2:
+        dtree_root = DataTree(name="volumes")
+        for i, datasets in enumerate(grouped_dataset_list):
+            dtree_root[f"volume_{i}"] = create_cfradial2_volume(datasets)
+        return dtree_root
 
     # Create a list to store the volumes
     volume_datasets = []
@@ -206,6 +340,99 @@ def read_volume(files):
     return volumes
 
 
+def iter_volumes(
+    files,
+    cfradial2=False,
+    prefetch=True,
+    variables=None,
+    max_range=None,
+    chunks=None,
+    decode="float",
+):
+    """
+    Iterate over the volume scans of radar files, one volume at a time.
+
+    Unlike :func:`read_volume`, which returns all volumes at once, only the
+    volume being processed and the next one are held in memory, however
+    many files are given.
+
+    Parameters
+    ----------
+    files : list of str or radarx.io.SweepCatalog
+        Radar sweep files, or a list of lists of them, which are grouped into
+        volumes from their headers. Alternatively a
+        :class:`~radarx.io.SweepCatalog`, whose volumes are grouped from the
+        index without opening any file.
+    cfradial2 : bool, optional
+        If True, yield CfRadial2 DataTrees, see :func:`to_cfradial2`.
+        Defaults to False (CfRadial1 Datasets).
+    prefetch : bool, optional
+        If True (default), the next volume is read in a background thread
+        while the current one is processed.
+    variables : list of str, optional
+        Moments to read, see :func:`read_sweep`. Defaults to None (all).
+    max_range : float, optional
+        Maximum range (meters) of the gates to read, see :func:`read_sweep`.
+    chunks : int, dict, 'auto' or None, optional
+        Dask chunks of the moments, see :func:`read_sweep`. If given, the
+        moments stay lazy and are not read ahead.
+    decode : {'float', 'packed'}, optional
+        Storage of the moments, see :func:`read_sweep`. Defaults to 'float'.
+
+    Yields
+    ------
+    xarray.Dataset or DataTree
+        One volume scan, in time order.
+
+    Examples
+    --------
+    >>> import radarx as rx
+    >>> for vol in rx.io.iter_volumes(files, cfradial2=True):
+    ...     ds = vol.radarx.to_grid(data_vars=["DBZ"])
+
+    See Also
+    --------
+    read_volume : Read all volume scans into a single DataTree.
+    """
+    if hasattr(files, "volumes"):
+        sweep_groups = files.volumes()
+    else:
+        if any(isinstance(i, list) for i in files):
+            files = _merge_file_lists(files)
+        sweep_groups = _determine_nsweeps(list(map(str, files)))
+
+    options = _read_options(variables, max_range, chunks, decode)
+    read = functools.partial(
+        _read_group, cfradial2=cfradial2, load=chunks is None, **options
+    )
+    if not sweep_groups:
+        return
+    if not prefetch:
+        for group in sweep_groups:
+            yield read(group)
+        return
+
+    executor = ThreadPoolExecutor(max_workers=1)
+    try:
+        pending = executor.submit(read, sweep_groups[0])
+        for group in sweep_groups[1:] + [None]:
+            vol = pending.result()
+            pending = executor.submit(read, group) if group else None
+            yield vol
+            # drop the reference before waiting for the next volume
+            del vol
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+def _read_group(files, cfradial2=False, load=False, **kwargs):
+    """Read the sweep files of one volume into a CfRadial1 or 2 volume."""
+    datasets = [_read_sweep_or_fallback(file, load=load, **kwargs) for file in files]
+    if cfradial2:
+        return create_cfradial2_volume(datasets)
+    return create_volume(datasets)
+
+
 def _merge_file_lists(file_lists):
     """
     Merge multiple lists of file paths into a single, flattened list.
@@ -489,7 +716,121 @@ def _assign_metadata(ds):
     return ds
 
 
-def _determine_nsweeps(files):
+def _natural_sort_key(s, _re=re.compile(r"(\d+)")):
+    return [int(t) if i & 1 else t.lower() for i, t in enumerate(_re.split(s))]
+
+
+def _scan_header(file):
+    """
+    Read the sweep metadata of a file without decoding it.
+
+    Only the header and the scalar start time and elevation angle are read,
+    using netCDF4 directly.
+
+    Parameters
+    ----------
+    file : str
+        Path to a radar sweep file.
+
+    Returns
+    -------
+    dict
+        ``time`` (ISO string or None), ``elevation`` (float, NaN if unknown)
+        and ``nsweeps`` (int or None).
+    """
+    import netCDF4
+
+    with netCDF4.Dataset(file) as nc:
+        return _header_metadata(nc)
+
+
+def _header_scalar(nc, names, default=None):
+    """First element of the first variable of ``names`` present in ``nc``."""
+    for name in names:
+        if name in nc.variables:
+            value = np.ma.ravel(nc.variables[name][:])
+            if value.size and not np.ma.is_masked(value[0]):
+                return value[0].item()
+            return default
+    return default
+
+
+def _header_metadata(nc):
+    """Sweep metadata of an open ``netCDF4.Dataset``, see `_scan_header`."""
+    import netCDF4
+
+    nsweeps = None
+    if "nsweeps" in nc.ncattrs():
+        nsweeps = int(nc.getncattr("nsweeps"))
+    elif "sweep" in nc.dimensions:
+        nsweeps = len(nc.dimensions["sweep"])
+
+    elevation = float(
+        _header_scalar(nc, ("elevationAngle", "fixed_angle"), float("nan"))
+    )
+
+    estime = None
+    for name in ("esStartTime", "time_coverage_start"):
+        if name not in nc.variables:
+            continue
+        var = nc.variables[name]
+        units = getattr(var, "units", "")
+        if "since" in units:
+            stamp = netCDF4.num2date(
+                np.ma.ravel(var[:])[0],
+                units,
+                getattr(var, "calendar", "standard"),
+            )
+            estime = stamp.strftime("%Y-%m-%dT%H:%M:%S")
+        else:
+            estime = netCDF4.chartostring(var[:]) if var.dtype == "S1" else var[:]
+            estime = str(np.ravel(estime)[0])[:19]
+        break
+
+    return {"time": estime, "elevation": elevation, "nsweeps": nsweeps}
+
+
+def _scan_files(files, max_workers=None):
+    """
+    Scan the sweep metadata of many files, optionally in a process pool.
+
+    Parameters
+    ----------
+    files : list of str
+        List of file paths corresponding to radar sweep files.
+    max_workers : int, optional
+        Number of worker processes. Defaults to None (sequential).
+
+    Returns
+    -------
+    list of dict
+        Metadata of every file as returned by :func:`_scan_header`.
+    """
+    if max_workers is None:
+        return [_scan_header(file) for file in files]
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        return list(pool.map(_scan_header, files))
+
+
+def _dataset_metadata(ds):
+    """Sweep metadata of an already decoded (or raw) sweep dataset."""
+    estime = ds.get("time_coverage_start", ds.get("esStartTime", None))
+    if estime is not None:
+        if estime.dtype.kind in "SUO":
+            estime = estime.values.item()
+            estime = estime.decode() if isinstance(estime, bytes) else str(estime)
+            estime = estime[:19]
+        else:
+            estime = estime.dt.strftime("%Y-%m-%dT%H:%M:%S").values.item()
+
+    elevation = float("nan")
+    ele_ang = ds.get("fixed_angle", ds.get("elevationAngle", None))
+    if ele_ang is not None and ele_ang.size:
+        elevation = float(ele_ang.values.ravel()[0])
+    return {"time": estime, "elevation": elevation, "nsweeps": None}
+
+
+def _determine_nsweeps(files, metadata=None, max_workers=None):
     """
     Determine the number of sweeps (nsweeps) and group files
     accordingly into sweep_groups.
@@ -501,6 +842,13 @@ def _determine_nsweeps(files):
     ----------
     files : list of str
         List of file paths corresponding to radar sweep files.
+    metadata : dict, optional
+        Mapping of file path to sweep metadata (``time`` and ``elevation``)
+        already known, e.g. from decoded sweeps. Files missing from the
+        mapping are scanned.
+    max_workers : int, optional
+        Number of worker processes scanning the file headers in the
+        fallback method. Defaults to None (sequential).
 
     Returns
     -------
@@ -513,13 +861,10 @@ def _determine_nsweeps(files):
     The function first attempts to retrieve the number of sweeps (nsweeps)
     from the metadata of the files. If it cannot be determined, it uses
     the elevation angles to detect when the sweep elevations decrease,
-    which indicates the start of a new volume.
+    which indicates the start of a new volume. The elevation angles are
+    read from the file headers with netCDF4 only, without decoding the
+    files with xarray.
     """
-    import re
-
-    def _natural_sort_key(s, _re=re.compile(r"(\d+)")):
-        return [int(t) if i & 1 else t.lower() for i, t in enumerate(_re.split(s))]
-
     try:
         # Check if files exist and open the first file to determine nsweeps
         if len(files):
@@ -555,49 +900,120 @@ def _determine_nsweeps(files):
     except Exception as e:
         # Fallback method if nsweeps cannot be determined from metadata
         logger.warning(f"Failed to determine nsweeps from metadata: {e}")
-        sweep_groups = []
-        sweep_times = []
-        sweep_elevs = []
         files = sorted(files, key=_natural_sort_key)
 
-        # Collect sweep times and elevations
-        for file in files:
-            ds = xr.open_dataset(file, engine="netcdf4")
-            estime = ds.get("esStartTime", ds.get("time_coverage_start", None))
-            if estime is not None:
-                estime = estime.dt.strftime("%Y-%m-%dT%H:%M:%S").values.item()
-
-            ele_ang = ds.get("elevationAngle", ds.get("fixed_angle", None))
-            if ele_ang is not None:
-                ele_ang = ele_ang.values.item()
-
-            sweep_times.append(estime)
-            sweep_elevs.append(ele_ang if ele_ang is not None else float("nan"))
-            del ds
-
-        # Determine sweep groups based on elevation increases/decreases
-        current_group = []
-        for i in range(1, len(sweep_elevs)):
-            current_group.append(files[i - 1])
-
-            # Check if the elevation decreases, indicating the start of a new volume
-            if (
-                not (np.isnan(sweep_elevs[i]) or np.isnan(sweep_elevs[i - 1]))
-                and sweep_elevs[i] < sweep_elevs[i - 1]
-            ):
-                logger.info(f"Detected volume change at file index {i}.")
-                sweep_groups.append(current_group)
-                current_group = []
-
-        # Append the last group
-        current_group.append(files[-1])
-        sweep_groups.append(current_group)
+        # Collect sweep times and elevations, scanning only unknown headers
+        metadata = dict(metadata or {})
+        missing = [file for file in files if file not in metadata]
+        metadata.update(zip(missing, _scan_files(missing, max_workers=max_workers)))
+        sweep_elevs = [metadata[file]["elevation"] for file in files]
+
+        sweep_groups = _group_by_elevation(files, sweep_elevs)
         logger.info(f"Total number of sweep groups determined: {len(sweep_groups)}")
 
         return sweep_groups
 
 
-def _determine_volumes(files):
+def _group_by_elevation(files, sweep_elevs):
+    """
+    Split ordered sweep files into volumes where the elevation decreases.
+
+    Parameters
+    ----------
+    files : list of str
+        Ordered sweep files.
+    sweep_elevs : list of float
+        Elevation angle of every file, NaN if unknown.
+
+    Returns
+    -------
+    sweep_groups : list of list of str
+        Files of every volume.
+    """
+    if not len(files):
+        return []
+    sweep_groups = []
+
+    # Determine sweep groups based on elevation increases/decreases
+    current_group = []
+    for i in range(1, len(sweep_elevs)):
+        current_group.append(files[i - 1])
+
+        # Check if the elevation decreases, indicating the start of a new volume
+        if (
+            not (np.isnan(sweep_elevs[i]) or np.isnan(sweep_elevs[i - 1]))
+            and sweep_elevs[i] < sweep_elevs[i - 1]
+        ):
+            logger.info(f"Detected volume change at file index {i}.")
+            sweep_groups.append(current_group)
+            current_group = []
+
+    # Append the last group
+    current_group.append(files[-1])
+    sweep_groups.append(current_group)
+    return sweep_groups
+
+
+def _read_options(variables=None, max_range=None, chunks=None, decode="float"):
+    """Keyword arguments of `read_sweep` which differ from the defaults."""
+    options = {"variables": variables, "max_range": max_range, "chunks": chunks}
+    options = {k: v for k, v in options.items() if v is not None}
+    if decode != "float":
+        options["decode"] = decode
+    return options
+
+
+def _read_sweep_or_fallback(file, load=False, **kwargs):
+    """
+    Read a sweep with `read_sweep`, falling back to `xarray.open_dataset`.
+
+    Parameters
+    ----------
+    file : str
+        Path to a radar sweep file.
+    load : bool, optional
+        If True, load the data into memory, e.g. before the dataset is sent
+        back from a worker process. Defaults to False.
+    **kwargs : dict
+        Keyword arguments passed to :func:`read_sweep`.
+
+    Returns
+    -------
+    xarray.Dataset
+        The sweep dataset.
+    """
+    try:
+        # Attempt to read sweep using custom `read_sweep`
+        ds = read_sweep(file, **kwargs)
+    except (OSError, ValueError, KeyError) as e:
+        # Log the specific exception with the filename and
+        # fall back to `open_dataset`
+        logger.warning(
+            f"Failed to read sweep from {_file_name(file)} with read_sweep. "
+            f"Error: {e}. Falling back to open_dataset."
+        )
+        try:
+            ds = xr.open_dataset(file)
+        except Exception as open_error:
+            logger.error(
+                f"Failed to open {_file_name(file)} with open_dataset. "
+                f"Error: {open_error}"
+            )
+            raise open_error  # Raise the exception if fallback also fails
+    if load:
+        ds = ds.load()
+    return ds
+
+
+def _determine_volumes(
+    files,
+    max_workers=None,
+    executor=None,
+    variables=None,
+    max_range=None,
+    chunks=None,
+    decode="float",
+):
     """
     Determine radar volumes from files.
 
@@ -605,6 +1021,14 @@ def _determine_volumes(files):
     ----------
     files : list of str
         List of file paths corresponding to radar sweep files.
+    max_workers : int, optional
+        Number of worker processes decoding sweeps concurrently. Defaults to
+        None (sequential).
+    executor : concurrent.futures.Executor, optional
+        Executor used to decode sweeps. Takes precedence over ``max_workers``.
+    variables, max_range, chunks, decode : optional
+        Selection and storage of the moments and gates to read, see
+        :func:`read_sweep`.
 
     Returns
     -------
@@ -617,38 +1041,177 @@ def _determine_volumes(files):
     This function attempts to read radar sweep files using the `read_sweep`
     function. If `read_sweep` raises an exception, the function falls back
     to `xarray.open_dataset` for opening the file.
+
+    With an executor, the sweeps of all volumes are decoded concurrently.
+    The order of the files is preserved and the first failing file (in file
+    order) raises, as in sequential mode. Sweeps decoded in worker
+    processes are loaded into memory before they are returned.
+
+    The sweeps are decoded before they are grouped into volumes, so the
+    elevation angles needed for grouping are taken from the decoded sweeps
+    instead of opening every file a second time.
     """
+    # Decode all sweeps first, in natural file order, so that every file is
+    # opened once and the volume grouping reuses the decoded metadata
+    flat = sorted(files, key=_natural_sort_key)
+
+    options = _read_options(variables, max_range, chunks, decode)
+    if executor is None and max_workers is None:
+        datasets = [_read_sweep_or_fallback(file, **options) for file in flat]
+    elif executor is None:
+        read = functools.partial(_read_sweep_or_fallback, load=True, **options)
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            datasets = list(pool.map(read, flat))
+    else:
+        load = isinstance(executor, ProcessPoolExecutor)
+        read = functools.partial(_read_sweep_or_fallback, load=load, **options)
+        datasets = list(executor.map(read, flat))
+
+    decoded = dict(zip(flat, datasets))
+    metadata = {file: _dataset_metadata(ds) for file, ds in decoded.items()}
+
     # Determine sweep lists based on the number of sweeps
-    swp_lists = _determine_nsweeps(files)
-    volumes = []
-
-    for swp_list in swp_lists:
-        volume = []
-        for file in swp_list:
-            try:
-                # Attempt to read sweep using custom `read_sweep`
-                ds = read_sweep(file)
-            except (OSError, ValueError, KeyError) as e:
-                # Log the specific exception with the filename and
-                # fall back to `open_dataset`
-                logger.warning(
-                    f"Failed to read sweep from {file} with read_sweep. "
-                    f"Error: {e}. Falling back to open_dataset."
-                )
-                try:
-                    ds = xr.open_dataset(file)
-                except Exception as open_error:
-                    logger.error(
-                        f"Failed to open {file} with open_dataset. Error: {open_error}"
-                    )
-                    raise open_error  # Raise the exception if fallback also fails
-
-            volume.append(ds)
-        volumes.append(volume)
+    swp_lists = _determine_nsweeps(flat, metadata=metadata)
+
+    # Regroup the decoded sweeps into volumes
+    volumes = [[decoded[file] for file in swp_list] for swp_list in swp_lists]
 
     return volumes
 
 
+# Variables concatenated along the sweep dimension
+_SWEEP_VARS = [
+    "fixed_angle",
+    "ray_angle_res",
+    "sweep_mode",
+    "scan_type",
+    "sweep_number",
+    "sweep_start_ray_index",
+    "sweep_end_ray_index",
+]
+
+# Variables constant across sweeps, taken from the first sweep
+_CONSTANT_VARS = [
+    "time_coverage_start",
+    "latitude",
+    "longitude",
+    "altitude",
+    "firstGateRange",
+    "gateSize",
+    "nyquist_velocity",
+    "unambiguous_range",
+    "calibConst",
+    "radarConst",
+    "beamWidthHori",
+    "pulseWidth",
+    "bandWidth",
+    "filterDop",
+    "azimuthSpeed",
+    "highPRF",
+    "lowPRF",
+    "dwellTime",
+    "waveLength",
+    "calI0",
+    "calNoise",
+    "groundHeight",
+    "meltHeight",
+    "scanType",
+    "logNoise",
+    "linNoise",
+    "inphaseOffset",
+    "quadratureOffset",
+    "logSlope",
+    "logFilter",
+    "filterPntClt",
+    "filterThreshold",
+    "sampleNum",
+    "SQIThresh",
+    "LOGThresh",
+    "SIGThresh",
+    "CSRThresh",
+    "DBTThreshFlag",
+    "DBZThreshFlag",
+    "VELThreshFlag",
+    "WIDThreshFlag",
+]
+
+
+def _is_packed(var):
+    """Whether a variable holds packed integers, see `read_sweep`."""
+    return var.dtype.kind in "iu" and bool(
+        {"scale_factor", "add_offset", "_FillValue"} & set(var.attrs)
+    )
+
+
+def unpack(obj):
+    """
+    Unpack the packed moments of a sweep, volume or DataTree.
+
+    Moments read with ``decode="packed"`` hold the integers stored on disk.
+    They are masked and scaled lazily, i.e. only when their values are
+    accessed.
+
+    Parameters
+    ----------
+    obj : xarray.Dataset or DataTree
+        Sweep, CfRadial1 volume or CfRadial2 DataTree.
+
+    Returns
+    -------
+    xarray.Dataset or DataTree
+        The same object with floating point moments.
+
+    Examples
+    --------
+    >>> import radarx as rx
+    >>> ds = rx.io.read_sweep("path/to/radar/file", decode="packed")
+    >>> ds = rx.io.read_sweep(open("path/to/radar/file", "rb").read())
+    >>> ds = rx.io.unpack(ds)
+    """
+    if isinstance(obj, DataTree):
+        return obj.map_over_datasets(unpack)
+    packed = [name for name, var in obj.data_vars.items() if _is_packed(var)]
+    if not packed:
+        return obj
+    decoded = xr.decode_cf(
+        obj[packed].reset_coords(drop=True),
+        decode_times=False,
+        decode_coords=False,
+        decode_timedelta=False,
+    )
+    return obj.assign({name: decoded[name] for name in packed})
+
+
+def _harmonize_packing(dataset_list):
+    """
+    Unpack moments whose packing differs between sweeps.
+
+    Packed integers can only be stacked into one array if every sweep holds
+    them with the same ``scale_factor``, ``add_offset`` and ``_FillValue``.
+    """
+
+    def packing(ds, name):
+        var = ds.get(name)
+        if var is None or not _is_packed(var):
+            return None
+        keys = ("scale_factor", "add_offset", "_FillValue")
+        return (var.dtype.str, *(repr(var.attrs.get(key)) for key in keys))
+
+    names = {name for ds in dataset_list for name in ds.data_vars}
+    differing = [
+        name
+        for name in sorted(names)
+        if len({packing(ds, name) for ds in dataset_list}) > 1
+    ]
+    if not differing:
+        return dataset_list
+    logger.info(f"Unpacking {differing}, their packing differs between sweeps.")
+    return [
+        ds.assign({v: unpack(ds[[v]])[v] for v in differing if v in ds})
+        for ds in dataset_list
+    ]
+
+
 def create_volume(dataset_list):
     """
     Concatenate a list of datasets along the 'time' and 'sweep' dimensions.
@@ -667,74 +1230,161 @@ def create_volume(dataset_list):
     -------
     xarray.Dataset
         Concatenated dataset with proper time and sweep dimensions.
+
+    Notes
+    -----
+    Sweeps with the same variables, range gates and non-time shapes are
+    copied into arrays preallocated for the whole volume. Otherwise, e.g.
+    for sweeps with different range gates or dask-backed sweeps, they are
+    aligned and concatenated with :func:`xarray.concat`.
+
+    Packed moments, see :func:`read_sweep`, stay packed if all sweeps share
+    the same packing, otherwise they are unpacked.
     """
+    dataset_list = _harmonize_packing(dataset_list)
+    combined_ds = _create_volume_fast(dataset_list)
+    if combined_ds is None:
+        combined_ds = _create_volume_concat(dataset_list)
+    return combined_ds
 
-    # Identify variables that should be concatenated along the sweep dimension
-    sweep_vars = [
-        "fixed_angle",
-        "ray_angle_res",
-        "sweep_mode",
-        "scan_type",
-        "sweep_number",
-        "sweep_start_ray_index",
-        "sweep_end_ray_index",
-    ]
 
-    # Identify variables that are constant across sweeps and should not be concatenated
-    constant_vars = [
-        "time_coverage_start",
-        "latitude",
-        "longitude",
-        "altitude",
-        "firstGateRange",
-        "gateSize",
-        "nyquist_velocity",
-        "unambiguous_range",
-        "calibConst",
-        "radarConst",
-        "beamWidthHori",
-        "pulseWidth",
-        "bandWidth",
-        "filterDop",
-        "azimuthSpeed",
-        "highPRF",
-        "lowPRF",
-        "dwellTime",
-        "waveLength",
-        "calI0",
-        "calNoise",
-        "groundHeight",
-        "meltHeight",
-        "scanType",
-        "logNoise",
-        "linNoise",
-        "inphaseOffset",
-        "quadratureOffset",
-        "logSlope",
-        "logFilter",
-        "filterPntClt",
-        "filterThreshold",
-        "sampleNum",
-        "SQIThresh",
-        "LOGThresh",
-        "SIGThresh",
-        "CSRThresh",
-        "DBTThreshFlag",
-        "DBZThreshFlag",
-        "VELThreshFlag",
-        "WIDThreshFlag",
-    ]
+def _ray_index_vars(sizes):
+    """Sweep start and end ray indices of sweeps with the given ray counts."""
+    sizes = np.asarray(sizes, dtype=np.int64)
+    sweep_start = np.concatenate([[0], np.cumsum(sizes)[:-1]])
+    return {
+        "sweep_start_ray_index": xr.DataArray(
+            sweep_start,
+            dims="sweep",
+            attrs={"long_name": "Index of the first ray in the sweep"},
+        ),
+        "sweep_end_ray_index": xr.DataArray(
+            sweep_start + sizes - 1,
+            dims="sweep",
+            attrs={"long_name": "Index of the last ray in the sweep"},
+        ),
+    }
+
+
+def _time_coverage_end(ds):
+    """Volume end time, the maximum ray time."""
+    return xr.DataArray(
+        data=str(ds.time.max().dt.strftime("%Y-%m-%dT%H:%M:%SZ").values).encode(
+            "utf-8"
+        ),
+        attrs={"standard_name": "data_volume_end_time_utc"},
+    )
 
+
+def _create_volume_fast(dataset_list):
+    """
+    Build a volume by copying the sweeps into preallocated arrays.
+
+    Parameters
+    ----------
+    dataset_list : list of xarray.Dataset
+        List of datasets representing individual sweeps.
+
+    Returns
+    -------
+    xarray.Dataset or None
+        The volume, the same as built by :func:`_create_volume_concat`, or
+        None if the sweeps cannot be stacked without alignment.
+    """
+    if not dataset_list:
+        return None
+    first = dataset_list[0]
+    names = set(first.variables)
+    for ds in dataset_list:
+        if set(ds.variables) != names or "time" not in ds.dims:
+            return None
+        if any(var.chunks is not None for var in ds.variables.values()):
+            return None
+
+    sizes = [ds.sizes["time"] for ds in dataset_list]
+    bounds = np.concatenate([[0], np.cumsum(sizes)])
+    variables = {}
+    for name, var in first.variables.items():
+        if name in _SWEEP_VARS:
+            continue
+        others = [ds.variables[name] for ds in dataset_list]
+        if name in _CONSTANT_VARS:
+            if "time" in var.dims:
+                return None
+            variables[name] = var
+        elif "time" in var.dims or name in first.data_vars:
+            # data variables without time are repeated for every ray
+            if any(other.dims != var.dims for other in others):
+                return None
+            if "time" in var.dims:
+                axis = var.dims.index("time")
+                dims, shape = var.dims, list(var.shape)
+                shapes = {o.shape[:axis] + o.shape[axis + 1 :] for o in others}
+                if len(shapes) != 1:
+                    return None
+            else:
+                axis = 0
+                dims, shape = ("time",) + var.dims, [0, *var.shape]
+            shape[axis] = bounds[-1]
+            data = np.empty(shape, dtype=np.result_type(*others))
+            for other, i0, i1 in zip(others, bounds[:-1], bounds[1:]):
+                data[(slice(None),) * axis + (slice(i0, i1),)] = other.values
+            variables[name] = xr.Variable(
+                dims, data, attrs=var.attrs, encoding=var.encoding
+            )
+        elif all(var.equals(other) for other in others[1:]):
+            # coordinates without time, e.g. the range, must not differ
+            variables[name] = var
+        else:
+            return None
+
+    # Sweep metadata, stacked along the sweep dimension
+    ray_index = _ray_index_vars(sizes)
+    for name in _SWEEP_VARS:
+        if name not in first or name in ray_index:
+            continue
+        var = first.variables[name]
+        dims = var.dims if "sweep" in var.dims else ("sweep",) + var.dims
+        data = np.concatenate(
+            [
+                ds[name].values if "sweep" in var.dims else ds[name].values[None]
+                for ds in dataset_list
+            ],
+            axis=dims.index("sweep"),
+        )
+        variables[name] = xr.Variable(dims, data, attrs=var.attrs)
+    variables.update({name: da.variable for name, da in ray_index.items()})
+
+    combined_ds = xr.Dataset(variables, attrs=first.attrs)
+    combined_ds = combined_ds.set_coords([v for v in first.coords if v in variables])
+    combined_ds["time_coverage_end"] = _time_coverage_end(combined_ds)
+    return combined_ds
+
+
+def _create_volume_concat(dataset_list):
+    """
+    Build a volume by aligning and concatenating the sweeps.
+
+    Parameters
+    ----------
+    dataset_list : list of xarray.Dataset
+        List of datasets representing individual sweeps.
+
+    Returns
+    -------
+    xarray.Dataset
+        Concatenated dataset with proper time and sweep dimensions.
+    """
     # Step 1: Concatenate the datasets along the time dimension
     time_concat = xr.concat(
-        [ds.drop_vars(sweep_vars, errors="ignore") for ds in dataset_list], dim="time"
+        [ds.drop_vars(_SWEEP_VARS, errors="ignore") for ds in dataset_list], dim="time"
     )
 
     # Step 2: Handle sweep-specific variables (metadata)
     sweep_datasets = []
-    for i, ds in enumerate(dataset_list):
+    for ds in dataset_list:
         sweep_ds = {}
-        for var in sweep_vars:
+        for var in _SWEEP_VARS:
             if var in ds:
                 # Expand dims to add a 'sweep' dimension if needed
                 if "sweep" not in ds[var].dims:
@@ -742,43 +1392,26 @@ def create_volume(dataset_list):
                 else:
                     sweep_ds[var] = ds[var]
 
-        # Update sweep start and end ray indices
-        sweep_start = i * ds.sizes["time"]
-        sweep_end = sweep_start + ds.sizes["time"] - 1
-
-        sweep_ds["sweep_start_ray_index"] = xr.DataArray(
-            np.array([sweep_start]),
-            dims="sweep",
-            attrs={"long_name": "Index of the first ray in the sweep"},
-        )
-        sweep_ds["sweep_end_ray_index"] = xr.DataArray(
-            np.array([sweep_end]),
-            dims="sweep",
-            attrs={"long_name": "Index of the last ray in the sweep"},
-        )
-
         # Add the updated sweep metadata dataset to the list
         sweep_datasets.append(xr.Dataset(sweep_ds))
 
     # Step 3: Concatenate the sweep-specific datasets along the sweep dimension
     sweep_concat = xr.concat(sweep_datasets, dim="sweep")
 
+    # Update sweep start and end ray indices
+    sweep_concat.update(_ray_index_vars([ds.sizes["time"] for ds in dataset_list]))
+
     # Step 4: Merge the time-concatenated data,
     # sweep-concatenated metadata, and constant variables
     combined_ds = xr.merge([time_concat, sweep_concat])
 
     # Step 5: Assign constant variables (they do not need to be concatenated)
-    for var in constant_vars:
+    for var in _CONSTANT_VARS:
         if var in dataset_list[0]:
             combined_ds[var] = dataset_list[0][var]
 
     # Step 6: Update the 'time_coverage_end' variable with the maximum time value
-    combined_ds["time_coverage_end"] = xr.DataArray(
-        data=str(
-            combined_ds.time.max().dt.strftime("%Y-%m-%dT%H:%M:%SZ").values
-        ).encode("utf-8"),
-        attrs={"standard_name": "data_volume_end_time_utc"},
-    )
+    combined_ds["time_coverage_end"] = _time_coverage_end(combined_ds)
 
     return combined_ds
 
@@ -843,14 +1476,7 @@ def to_cfradial2(ds, **kwargs):
     sweep = kwargs.pop("sweep", None)
 
     # Build the base dictionary for DataTree
-    dtree: dict = {
-        "/": _get_required_root_dataset(ds, optional=optional),
-        "/radar_parameters": _get_subgroup(ds, radar_parameters_subgroup),
-        "/georeferencing_correction": _get_subgroup(
-            ds, georeferencing_correction_subgroup
-        ),
-        "/radar_calibration": _get_radar_calibration(ds),
-    }
+    dtree = _cfradial2_groups(ds, optional=optional)
 
     # Add sweep groups to the dictionary
     sweep_groups = _get_sweep_groups(
@@ -858,7 +1484,7 @@ def to_cfradial2(ds, **kwargs):
         sweep=sweep,
         first_dim=first_dim,
         optional=optional,
-        site_coords=site_coords,
+        **{_SITE_COORDS_KWARG: site_coords},
     )
     for sweep_name, sweep_data in sweep_groups.items():
         dtree[f"/{sweep_name}"] = sweep_data
@@ -867,7 +1493,74 @@ def to_cfradial2(ds, **kwargs):
     return DataTree.from_dict(dtree)
 
 
-def to_cfradial2_volumes(volumes):
+def _cfradial2_groups(ds, optional=True):
+    """Root and metadata groups of the CfRadial2 DataTree of a volume."""
+    return {
+        "/": _get_required_root_dataset(ds, optional=optional),
+        "/radar_parameters": _get_subgroup(ds, radar_parameters_subgroup),
+        "/georeferencing_correction": _get_subgroup(
+            ds, georeferencing_correction_subgroup
+        ),
+        "/radar_calibration": _get_radar_calibration(ds),
+    }
+
+
+def create_cfradial2_volume(
+    dataset_list, first_dim="auto", optional=True, site_coords=True
+):
+    """
+    Build a CfRadial2 DataTree of a volume straight from its sweeps.
+
+    The same as ``to_cfradial2(create_volume(dataset_list))``, but every sweep
+    group is built from its own sweep dataset, so the moments are never
+    concatenated into a CfRadial1 volume and split up again.
+
+    Parameters
+    ----------
+    dataset_list : list of xarray.Dataset
+        List of datasets representing individual sweeps, as returned by
+        :func:`read_sweep`, sorted by sweep.
+    first_dim : str, optional
+        First dimension of the sweeps, see :func:`to_cfradial2`. Defaults to
+        'auto'.
+    optional : bool, optional
+        Whether to include optional fields. Defaults to True.
+    site_coords : bool, optional
+        Whether to include site coordinates. Defaults to True.
+
+    Returns
+    -------
+    DataTree
+        An xarray DataTree object representing the volume in CfRadial2 format.
+
+    See Also
+    --------
+    create_volume : Concatenate sweeps into a CfRadial1 volume.
+    """
+    kwargs = {"first_dim": first_dim, "optional": optional}
+    if any("sweep_start_ray_index" not in ds for ds in dataset_list):
+        # sweeps which were not decoded by `read_sweep`
+        return to_cfradial2(
+            create_volume(dataset_list), site_coords=site_coords, **kwargs
+        )
+
+    # The root groups only need the metadata, not the moments
+    metadata = create_volume(
+        [
+            ds.drop_vars(_find_variables_by_coords(ds, {"time", "range"}))
+            for ds in dataset_list
+        ]
+    )
+    dtree = _cfradial2_groups(metadata, optional=optional)
+    for i, ds in enumerate(dataset_list):
+        sweep_groups = _get_sweep_groups(
+            ds, **kwargs, **{_SITE_COORDS_KWARG: site_coords}
+        )
+        dtree[f"/sweep_{i}"] = sweep_groups["sweep_0"]
+    return DataTree.from_dict(dtree)
+
+
+def to_cfradial2_volumes(volumes, max_workers=None, executor=None, lazy=False):
     """
     Convert multiple CfRadial1 volumes to a DataTree containing CfRadial2 structures.
 
@@ -881,10 +1574,19 @@ def to_cfradial2_volumes(volumes):
     volumes : DataTree
         A DataTree containing multiple radar volumes. Each child node should represent
         a radar volume.
+    max_workers : int, optional
+        Number of worker processes converting volumes concurrently. Defaults
+        to None (sequential).
+    executor : concurrent.futures.Executor, optional
+        Executor converting the volumes, e.g. a ``ThreadPoolExecutor``. Takes
+        precedence over ``max_workers``. The executor is not shut down.
+    lazy : bool, optional
+        If True, return a :class:`LazyVolumes` mapping instead, which converts
+        a volume only when it is first accessed. Defaults to False.
 
     Returns
     -------
-    DataTree
+    DataTree or LazyVolumes
         A root DataTree object named 'volumes' containing each converted radar volume as
         a subgroup. Each subgroup (volume_{i}) is structured according to the CfRadial2
         format, containing sweeps and other relevant metadata.
@@ -898,6 +1600,9 @@ def to_cfradial2_volumes(volumes):
     >>> print(dtree_root['volume_0'].groups)
     ['/', '/radar_parameters', '/georeferencing_correction', '/sweep_0', '/sweep_1', ...]
 
+    >>> lazy_root = to_cfradial2_volumes(volumes, lazy=True)
+    >>> latest = lazy_root[-1]  # only the last volume is converted
+
     Notes
     -----
     - Each radar volume is expected to be a CfRadial1 format dataset.
@@ -908,12 +1613,19 @@ def to_cfradial2_volumes(volumes):
     --------
     to_cfradial2 : Convert a sweep to cfradial2 format
     """
-    volumes_list = []
-    for volume in volumes.children:
-        if "volume_" in volume:
-            vol = volumes[volume].to_dataset()
-            dtree = to_cfradial2(vol)
-            volumes_list.append(dtree)
+    names = [volume for volume in volumes.children if "volume_" in volume]
+    if lazy:
+        return LazyVolumes([volumes[name] for name in names])
+
+    datasets = [volumes[name].to_dataset() for name in names]
+    if executor is None and max_workers is None:
+        volumes_list = [to_cfradial2(vol) for vol in datasets]
+    elif executor is None:
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            volumes_list = list(pool.map(to_cfradial2, datasets))
+    else:
+        volumes_list = list(executor.map(to_cfradial2, datasets))
+
     # Create the root DataTree to hold all volumes
     dtree_root = DataTree(name="volumes")
 
@@ -925,3 +1637,80 @@ def to_cfradial2_volumes(volumes):
         dtree_root[volume_name] = vol_dtree
 
     return dtree_root
+
+
+class LazyVolumes(Mapping):
+    """
+    Read-only mapping of CfRadial2 volumes converted on first access.
+
+    Returned by ``to_cfradial2_volumes(..., lazy=True)``. Volumes are keyed
+    ``volume_0``, ``volume_1``, ..., or accessed by (negative) position, and
+    every volume is converted with :func:`to_cfradial2` once, then kept.
+
+    Parameters
+    ----------
+    volumes : list of DataTree or xarray.Dataset
+        CfRadial1 volumes.
+    """
+
+    def __init__(self, volumes):
+        self._volumes = list(volumes)
+        self._converted = {}
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+        return f"<LazyVolumes volumes={len(self)} converted={sorted(self._converted)}>"
+
+    def __len__(self):
+        return len(self._volumes)
+
+    def __iter__(self):
+        return (f"volume_{i}" for i in range(len(self)))
+
+    def __contains__(self, key):
+        # check the key only, without converting the volume
+        try:
+            self._index(key)
+        except KeyError:
+            return False
+        return isinstance(key, str)
+
+    def _index(self, key):
+        """Position of the volume ``key``, raising KeyError if missing."""
+        index = key
+        if isinstance(key, str):
+            name, _, number = key.partition("_")
+            if name != "volume" or not number.isdigit():
+                raise KeyError(key)
+            index = int(number)
+        elif index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise KeyError(key)
+        return index
+
+    def __getitem__(self, key):
+        index = self._index(key)
+        with self._lock:
+            if index not in self._converted:
+                vol = self._volumes[index]
+                if isinstance(vol, DataTree):
+                    vol = vol.to_dataset()
+                self._converted[index] = to_cfradial2(vol)
+                self._volumes[index] = None
+            return self._converted[index]
+
+    def to_datatree(self):
+        """
+        Convert all volumes and return them as a single DataTree.
+
+        Returns
+        -------
+        DataTree
+            A root DataTree named 'volumes', as returned by
+            :func:`to_cfradial2_volumes`.
+        """
+        dtree_root = DataTree(name="volumes")
+        for name, vol_dtree in self.items():
+            dtree_root[name] = vol_dtree
+        return dtree_root
@@ -0,0 +1,386 @@
+#!/usr/bin/env python
+# Copyright (c) 2024-2025, radarx developers.
+# Distributed under the MIT License. See LICENSE for more info.
+
+"""
+Volume Watcher
+==============
+
+This sub-module assembles IMD volume scans in real time, while the sweep
+files land one by one in a spool directory. Every sweep is decoded as soon
+as it arrives and a volume is emitted as soon as it is complete, through a
+callback or an :class:`asyncio.Queue`.
+
+Example::
+
+    import radarx as rx
+    watcher = rx.io.VolumeWatcher("/data/spool", callback=print)
+    watcher.start()
+
+.. autosummary::
+   :nosignatures:
+   :toctree: generated/
+
+   {}
+"""
+
+__all__ = [
+    "VolumeWatcher",
+]
+
+__doc__ = __doc__.format("\n   ".join(__all__))
+
+import fnmatch
+import glob
+import logging
+import os
+import threading
+import time
+from queue import Empty, Queue
+
+import numpy as np
+
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+
+    WATCHDOG_AVAILABLE = True
+except ImportError:  # pragma: no cover
+    WATCHDOG_AVAILABLE = False
+
+from .catalog import _site_name
+from .imd import (
+    _dataset_metadata,
+    _natural_sort_key,
+    create_cfradial2_volume,
+    create_volume,
+    read_sweep,
+)
+
+logger = logging.getLogger(__name__)
+
+# elevations (degrees) of the first sweeps of two volumes considered equal
+_ELEVATION_TOLERANCE = 0.1
+
+
+def _file_nsweeps(path):
+    """Number of sweeps per volume stated in the header of a sweep file."""
+    import netCDF4
+
+    try:
+        with netCDF4.Dataset(path) as nc:
+            if "nsweeps" in nc.ncattrs():
+                return int(nc.getncattr("nsweeps"))
+    except (OSError, ValueError):
+        pass
+    return None
+
+
+class _SiteBuffer:
+    """Sweeps of the volume being assembled for one site."""
+
+    def __init__(self):
+        self.files = []
+        self.datasets = []
+        self.elevations = []
+        self.nsweeps = None
+
+
+class VolumeWatcher:
+    """
+    Watch a spool directory and assemble IMD volumes as sweeps arrive.
+
+    Sweeps are buffered per site. A volume is complete when it holds
+    ``nsweeps`` sweeps or, as in :func:`~radarx.io.read_volume`, when the
+    elevation of a new sweep decreases.
+
+    Parameters
+    ----------
+    directory : str or pathlib.Path
+        Directory the sweep files land in.
+    callback : callable, optional
+        Function called with every completed volume.
+    queue : asyncio.Queue, optional
+        Queue every completed volume is put into, from the event loop
+        running when :meth:`start` is called.
+    pattern : str, optional
+        Glob pattern of sweep files. Defaults to ``"*.nc*"``.
+    nsweeps : int, optional
+        Number of sweeps per volume. Defaults to None, the ``nsweeps``
+        attribute of the sweep files or else the number of sweeps of the
+        last complete volume of the site.
+    cfradial2 : bool, optional
+        If True, emit CfRadial2 DataTrees. Defaults to False (CfRadial1
+        Datasets).
+    existing : bool, optional
+        If True, files already present when watching starts are assembled
+        too. Defaults to False.
+    poll_interval : float, optional
+        Seconds between directory scans of the polling fallback. Defaults
+        to 2.
+    use_watchdog : bool, optional
+        If True (default) and ``watchdog`` is installed, file system events
+        (e.g. inotify) are used instead of polling.
+    **read_kwargs : dict
+        Keyword arguments of :func:`~radarx.io.read_sweep`, e.g.
+        ``variables`` or ``max_range``.
+
+    Notes
+    -----
+    Without a known ``nsweeps`` a volume is only emitted when the first
+    sweep of the next volume arrives. The number of sweeps is only learnt
+    from a volume closed by an elevation drop, whose first elevation equals
+    the one of the next volume, so that a partial volume seen when watching
+    starts mid-stream is not taken for a complete one. With polling, a file
+    is read once its size and modification time did not change between two
+    scans, so that partly written files are skipped. With ``watchdog``,
+    files are read when they are closed after writing or moved into the
+    directory. Files only reported as created or modified, e.g. by
+    observers without close events, are read once their size is stable
+    for ``poll_interval`` seconds.
+    """
+
+    def __init__(
+        self,
+        directory,
+        callback=None,
+        queue=None,
+        pattern="*.nc*",
+        nsweeps=None,
+        cfradial2=False,
+        existing=False,
+        poll_interval=2.0,
+        use_watchdog=True,
+        **read_kwargs,
+    ):
+        if callback is None and queue is None:
+            raise ValueError("Either a `callback` or a `queue` is required.")
+        self.directory = os.fspath(directory)
+        self.callback = callback
+        self.queue = queue
+        self.pattern = pattern
+        self.nsweeps = nsweeps
+        self.cfradial2 = cfradial2
+        self.poll_interval = poll_interval
+        self.use_watchdog = use_watchdog and WATCHDOG_AVAILABLE
+        self.read_kwargs = read_kwargs
+        self._buffers = {}
+        self._seen = set()
+        self._pending = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._threads = []
+        self._observer = None
+        self._loop = None
+        if not existing:
+            self._seen.update(self._list_files())
+
+    def __repr__(self):
+        return f"<VolumeWatcher {self.directory!r} sites={list(self._buffers)}>"
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *args):
+        self.stop()
+
+    def _list_files(self):
+        return sorted(
+            glob.glob(os.path.join(self.directory, self.pattern)),
+            key=_natural_sort_key,
+        )
+
+    def start(self):
+        """Start watching the directory in a background thread."""
+        if self.queue is not None:
+            import asyncio
+
+            self._loop = asyncio.get_running_loop()
+        self._stop.clear()
+        if self.use_watchdog:  # pragma: no cover
+            events = Queue()
+            self._observer = Observer()
+            self._observer.schedule(_EventHandler(self, events), self.directory)
+            self._observer.start()
+            target, args = self._consume, (events,)
+        else:
+            target, args = self._run_polling, ()
+        thread = threading.Thread(target=target, args=args, daemon=True)
+        thread.start()
+        self._threads.append(thread)
+        logger.info(f"Watching {self.directory} for sweeps.")
+
+    def stop(self, flush=False):
+        """
+        Stop watching the directory.
+
+        Parameters
+        ----------
+        flush : bool, optional
+            If True, emit the incomplete volumes still buffered. Defaults to
+            False.
+        """
+        self._stop.set()
+        if self._observer is not None:  # pragma: no cover
+            self._observer.stop()
+            self._observer.join()
+            self._observer = None
+        for thread in self._threads:
+            thread.join()
+        self._threads = []
+        if flush:
+            self.flush()
+
+    def flush(self):
+        """Emit the buffered sweeps of every site as (incomplete) volumes."""
+        with self._lock:
+            for site, buffer in self._buffers.items():
+                if buffer.files:
+                    self._emit(site, buffer)
+
+    def _run_polling(self):
+        while not self._stop.is_set():
+            try:
+                self.poll()
+            except Exception as err:  # pragma: no cover
+                logger.error(f"Polling {self.directory} failed: {err!r}")
+            self._stop.wait(self.poll_interval)
+
+    def _consume(self, events):
+        last = time.monotonic()
+        while not self._stop.is_set():
+            try:
+                path, ready = events.get(timeout=min(self.poll_interval, 0.5))
+            except Empty:
+                pass
+            else:
+                if ready:
+                    self.add_file(path)
+                elif path not in self._seen:
+                    self._pending.setdefault(path, None)
+            if self._pending and time.monotonic() - last >= self.poll_interval:
+                last = time.monotonic()
+                self._settle(list(self._pending))
+
+    def poll(self):
+        """
+        Scan the directory once and add the files which are fully written.
+
+        Returns
+        -------
+        int
+            Number of files added.
+        """
+        return self._settle(self._list_files())
+
+    def _settle(self, paths):
+        """Add the files whose size and mtime did not change since last time."""
+        count = 0
+        for path in paths:
+            if path in self._seen:
+                self._pending.pop(path, None)
+                continue
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            state = (stat.st_size, stat.st_mtime)
+            if stat.st_size and self._pending.get(path) == state:
+                del self._pending[path]
+                self.add_file(path)
+                count += 1
+            else:
+                self._pending[path] = state
+        return count
+
+    def add_file(self, path):
+        """
+        Decode a sweep file and add it to the volume of its site.
+
+        Parameters
+        ----------
+        path : str
+            Path to a radar sweep file.
+        """
+        path = os.fspath(path)
+        with self._lock:
+            if path in self._seen:
+                return
+            self._seen.add(path)
+            try:
+                ds = read_sweep(path, **self.read_kwargs).load()
+            except (OSError, ValueError, KeyError) as err:
+                logger.warning(f"Skipping {path}, could not read it. Error: {err}")
+                return
+
+            site = _site_name(path)
+            buffer = self._buffers.setdefault(site, _SiteBuffer())
+            elevation = _dataset_metadata(ds)["elevation"]
+            if buffer.elevations:
+                last = buffer.elevations[-1]
+                if not (np.isnan(elevation) or np.isnan(last)) and elevation < last:
+                    logger.info(f"Detected volume change at {path}.")
+                    if abs(buffer.elevations[0] - elevation) <= _ELEVATION_TOLERANCE:
+                        # a volume starting like the next one is complete
+                        buffer.nsweeps = len(buffer.files)
+                    self._emit(site, buffer)
+            buffer.files.append(path)
+            buffer.datasets.append(ds)
+            buffer.elevations.append(elevation)
+            nsweeps = self.nsweeps or _file_nsweeps(path) or buffer.nsweeps
+            if nsweeps and len(buffer.files) >= nsweeps:
+                self._emit(site, buffer)
+
+    def _emit(self, site, buffer):
+        """Build the volume of a site buffer and hand it out."""
+        files, datasets = buffer.files, buffer.datasets
+        buffer.files, buffer.datasets, buffer.elevations = [], [], []
+        try:
+            if self.cfradial2:
+                vol = create_cfradial2_volume(datasets)
+            else:
+                vol = create_volume(datasets)
+        except Exception as err:
+            logger.warning(f"Building the {site} volume of {files[0]} failed: {err!r}")
+            return
+        logger.info(f"Completed {site} volume of {len(files)} sweeps.")
+        if self.callback is not None:
+            self.callback(vol)
+        if self.queue is not None:
+            self._loop.call_soon_threadsafe(self.queue.put_nowait, vol)
+
+
+if WATCHDOG_AVAILABLE:  # pragma: no cover
+
+    class _EventHandler(FileSystemEventHandler):
+        """
+        Forward sweep files to the watcher, as ready when closed or moved in,
+        else to be checked for a stable size.
+        """
+
+        def __init__(self, watcher, events):
+            super().__init__()
+            self.watcher = watcher
+            self.events = events
+
+        def _put(self, path, ready):
+            path = os.fspath(path)
+            if fnmatch.fnmatch(os.path.basename(path), self.watcher.pattern):
+                self.events.put((path, ready))
+
+        def on_closed(self, event):
+            if not event.is_directory:
+                self._put(event.src_path, True)
+
+        def on_moved(self, event):
+            if not event.is_directory:
+                self._put(event.dest_path, True)
+
+        def on_created(self, event):
+            if not event.is_directory:
+                self._put(event.src_path, False)
+
+        def on_modified(self, event):
+            if not event.is_directory:
+                self._put(event.src_path, False)
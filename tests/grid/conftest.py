@@ -0,0 +1,42 @@
+#!/usr/bin/env python
+# Copyright (c) 2024-2025, Radarx developers.
+# Distributed under the MIT License. See LICENSE for more info.
+
+import numpy as np
+import pytest
+import xarray as xr
+from xarray import DataTree
+
+
+def _sweep_tree(elevations=(0.5, 1.5), nrays=36, ngates=20):
+    """Build a minimal radar DataTree with synthetic sweeps."""
+    rng = np.random.default_rng(0)
+    tree = {"/": xr.Dataset()}
+    for i, elev in enumerate(elevations):
+        tree[f"/sweep_{i}"] = xr.Dataset(
+            {
+                "DBZH": (("azimuth", "range"), rng.normal(20, 5, (nrays, ngates))),
+                "VRADH": (("azimuth", "range"), rng.normal(0, 5, (nrays, ngates))),
+                "sweep_fixed_angle": elev,
+            },
+            coords={
+                "azimuth": np.arange(nrays) * 360.0 / nrays,
+                "range": np.arange(ngates) * 250.0 + 125.0,
+                "elevation": ("azimuth", np.full(nrays, elev)),
+                "time": (
+                    "azimuth",
+                    np.datetime64("2024-01-01T00:00:00")
+                    + np.arange(nrays).astype("timedelta64[s]"),
+                ),
+                "latitude": 15.5,
+                "longitude": 73.8,
+                "altitude": 50.0,
+            },
+        )
+    return DataTree.from_dict(tree)
+
+
+@pytest.fixture
+def sweep_tree():
+    """Fixture returning a factory of synthetic radar DataTrees."""
+    return _sweep_tree
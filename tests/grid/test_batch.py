@@ -0,0 +1,93 @@
+#!/usr/bin/env python
+# Copyright (c) 2024-2025, Radarx developers.
+# Distributed under the MIT License. See LICENSE for more info.
+
+import inspect
+
+import numpy as np
+import pytest
+import xarray as xr
+
+from radarx.grid import grid_radar, grid_radar_batch
+from radarx.grid.batch import _SETUP_KWARGS
+from radarx.grid.grid import _grid_setup
+
+GRID_KWARGS = dict(
+    data_vars=["DBZH"],
+    x_lim=(-5e3, 5e3),
+    y_lim=(-5e3, 5e3),
+    z_lim=(0, 1e3),
+    x_step=500,
+    y_step=500,
+    z_step=250,
+    x_smth=1,
+    y_smth=1,
+    geo=False,
+    method="cressman",
+)
+
+
+def _shift_time(dtree, minutes):
+    """Return a copy of a DataTree with all ray times shifted."""
+    dtree = dtree.copy()
+    for swp in dtree.match("sweep_*"):
+        ds = dtree[swp].to_dataset()
+        dtree[swp] = ds.assign_coords(time=ds["time"] + np.timedelta64(minutes, "m"))
+    return dtree
+
+
+@pytest.fixture
+def volumes(sweep_tree):
+    """Three volumes of the same site, ten minutes apart, out of order."""
+    dtree = sweep_tree(nrays=90, ngates=40)
+    return [_shift_time(dtree, minutes) for minutes in (20, 0, 10)]
+
+
+@pytest.mark.parametrize("max_workers", [None, 2])
+def test_grid_radar_batch(volumes, max_workers):
+    """Volumes are gridded onto one grid and stacked along time."""
+    ds = grid_radar_batch(volumes, max_workers=max_workers, **GRID_KWARGS)
+    assert ds["DBZH"].dims == ("time", "z", "y", "x"), "Unexpected dimensions"
+    assert ds.sizes["time"] == 3, "Volumes missing"
+    assert np.all(np.diff(ds["time"].values) > np.timedelta64(0)), "Not sorted"
+    assert ds.attrs["failed_sources"] == [], "Unexpected failures"
+
+    single_ds = grid_radar(volumes[1], **GRID_KWARGS)
+    np.testing.assert_allclose(ds["DBZH"][0].values, single_ds["DBZH"].values)
+
+
+def test_grid_radar_batch_partial_failure(volumes, sweep_tree):
+    """A failing volume is reported without aborting the batch."""
+    other_site = sweep_tree(nrays=90, ngates=40)
+    for swp in other_site.match("sweep_*"):
+        other_site[swp] = other_site[swp].to_dataset().assign_coords(latitude=20.0)
+    ds = grid_radar_batch(volumes + [other_site, "missing.nc"], **GRID_KWARGS)
+    assert ds.sizes["time"] == 3, "Valid volumes missing"
+    assert ds.attrs["failed_sources"] == ["volume 3", "missing.nc"]
+    assert "does not match" in ds.attrs["failed_errors"][0]
+
+
+def test_grid_radar_batch_all_failed():
+    """A batch without any readable volume raises."""
+    with pytest.raises(RuntimeError, match="failed for all 1 volumes"):
+        grid_radar_batch(["missing.nc"], **GRID_KWARGS)
+    with pytest.raises(ValueError, match="return_timings"):
+        grid_radar_batch([xr.DataTree()], return_timings=True)
+
+
+def test_grid_radar_batch_defaults():
+    """The batch grid defaults to the grid of `grid_radar`."""
+    single = inspect.signature(grid_radar).parameters
+    batch = inspect.signature(_grid_setup).parameters
+    for name in _SETUP_KWARGS:
+        assert batch[name].default == single[name].default, f"{name} differs"
+
+
+def test_grid_radar_batch_raises_programming_errors(volumes):
+    """Errors other than reading or gridding errors are not swallowed."""
+
+    def reader(path):
+        raise TypeError("bug")
+
+    with pytest.raises(TypeError, match="bug"):
+        grid_radar_batch(volumes + ["volume.nc"], reader=reader, **GRID_KWARGS)
@@ -0,0 +1,202 @@
+#!/usr/bin/env python
+# Copyright (c) 2024-2025, Radarx developers.
+# Distributed under the MIT License. See LICENSE for more info.
+
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+import xarray as xr
+
+from radarx.grid import (
+    OperatorCache,
+    get_engine,
+    grid_fields,
+    grid_radar,
+    list_engines,
+    register_engine,
+)
+from radarx.grid.engines import _ENGINES
+
+GRID = dict(sigma=[1.0, 1.0, 1.0], x0=[0.0, 0.0, 0.0], step=[1.0, 1.0, 1.0])
+
+
+@pytest.fixture
+def gates():
+    """Gates on the cell centres of a 4 x 3 x 2 grid, plus a NaN gate."""
+    zz, yy, xx = np.meshgrid(np.arange(2), np.arange(3), np.arange(4), indexing="ij")
+    points = np.column_stack([xx.ravel(), yy.ravel(), zz.ravel()]).astype(float)
+    values = np.arange(len(points), dtype=float)
+    points = np.vstack([points, [[1.2, 1.0, 0.0]]])
+    values = np.append(values, np.nan)
+    return points, values
+
+
+def test_list_engines():
+    """All builtin engines are registered."""
+    assert {"barnes", "nearest", "cressman", "idw", "bin"} <= set(list_engines())
+    with pytest.raises(ValueError, match="Unknown gridding method"):
+        get_engine("kriging")
+
+
+@pytest.mark.parametrize("method", ["nearest", "idw", "bin"])
+def test_engines_reproduce_cell_values(gates, method):
+    """Gates on cell centres are reproduced by the exact engines."""
+    points, values = gates
+    gridded, timings = grid_fields(
+        points, {"DBZH": values}, size=(4, 3, 2), method=method, **GRID
+    )
+    expected = np.arange(24, dtype=float).reshape(2, 3, 4)
+    np.testing.assert_allclose(gridded["DBZH"], expected, atol=1e-4)
+    assert set(timings) == {"DBZH"}, "Timing missing"
+
+
+def test_grid_fields_timing(gates):
+    """Fields are timed one by one, unless they are gridded in one pass."""
+    points, values = gates
+    other = values.copy()
+    other[::2] = np.nan
+    fields = {"DBZH": values, "VRADH": other}
+    for method, keys in [
+        ("bin", ["DBZH", "VRADH"]),
+        ("nearest", ["DBZH", "VRADH"]),
+        ("idw", ["DBZH+VRADH"]),
+    ]:
+        _, timings = grid_fields(points, fields, size=(4, 3, 2), method=method, **GRID)
+        assert sorted(timings) == keys, f"Unexpected timings of {method}"
+        assert all(seconds > 0 for seconds in timings.values())
+
+    _, timings = grid_fields(
+        points,
+        {"DBZH": values, "VRADH": values},
+        size=(4, 3, 2),
+        method="nearest",
+        **GRID,
+    )
+    assert list(timings) == ["DBZH+VRADH"], "Expected one timing of the shared query"
+
+
+def test_barnes_engine_timing(gates, monkeypatch):
+    """Every Barnes interpolation is timed on its own."""
+    from radarx.grid import engines
+
+    calls = []
+
+    def barnes(xyz, values, sigma, x0, step, size, max_dist):
+        calls.append(len(values))
+        return np.zeros(tuple(size[::-1]))
+
+    monkeypatch.setattr(engines, "FASTBARNES_AVAILABLE", True)
+    monkeypatch.setattr(
+        engines, "get_half_kernel_size", lambda *args, **kwargs: 0, raising=False
+    )
+    monkeypatch.setattr(
+        engines, "interpolation", SimpleNamespace(barnes=barnes), raising=False
+    )
+    points, values = gates
+    _, timings = grid_fields(
+        points, {"DBZH": values, "VRADH": values}, size=(4, 3, 2), **GRID
+    )
+    assert calls == [24, 24] and sorted(timings) == ["DBZH", "VRADH"]
+
+
+def test_grid_fields_drops_empty_fields(gates, caplog):
+    """Fields without valid gates are dropped with a warning."""
+    points, values = gates
+    empty = np.full_like(values, np.nan)
+    gridded, timings = grid_fields(
+        points,
+        {"DBZH": values, "VRADH": empty},
+        size=(4, 3, 2),
+        method="nearest",
+        **GRID,
+    )
+    assert list(gridded) == ["DBZH"] and list(timings) == ["DBZH"]
+    assert "No valid data points for variable VRADH" in caplog.text
+
+
+def test_cressman_engine_is_bounded(gates):
+    """Cressman averages stay within the range of the gate values."""
+    points, values = gates
+    gridded, _ = grid_fields(
+        points, {"DBZH": values}, size=(4, 3, 2), method="cressman", **GRID
+    )
+    assert np.all(np.isfinite(gridded["DBZH"])), "Cells without value"
+    assert gridded["DBZH"].min() >= 0 and gridded["DBZH"].max() <= 23
+
+
+def test_bin_engine_statistics():
+    """Bin engine computes mean, max and count per cell."""
+    points = np.array([[0.1, 0, 0], [-0.2, 0, 0], [0.9, 0, 0], [5.0, 0, 0]])
+    values = np.array([1.0, 3.0, 7.0, 100.0])
+    kwargs = dict(GRID, size=(2, 1, 1), method="bin")
+    result = {
+        stat: grid_fields(points, {"v": values}, statistic=stat, **kwargs)[0]["v"]
+        for stat in ("mean", "max", "count")
+    }
+    np.testing.assert_allclose(result["mean"].ravel(), [2.0, 7.0])
+    np.testing.assert_allclose(result["max"].ravel(), [3.0, 7.0])
+    np.testing.assert_allclose(result["count"].ravel(), [2.0, 1.0])
+    with pytest.raises(ValueError, match="Unknown statistic"):
+        grid_fields(points, {"v": values}, statistic="median", **kwargs)
+
+
+def test_register_engine(gates):
+    """Custom engines can be registered and used by name."""
+
+    @register_engine("zeros")
+    def zeros(points, fields, masks, sigma, x0, step, size):
+        return {var: np.zeros(size[::-1]) for var in masks}
+
+    try:
+        points, values = gates
+        gridded, _ = grid_fields(
+            points, {"DBZH": values}, size=(4, 3, 2), method="zeros", **GRID
+        )
+        assert gridded["DBZH"].shape == (2, 3, 4)
+    finally:
+        _ENGINES.pop("zeros")
+
+
+@pytest.mark.parametrize("method", ["nearest", "cressman", "idw", "bin"])
+def test_grid_radar_methods(sweep_tree, method):
+    """`grid_radar` grids with every engine without fastbarnes."""
+    dtree = sweep_tree(nrays=90, ngates=40)
+    gridded_ds = grid_radar(
+        dtree,
+        data_vars=["DBZH", "VRADH"],
+        x_lim=(-5e3, 5e3),
+        y_lim=(-5e3, 5e3),
+        z_lim=(0, 1e3),
+        x_step=500,
+        y_step=500,
+        z_step=250,
+        x_smth=1,
+        y_smth=1,
+        geo=False,
+        method=method,
+    )
+    assert gridded_ds["DBZH"].shape == (5, 21, 21), "Gridded shape mismatch"
+    assert np.isfinite(gridded_ds["VRADH"].values).any(), "No finite values"
+
+
+def test_grid_radar_cressman_cache(sweep_tree):
+    """Operator based engines give the same result with the cache."""
+    dtree = sweep_tree(nrays=90, ngates=40)
+    kwargs = dict(
+        data_vars=["DBZH"],
+        x_lim=(-5e3, 5e3),
+        y_lim=(-5e3, 5e3),
+        z_lim=(0, 1e3),
+        x_step=500,
+        y_step=500,
+        x_smth=1,
+        y_smth=1,
+        geo=False,
+        method="cressman",
+        engine_kwargs={"max_dist": 2},
+    )
+    cache = OperatorCache()
+    cached_ds = grid_radar(dtree, cache=cache, **kwargs)
+    assert len(cache) == 1, "Operator should be cached"
+    xr.testing.assert_allclose(cached_ds, grid_radar(dtree, **kwargs))
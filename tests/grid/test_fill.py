@@ -0,0 +1,71 @@
+#!/usr/bin/env python
+# Copyright (c) 2024-2025, Radarx developers.
+# Distributed under the MIT License. See LICENSE for more info.
+
+import numpy as np
+import pytest
+
+from radarx.grid import fill_vertical
+
+
+@pytest.fixture
+def column_field():
+    """Fixture with a single column containing two echoes and gaps."""
+    field = np.full((6, 1, 1), np.nan)
+    field[2] = 10.0
+    field[4] = 20.0
+    return field
+
+
+def test_fill_vertical_matches_level_loop():
+    """The vectorised fill reproduces the level-by-level pseudo-CAPPI loop."""
+    rng = np.random.default_rng(1)
+    field = rng.normal(size=(12, 20, 30))
+    field[rng.random(field.shape) < 0.5] = np.nan
+
+    expected = field.copy()
+    for z_idx in range(len(expected) - 2, -1, -1):
+        mask = np.isnan(expected[z_idx])
+        expected[z_idx, mask] = expected[z_idx + 1, mask]
+
+    missing = np.isnan(field)
+    filled = fill_vertical(field)
+    np.testing.assert_array_equal(field, expected)
+    np.testing.assert_array_equal(filled, missing & np.isfinite(field))
+
+
+def test_fill_vertical_nearest_above(column_field):
+    """Gaps are filled from the nearest valid level above."""
+    filled = fill_vertical(column_field)
+    np.testing.assert_array_equal(
+        column_field[:, 0, 0], [10.0, 10.0, 10.0, 20.0, 20.0, np.nan]
+    )
+    np.testing.assert_array_equal(
+        filled[:, 0, 0], [True, True, False, True, False, False]
+    )
+
+
+def test_fill_vertical_lowest_valid(column_field):
+    """Only cells below the lowest echo are filled."""
+    filled = fill_vertical(column_field, method="lowest_valid")
+    np.testing.assert_array_equal(
+        column_field[:, 0, 0], [10.0, 10.0, 10.0, np.nan, 20.0, np.nan]
+    )
+    assert filled.sum() == 2, "Expected two filled cells"
+
+
+def test_fill_vertical_max_depth(column_field):
+    """Cells deeper than `max_depth` below their source stay missing."""
+    z = np.arange(6) * 500.0
+    fill_vertical(column_field, z=z, max_depth=500.0)
+    np.testing.assert_array_equal(
+        column_field[:, 0, 0], [np.nan, 10.0, 10.0, 20.0, 20.0, np.nan]
+    )
+
+
+def test_fill_vertical_invalid_arguments(column_field):
+    """Unknown methods and `max_depth` without heights are rejected."""
+    with pytest.raises(ValueError):
+        fill_vertical(column_field, method="linear")
+    with pytest.raises(ValueError):
+        fill_vertical(column_field, max_depth=500.0)
@@ -2,13 +2,14 @@
 # Copyright (c) 2024-2025, Radarx developers.
 # Distributed under the MIT License. See LICENSE for more info.
 
+import numpy as np
 import pytest
 import xarray as xr
-import numpy as np
 import xradar as xd
-from radarx.grid import stack_data, make_3d_grid, grid_radar
 from open_radar_data import DATASETS
 
+from radarx.grid import OperatorCache, grid_radar, make_3d_grid, stack_data
+
 
 @pytest.fixture
 def mock_dtree():
@@ -36,6 +37,53 @@ def test_stack_data(mock_dtree):
     ), "'xyz' coordinate does not have three dimensions"
 
 
+def test_stack_data_without_multiindex(mock_dtree):
+    """Test the `stack_data` fast path without MultiIndex."""
+    stacked_ds = stack_data(mock_dtree, data_vars=["DBZH"], multiindex=False)
+    indexed_ds = stack_data(mock_dtree, data_vars=["DBZH"])
+    # Assertions
+    assert "npoints" not in stacked_ds.indexes, "MultiIndex should not be built"
+    assert stacked_ds["xyz"].dtype == np.float32, "Coordinates should be float32"
+    assert stacked_ds["time"].ndim == 0, "Expected a scalar mean time"
+    np.testing.assert_array_equal(stacked_ds["DBZH"].values, indexed_ds["DBZH"].values)
+    np.testing.assert_array_equal(stacked_ds["xyz"].values, indexed_ds["xyz"].values)
+
+
+def test_stack_data_bounds(sweep_tree):
+    """Test that `stack_data` drops range tails outside the bounds."""
+    dtree = sweep_tree(ngates=80)
+    bounds = ((-5e3, 5e3), (-5e3, 5e3), (0, 10e3))
+    stacked_ds = stack_data(dtree, data_vars=["DBZH"], bounds=bounds)
+    # Assertions
+    kept = stacked_ds.attrs["gates_per_sweep"]
+    assert len(kept) == 2, "Expected kept gate counts for each sweep"
+    assert sum(kept) == stacked_ds.sizes["npoints"], "Gate count mismatch"
+    assert all(n < 36 * 80 for n in kept), "Range tails should be dropped"
+    ground = np.hypot(stacked_ds["xyz"][:, 0], stacked_ds["xyz"][:, 1])
+    assert ground.max() < 5e3 * np.sqrt(2) + 250, "Gates beyond the domain kept"
+
+
+def test_grid_radar_cull(sweep_tree):
+    """Culling gates does not change the gridded result."""
+    dtree = sweep_tree(nrays=90, ngates=120)
+    kwargs = dict(
+        data_vars=["DBZH"],
+        x_lim=(-5e3, 5e3),
+        y_lim=(-5e3, 5e3),
+        z_lim=(0, 1e3),
+        x_step=500,
+        y_step=500,
+        z_step=250,
+        x_smth=1,
+        y_smth=1,
+        geo=False,
+        cache=OperatorCache(),
+    )
+    culled_ds = grid_radar(dtree, cull=True, **kwargs)
+    full_ds = grid_radar(dtree, cull=False, **kwargs)
+    xr.testing.assert_allclose(culled_ds, full_ds)
+
+
 def test_make_3d_grid(mock_dtree):
     """Test `make_3d_grid` function."""
     ds = mock_dtree["sweep_0"].to_dataset()
@@ -83,5 +131,29 @@ def test_grid_radar(mock_dtree):
     ).any(), "No finite values in gridded data"
 
 
+def test_grid_radar_native(mock_dtree):
+    """Test `grid_radar` on the native AEQD grid."""
+    gridded_ds = grid_radar(
+        mock_dtree,
+        data_vars=["DBZH"],
+        x_lim=(-50e3, 50e3),
+        y_lim=(-50e3, 50e3),
+        z_lim=(0, 5e3),
+        x_step=2000,
+        y_step=2000,
+        z_step=1000,
+        geo=False,
+    )
+    # Assertions
+    assert gridded_ds["DBZH"].dims == ("z", "y", "x"), "Unexpected dimensions"
+    assert gridded_ds["DBZH"].shape == (6, 51, 51), "Gridded dataset shape mismatch"
+    assert gridded_ds["lon"].dims == ("y", "x"), "'lon' should be 2-D"
+    assert gridded_ds["lat"].dims == ("y", "x"), "'lat' should be 2-D"
+    np.testing.assert_allclose(np.diff(gridded_ds["x"].values), 2000)
+    assert np.isfinite(
+        gridded_ds["DBZH"].values
+    ).any(), "No finite values in gridded data"
+
+
 if __name__ == "__main__":
     pytest.main()
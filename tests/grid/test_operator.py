@@ -0,0 +1,184 @@
+#!/usr/bin/env python
+# Copyright (c) 2024-2025, Radarx developers.
+# Distributed under the MIT License. See LICENSE for more info.
+
+import numpy as np
+import pytest
+import xarray as xr
+
+from radarx.grid import (
+    GridOperator,
+    OperatorCache,
+    build_grid_operator,
+    get_grid_operator,
+    grid_radar,
+    load_grid_operator,
+    operator_key,
+)
+from radarx.grid.operator import _ray_order
+
+
+@pytest.fixture
+def gates():
+    """Fixture with random gate positions inside a small grid."""
+    rng = np.random.default_rng(42)
+    return rng.uniform([0, 0, 0], [10, 8, 4], size=(5000, 3))
+
+
+@pytest.fixture
+def operator(gates):
+    """Fixture building an operator on an 11 x 9 x 5 unit grid."""
+    return build_grid_operator(
+        gates, sigma=[1.0, 1.0, 1.0], x0=[0, 0, 0], step=[1, 1, 1], size=(11, 9, 5)
+    )
+
+
+def _jittered(dtree, seed=0):
+    """Copy of a DataTree with rotated and jittered ray azimuths."""
+    rng = np.random.default_rng(seed)
+    dtree = dtree.copy()
+    for swp in dtree.match("sweep_*"):
+        ds = dtree[swp].to_dataset(inherit=False).roll(azimuth=7, roll_coords=True)
+        azimuth = ds["azimuth"].values + rng.uniform(-1.0, 1.0, ds.sizes["azimuth"])
+        dtree[swp] = ds.assign_coords(azimuth=np.mod(azimuth, 360.0))
+    return dtree
+
+
+def test_build_grid_operator(operator, gates):
+    """Test shape and weights of `build_grid_operator`."""
+    assert isinstance(operator, GridOperator), "Expected a GridOperator"
+    assert operator.grid_shape == (5, 9, 11), "Grid shape should be (z, y, x)"
+    assert operator.ngates == len(gates), "Operator column count mismatch"
+    assert operator.weights.max() <= 1.0, "Gaussian weights must not exceed 1"
+
+
+def test_apply_constant_field(operator):
+    """A constant field must be reproduced exactly on covered cells."""
+    field = operator.apply(np.full(operator.ngates, 7.5))
+    assert field.shape == operator.grid_shape, "Gridded field shape mismatch"
+    assert np.allclose(field[np.isfinite(field)], 7.5), "Constant field changed"
+
+
+def test_apply_handles_missing_values(operator):
+    """NaN gates are ignored and multiple fields are gridded at once."""
+    values = np.ones((operator.ngates, 2))
+    values[::2, 1] = np.nan
+    fields = operator.apply(values)
+    assert fields.shape == (2,) + operator.grid_shape, "Batched shape mismatch"
+    assert np.allclose(fields[1][np.isfinite(fields[1])], 1.0), "NaN leaked in"
+
+    with pytest.raises(ValueError):
+        operator.apply(np.ones(operator.ngates + 1))
+
+
+@pytest.mark.parametrize("name", ["operator.npz", "operator"])
+def test_save_and_load(operator, tmp_path, name):
+    """Operators round-trip through `.npz` and memory-mapped directories."""
+    path = tmp_path / name
+    operator.save(path)
+    loaded = load_grid_operator(path, mmap_mode="r")
+    values = np.arange(operator.ngates, dtype=float)
+    np.testing.assert_allclose(loaded.apply(values), operator.apply(values))
+    assert loaded.grid_shape == operator.grid_shape, "Grid shape not restored"
+
+
+def test_operator_cache_lru(operator):
+    """The in-memory cache evicts the least recently used operator."""
+    cache = OperatorCache(maxsize=2)
+    cache.put("a", operator)
+    cache.put("b", operator)
+    assert cache.get("a") is operator, "Cached operator not returned"
+    cache.put("c", operator)
+    assert "b" not in cache, "Least recently used operator not evicted"
+    assert "a" in cache and "c" in cache, "Recently used operators evicted"
+    assert cache.get("missing") is None, "Cache miss should return None"
+
+
+def test_operator_cache_disk(operator, tmp_path):
+    """Operators stored in a cache directory are reused by other caches."""
+    calls = []
+
+    def builder():
+        calls.append(1)
+        return operator
+
+    first = OperatorCache(cache_dir=tmp_path)
+    get_grid_operator("geom", builder, cache=first)
+    second = OperatorCache(cache_dir=tmp_path)
+    loaded = get_grid_operator("geom", builder, cache=second)
+    assert len(calls) == 1, "Operator should be built only once"
+    assert loaded.key == "geom", "Operator key not persisted"
+
+
+def test_operator_key(sweep_tree):
+    """Keys depend on scan geometry and grid arguments only."""
+    key = operator_key(sweep_tree(), x_step=1000)
+    assert key == operator_key(sweep_tree(), x_step=1000), "Key is not stable"
+    assert key != operator_key(sweep_tree(), x_step=500), "Grid args ignored"
+    assert key != operator_key(
+        sweep_tree(elevations=(0.5, 2.5)), x_step=1000
+    ), "Sweep elevations ignored"
+    assert key != operator_key(sweep_tree(nrays=72), x_step=1000), "Azimuths ignored"
+
+
+def test_operator_key_scan_strategy(sweep_tree):
+    """Keys ignore ray jitter and the start azimuth of the sweeps."""
+    dtree = sweep_tree(nrays=90)
+    jittered = _jittered(dtree)
+    assert operator_key(dtree) == operator_key(jittered), "Ray jitter in key"
+    azimuth = jittered["sweep_0"]["azimuth"].values
+    offset = azimuth[_ray_order(azimuth)] - dtree["sweep_0"]["azimuth"].values
+    assert np.all(np.abs((offset + 180) % 360 - 180) <= 1), "Rays out of order"
+
+
+def test_grid_radar_with_cache(sweep_tree):
+    """`grid_radar` reuses the cached operator and reports timings."""
+    dtree = sweep_tree(nrays=90, ngates=40)
+    kwargs = dict(
+        data_vars=["DBZH", "VRADH"],
+        x_lim=(-5e3, 5e3),
+        y_lim=(-5e3, 5e3),
+        z_lim=(0, 1e3),
+        x_step=500,
+        y_step=500,
+        z_step=250,
+        x_smth=1,
+        y_smth=1,
+        cache=OperatorCache(),
+    )
+    gridded_ds, timings = grid_radar(dtree, return_timings=True, **kwargs)
+    assert gridded_ds["DBZH"].shape == (5, 21, 21), "Gridded shape mismatch"
+    assert np.isfinite(gridded_ds["DBZH"].values).any(), "No finite values"
+    assert set(timings) == {"DBZH+VRADH"}, "Expected one timing of the pass"
+    assert len(kwargs["cache"]) == 1, "Operator should be cached"
+
+    regridded_ds = grid_radar(dtree, **kwargs)
+    xr.testing.assert_allclose(gridded_ds, regridded_ds)
+
+
+def test_grid_radar_cache_rotated_rays(sweep_tree):
+    """Volumes starting at other azimuths or jittering share the operator."""
+    dtree = sweep_tree(nrays=90, ngates=40)
+    rotated = dtree.copy()
+    rotated["sweep_0"] = (
+        dtree["sweep_0"].to_dataset().roll(azimuth=30, roll_coords=True)
+    )
+    kwargs = dict(
+        data_vars=["DBZH"],
+        x_lim=(-5e3, 5e3),
+        y_lim=(-5e3, 5e3),
+        z_lim=(0, 1e3),
+        x_step=500,
+        y_step=500,
+        z_step=250,
+        x_smth=1,
+        y_smth=1,
+    )
+    cache = OperatorCache()
+    expected = grid_radar(dtree, cache=cache, **kwargs)
+    cached = grid_radar(rotated, cache=cache, **kwargs)
+    assert len(cache) == 1, "Expected the operator to be reused"
+    xr.testing.assert_allclose(cached, expected)
+
+    grid_radar(_jittered(dtree), cache=cache, **kwargs)
+    assert len(cache) == 1, "Expected the operator to be reused"
@@ -0,0 +1,73 @@
+#!/usr/bin/env python
+# Copyright (c) 2024-2025, Radarx developers.
+# Distributed under the MIT License. See LICENSE for more info.
+
+import numpy as np
+import pytest
+import xarray as xr
+
+from radarx.grid import grid_product, grid_radar
+
+LIMITS = dict(x_lim=(-5e3, 5e3), y_lim=(-5e3, 5e3), x_step=500, y_step=500)
+
+
+@pytest.fixture
+def dtree(sweep_tree):
+    return sweep_tree(nrays=90, ngates=40)
+
+
+@pytest.mark.parametrize("product", ["max", "mean"])
+def test_grid_product_matches_binned_volume(dtree, product):
+    """Column products equal the reduction of the binned 3-D volume."""
+    ds = grid_product(dtree, data_vars=["DBZH"], product=product, **LIMITS)
+    assert ds["DBZH"].dims == ("y", "x"), "Unexpected dimensions"
+    assert "lon" in ds.coords and "lat" in ds.coords, "Geocoordinates missing"
+    assert np.isfinite(ds["DBZH"].values).any(), "No finite values"
+    if product == "max":
+        volume_ds = grid_radar(
+            dtree,
+            data_vars=["DBZH"],
+            pseudo_cappi=False,
+            z_lim=(0, 2e3),
+            z_step=250,
+            geo=False,
+            method="bin",
+            engine_kwargs={"statistic": "max"},
+            **LIMITS,
+        )
+        np.testing.assert_allclose(
+            ds["DBZH"].values, volume_ds["DBZH"].max("z").values, rtol=1e-6
+        )
+
+
+def test_grid_product_lowest_and_cappi(dtree):
+    """Height based products select gates of the expected sweep."""
+    lowest_ds = grid_product(dtree, data_vars=["DBZH"], product="lowest", **LIMITS)
+    sweep_0 = dtree["sweep_0"]["DBZH"].values.astype(np.float32)
+    values = lowest_ds["DBZH"].values
+    assert np.isin(values[np.isfinite(values)], sweep_0).all(), "Not the lowest"
+
+    # only the upper sweep reaches 200-300 m within the domain
+    cappi_ds = grid_product(
+        dtree, data_vars=["DBZH"], product="cappi", height=250, max_dz=50, **LIMITS
+    )
+    values = cappi_ds["DBZH"].values
+    sweep_1 = dtree["sweep_1"]["DBZH"].values.astype(np.float32)
+    assert np.isfinite(values).any(), "CAPPI is empty"
+    assert np.isin(values[np.isfinite(values)], sweep_1).all(), "Wrong sweep"
+    assert cappi_ds.attrs["product_height"] == 250
+
+
+def test_to_product_accessor_defaults(dtree):
+    """The accessor grids on the same default grid as `grid_product`."""
+    xr.testing.assert_identical(
+        dtree.radarx.to_product(data_vars=["DBZH"]),
+        grid_product(dtree, data_vars=["DBZH"]),
+    )
+
+
+def test_grid_product_invalid_arguments(dtree):
+    with pytest.raises(ValueError, match="Unknown product"):
+        grid_product(dtree, product="median")
+    with pytest.raises(ValueError, match="height"):
+        grid_product(dtree, product="cappi")
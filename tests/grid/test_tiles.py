@@ -0,0 +1,73 @@
+#!/usr/bin/env python
+# Copyright (c) 2024-2025, Radarx developers.
+# Distributed under the MIT License. See LICENSE for more info.
+
+import numpy as np
+import pytest
+
+from radarx.grid import grid_radar, grid_radar_tiled, tile_slices, tiles
+
+pytest.importorskip("dask")
+
+GRID_KWARGS = dict(
+    data_vars=["DBZH", "VRADH"],
+    x_lim=(-5e3, 5e3),
+    y_lim=(-5e3, 5e3),
+    z_lim=(0, 1e3),
+    x_step=500,
+    y_step=500,
+    z_step=250,
+    x_smth=1,
+    y_smth=1,
+    method="cressman",
+)
+
+
+def test_tile_slices():
+    """Tiles cover the grid exactly once."""
+    tiles = tile_slices(21, 10, (8, 4))
+    assert len(tiles) == 9, "Unexpected number of tiles"
+    covered = np.zeros((10, 21), dtype=int)
+    for ys, xs in tiles:
+        covered[ys, xs] += 1
+    assert np.all(covered == 1), "Tiles overlap or leave gaps"
+
+
+def test_grid_radar_tiled_is_seamless(sweep_tree):
+    """Tiled gridding matches gridding the whole domain at once."""
+    dtree = sweep_tree(nrays=90, ngates=40)
+    tiled_ds = grid_radar_tiled(dtree, tile_size=(8, 6), **GRID_KWARGS)
+    assert tiled_ds["DBZH"].chunks == ((5,), (6, 6, 6, 3), (8, 8, 5))
+    full_ds = grid_radar(dtree, geo=False, **GRID_KWARGS)
+    for var in ("DBZH", "VRADH"):
+        np.testing.assert_allclose(tiled_ds[var].values, full_ds[var].values, rtol=1e-5)
+    np.testing.assert_allclose(tiled_ds["lon"].values, full_ds["lon"].values)
+
+
+def test_grid_radar_tiled_selects_in_tasks(sweep_tree, monkeypatch):
+    """Tile gates are selected by the tasks, not when building the graph."""
+    calls = []
+    tile_args = tiles._tile_args
+
+    def spy(*args):
+        calls.append(args[2:4])
+        return tile_args(*args)
+
+    monkeypatch.setattr(tiles, "_tile_args", spy)
+    dtree = sweep_tree(nrays=90, ngates=40)
+    tiled_ds = grid_radar_tiled(dtree, tile_size=(8, 6), **GRID_KWARGS)
+    assert not calls, "Tile inputs built before computing"
+    tiled_ds.compute()
+    assert len(calls) == 12, "Expected one selection per tile"
+
+
+def test_grid_radar_tiled_zarr(sweep_tree, tmp_path):
+    """Tiles are written to a Zarr store."""
+    pytest.importorskip("zarr")
+    dtree = sweep_tree(nrays=90, ngates=40)
+    store = str(tmp_path / "grid.zarr")
+    tiled_ds = grid_radar_tiled(
+        dtree, tile_size=10, store=store, max_workers=2, **GRID_KWARGS
+    )
+    lazy_ds = grid_radar_tiled(dtree, tile_size=10, **GRID_KWARGS)
+    np.testing.assert_allclose(tiled_ds["DBZH"].values, lazy_ds["DBZH"].values)
@@ -0,0 +1,133 @@
+#!/usr/bin/env python
+# Copyright (c) 2024-2025, Radarx developers.
+# Distributed under the MIT License. See LICENSE for more info.
+
+import hashlib
+import io
+import threading
+
+import botocore.exceptions
+import numpy as np
+import pandas as pd
+import pytest
+import xarray as xr
+
+
+def write_imd_sweep(path, elevation, number, start, nrays=36, ngates=50, packed=False):
+    """
+    Write a minimal IMD-style single sweep NetCDF file.
+
+    With ``packed``, the moments are stored as scaled 16 bit integers.
+    """
+    rng = np.random.default_rng(number)
+    start = pd.Timestamp(start)
+    ray_time = start + pd.to_timedelta(np.arange(nrays), "s")
+    moments = {
+        m: (("radial", "bin"), rng.normal(10, 5, (nrays, ngates)).astype("f4"))
+        for m in ("T", "Z", "V", "W")
+    }
+    ds = xr.Dataset(
+        {
+            "siteLat": 15.5,
+            "siteLon": 73.8,
+            "siteAlt": 50.0,
+            "firstGateRange": 150.0,
+            "gateSize": 300.0,
+            "nyquist": 25.0,
+            "unambigRange": 250.0,
+            "angleResolution": 1.0,
+            "scanType": np.int32(4),
+            "elevationNumber": np.int32(number),
+            "elevationAngle": np.float32(elevation),
+            "esStartTime": start,
+            "radialAzim": (
+                "radial",
+                np.linspace(0, 360, nrays, endpoint=False).astype("f4"),
+            ),
+            "radialElev": ("radial", np.full(nrays, elevation, dtype="f4")),
+            "radialTime": ("radial", ray_time.values),
+            **moments,
+        }
+    )
+    encoding = {}
+    if packed:
+        packing = {"dtype": "i2", "scale_factor": 0.01, "add_offset": 0.0}
+        encoding = {m: dict(packing, _FillValue=-32768) for m in moments}
+    ds.to_netcdf(path, encoding=encoding)
+    return str(path)
+
+
+@pytest.fixture
+def imd_files(tmp_path):
+    """
+    Factory writing IMD-style volumes of sweep files to a temporary directory.
+
+    Files are named like the IMD archive, ``GOA<yymmddHHMMSS>-IMD-C.nc`` for
+    the first sweep of a volume and ``.nc.<n>`` for the following ones.
+    """
+
+    def factory(
+        nvolumes=2, elevations=(0.5, 1.5), start="2024-01-01 00:00", packed=False
+    ):
+        files = []
+        for v in range(nvolumes):
+            vol_start = pd.Timestamp(start) + pd.Timedelta(minutes=10 * v)
+            stem = f"GOA{vol_start:%y%m%d%H%M%S}-IMD-C.nc"
+            for n, elev in enumerate(elevations):
+                name = stem if n == 0 else f"{stem}.{n}"
+                files.append(
+                    write_imd_sweep(
+                        tmp_path / name,
+                        elev,
+                        n,
+                        vol_start + pd.Timedelta(minutes=n),
+                        packed=packed,
+                    )
+                )
+        return files
+
+    return factory
+
+
+class FakeS3:
+    """In-memory S3 stand-in serving ranged GETs, with injected failures."""
+
+    def __init__(self, objects, failures=0):
+        self.objects = objects
+        self.failures = failures
+        self.ranges = []
+        self._lock = threading.Lock()
+
+    def head_object(self, Bucket, Key):
+        if Key not in self.objects:
+            raise botocore.exceptions.ClientError(
+                {"Error": {"Code": "404"}, "ResponseMetadata": {"HTTPStatusCode": 404}},
+                "HeadObject",
+            )
+        return {"ContentLength": len(self.objects[Key]), "ETag": self.etag(Key)}
+
+    def etag(self, Key):
+        return f'"{hashlib.md5(self.objects[Key]).hexdigest()}"'
+
+    def get_object(self, Bucket, Key, Range, IfMatch=None):
+        with self._lock:
+            if self.failures:
+                self.failures -= 1
+                raise botocore.exceptions.EndpointConnectionError(endpoint_url="s3")
+            if IfMatch is not None and IfMatch != self.etag(Key):
+                raise botocore.exceptions.ClientError(
+                    {
+                        "Error": {"Code": "PreconditionFailed"},
+                        "ResponseMetadata": {"HTTPStatusCode": 412},
+                    },
+                    "GetObject",
+                )
+            self.ranges.append((Key, Range))
+        start, end = map(int, Range.removeprefix("bytes=").split("-"))
+        return {"Body": io.BytesIO(self.objects[Key][start : end + 1])}
+
+
+@pytest.fixture
+def fake_s3():
+    """The in-memory S3 stand-in class, see :class:`FakeS3`."""
+    return FakeS3
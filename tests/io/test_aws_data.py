@@ -1,6 +1,43 @@
-import pytest
+import io
+import mmap
 import os
-from radarx.io.aws_data import AWS_BUCKETS, list_available_files, download_file
+from concurrent.futures import ThreadPoolExecutor
+
+import botocore.session
+import pytest
+import xarray as xr
+from botocore import UNSIGNED
+from botocore.config import Config
+from botocore.stub import Stubber
+
+from radarx.io import read_sweep
+from radarx.io.aws_data import (
+    AWS_BUCKETS,
+    clear_s3_clients,
+    download_file,
+    download_files,
+    get_s3_client,
+    list_available_files,
+    list_prefixes,
+    open_remote,
+)
+
+
+@pytest.fixture
+def s3_client():
+    """Anonymous S3 client without network access, to be stubbed."""
+    return botocore.session.get_session().create_client(
+        "s3", region_name="us-east-1", config=Config(signature_version=UNSIGNED)
+    )
+
+
+def _listing(keys, token=None):
+    """A `list_objects_v2` response page."""
+    response = {"Contents": [{"Key": key} for key in keys], "KeyCount": len(keys)}
+    response["IsTruncated"] = token is not None
+    if token is not None:
+        response["NextContinuationToken"] = token
+    return response
 
 
 # Fixture for creating temporary directories for file downloads
@@ -84,3 +121,184 @@ def test_download_file_invalid_key(temp_download_dir):
     assert (
         downloaded_file is None
     ), "Download should return None for an invalid file key."
+
+
+def test_list_available_files_pagination(s3_client):
+    """Test that all pages of a listing are followed."""
+    bucket, prefix = AWS_BUCKETS["NEXRAD_ARCHIVE"], "2016/10/06/KAMX/"
+    first = [f"{prefix}KAMX_{i:04d}" for i in range(1000)]
+    with Stubber(s3_client) as stubber:
+        stubber.add_response(
+            "list_objects_v2",
+            _listing(first, token="page-2"),
+            {"Bucket": bucket, "Prefix": prefix},
+        )
+        stubber.add_response(
+            "list_objects_v2",
+            _listing([f"{prefix}KAMX_1000"]),
+            {"Bucket": bucket, "Prefix": prefix, "ContinuationToken": "page-2"},
+        )
+        files = list_available_files(bucket, prefix, client=s3_client)
+        stubber.assert_no_pending_responses()
+    assert files == first + [f"{prefix}KAMX_1000"]
+
+
+def test_list_available_files_client_error(s3_client):
+    """Test that errors are reported and give no files."""
+    with Stubber(s3_client) as stubber:
+        stubber.add_client_error("list_objects_v2", service_error_code="NoSuchBucket")
+        assert list_available_files("missing", "a/", client=s3_client) == []
+
+
+@pytest.mark.parametrize("max_workers", [1, 4])
+def test_list_prefixes(s3_client, max_workers):
+    """Test that many prefixes are listed and merged in prefix order."""
+    bucket = AWS_BUCKETS["NEXRAD_ARCHIVE"]
+    prefixes = [f"2016/10/{day:02d}/KAMX/" for day in range(1, 6)]
+    with Stubber(s3_client) as stubber:
+        for prefix in prefixes:
+            stubber.add_response(
+                "list_objects_v2",
+                _listing([f"{prefix}a", f"{prefix}b"]),
+                None if max_workers > 1 else {"Bucket": bucket, "Prefix": prefix},
+            )
+        files = list_prefixes(
+            bucket, prefixes, max_workers=max_workers, client=s3_client
+        )
+        stubber.assert_no_pending_responses()
+    assert len(files) == 10 and len(set(files)) == 10
+    if max_workers == 1:
+        assert files == [f"{p}{k}" for p in prefixes for k in "ab"]
+
+
+def test_download_files(tmp_path, fake_s3):
+    """Test ranged, concurrent downloads with retries and progress."""
+    objects = {f"day/file_{i}": os.urandom(1000 + i) for i in range(6)}
+    s3 = fake_s3(objects, failures=2)
+    progress = []
+    paths = download_files(
+        "bucket",
+        [*objects, "day/missing"],
+        tmp_path,
+        max_workers=3,
+        backoff=0,
+        chunk_size=256,
+        progress=lambda *args: progress.append(args),
+        client=s3,
+    )
+    assert paths[-1] is None, "A missing key should fail"
+    for key, path in zip(objects, paths):
+        with open(path, "rb") as f:
+            assert f.read() == objects[key], f"Corrupt download of {key}"
+    assert len(s3.ranges) == 6 * 4, "Expected four ranged parts per file"
+    assert ("day/file_0", 1000, 1000) in progress, "Progress not reported"
+    assert not list(tmp_path.glob("*.part")), "Partial files left behind"
+
+
+def test_download_files_resume(tmp_path, fake_s3):
+    """Test that partial downloads resume and complete ones are skipped."""
+    objects = {"a/done": os.urandom(300), "a/partial": os.urandom(1000)}
+    (tmp_path / "done").write_bytes(objects["a/done"])
+    (tmp_path / "partial.part").write_bytes(objects["a/partial"][:600])
+    s3 = fake_s3(objects)
+    (tmp_path / "partial.part.etag").write_text(s3.etag("a/partial"))
+    paths = download_files("bucket", list(objects), tmp_path, client=s3)
+    assert s3.ranges == [("a/partial", "bytes=600-999")], "Expected one range"
+    assert (tmp_path / "partial").read_bytes() == objects["a/partial"]
+    assert paths == [str(tmp_path / "done"), str(tmp_path / "partial")]
+    assert not list(tmp_path.glob("*.etag")), "ETag file left behind"
+
+
+def test_download_files_resume_changed(tmp_path, fake_s3):
+    """Test that a partial file of an overwritten object is discarded."""
+    objects = {"a/partial": os.urandom(1000)}
+    (tmp_path / "partial.part").write_bytes(os.urandom(600))
+    (tmp_path / "partial.part.etag").write_text('"old"')
+    s3 = fake_s3(objects)
+    download_files("bucket", list(objects), tmp_path, chunk_size=500, client=s3)
+    assert s3.ranges[0] == ("a/partial", "bytes=0-499"), "Expected a new download"
+    assert (tmp_path / "partial").read_bytes() == objects["a/partial"]
+
+
+def test_download_files_changed_during_download(tmp_path, fake_s3):
+    """Test that an object overwritten between parts is downloaded again."""
+    objects = {"a/file": os.urandom(1000)}
+    new = os.urandom(1000)
+
+    def progress(key, done, total):
+        if done == 500:
+            objects["a/file"] = new
+
+    s3 = fake_s3(objects)
+    paths = download_files(
+        "bucket", ["a/file"], tmp_path, chunk_size=500, progress=progress, client=s3
+    )
+    assert (tmp_path / "file").read_bytes() == new, "Mixed object versions"
+    assert paths == [str(tmp_path / "file")]
+    assert len(s3.ranges) == 3, "Expected a restart after the first part"
+
+
+def test_download_files_gives_up(tmp_path, fake_s3):
+    """Test that persistent errors fail the file after the retries."""
+    s3 = fake_s3({"a/file": b"data"}, failures=10)
+    paths = download_files(
+        "bucket", ["a/file"], tmp_path, retries=2, backoff=0, client=s3
+    )
+    assert paths == [None] and s3.failures == 7, "Expected three attempts"
+
+
+@pytest.mark.parametrize("max_memory", [None, 1000])
+def test_open_remote(imd_files, fake_s3, max_memory):
+    """Test reading a sweep from S3 in memory or from a mapped spool file."""
+    file = imd_files(nvolumes=1)[0]
+    with open(file, "rb") as f:
+        s3 = fake_s3({"goa/sweep.nc": f.read()})
+    buffer = open_remote(
+        "bucket", "goa/sweep.nc", max_memory=max_memory, chunk_size=4096, client=s3
+    )
+    assert isinstance(buffer, io.BytesIO if max_memory is None else mmap.mmap)
+    assert buffer.read() == s3.objects["goa/sweep.nc"], "Corrupt buffer"
+    ds = open_remote(
+        "bucket", "goa/sweep.nc", max_memory=max_memory, reader=read_sweep, client=s3
+    )
+    xr.testing.assert_identical(ds.load(), read_sweep(file).load())
+
+
+def test_download_files_moto(tmp_path):
+    """Test bulk downloads against a moto S3 stand-in."""
+    moto = pytest.importorskip("moto")
+    import boto3
+
+    with moto.mock_aws():
+        s3 = boto3.client("s3", region_name="us-east-1")
+        s3.create_bucket(Bucket="radar")
+        objects = {f"2016/10/06/KAMX/KAMX_{i}": os.urandom(5000) for i in range(4)}
+        for key, body in objects.items():
+            s3.put_object(Bucket="radar", Key=key, Body=body)
+        keys = list_available_files("radar", "2016/10/06/KAMX/", client=s3)
+        paths = download_files("radar", keys, tmp_path, chunk_size=2048, client=s3)
+    assert sorted(keys) == sorted(objects)
+    for key, path in zip(keys, paths):
+        with open(path, "rb") as f:
+            assert f.read() == objects[key]
+
+
+def test_get_s3_client_cache():
+    """Test that clients are shared per configuration and across threads."""
+    clear_s3_clients()
+    client = get_s3_client()
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        clients = list(executor.map(lambda _: get_s3_client(), range(8)))
+    assert all(c is client for c in clients), "Expected one shared client"
+    assert get_s3_client(region="eu-west-1") is not client
+    assert get_s3_client(endpoint_url="http://localhost:9000") is not client
+    assert get_s3_client(anonymous=False) is not client
+
+    bigger = get_s3_client(max_pool_connections=64)
+    assert bigger is not client, "A larger pool needs a new client"
+    assert bigger.meta.config.max_pool_connections == 64
+    assert get_s3_client(max_pool_connections=16) is bigger, "Pool is large enough"
+    assert bigger.meta.config.signature_version is botocore.UNSIGNED
+
+    clear_s3_clients()
+    assert get_s3_client() is not bigger, "Cache should be empty"
@@ -0,0 +1,117 @@
+#!/usr/bin/env python
+# Copyright (c) 2024-2025, Radarx developers.
+# Distributed under the MIT License. See LICENSE for more info.
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+from radarx.io import DownloadCache, download_file, download_files
+
+OBJECTS = {f"2016/10/06/KAMX/KAMX_{i}": bytes([i]) * 1000 for i in range(4)}
+
+
+def _fetch_in_process(fake_s3, directory):
+    """Fetch the same object in a worker process, returning the GET count."""
+    s3 = fake_s3(OBJECTS)
+    path = DownloadCache(directory).fetch("bucket", "2016/10/06/KAMX/KAMX_0", client=s3)
+    return path, len(s3.ranges)
+
+
+def test_cache_hit(tmp_path, fake_s3):
+    """Objects are downloaded once and then served from the cache."""
+    cache = DownloadCache(tmp_path)
+    s3 = fake_s3(OBJECTS)
+    paths = download_files("bucket", list(OBJECTS), client=s3, cache=cache)
+    assert len(s3.ranges) == 4 and len(cache) == 4 and cache.size == 4000
+    for key, path in zip(OBJECTS, paths):
+        assert os.path.basename(path) == os.path.basename(key)
+        with open(path, "rb") as f:
+            assert f.read() == OBJECTS[key], f"Corrupt cache entry of {key}"
+
+    progress = []
+    again = download_files(
+        "bucket",
+        list(OBJECTS),
+        client=s3,
+        cache=cache,
+        progress=lambda *args: progress.append(args),
+    )
+    assert again == paths and len(s3.ranges) == 4, "Expected cache hits"
+    assert len(progress) == 4, "Progress not reported on hits"
+    assert not list(tmp_path.rglob("*.part")), "Partial files left behind"
+
+
+def test_cache_etag(tmp_path, fake_s3):
+    """A changed object is downloaded again under a new entry."""
+    cache = DownloadCache(tmp_path)
+    objects = {"a/file": b"old"}
+    s3 = fake_s3(objects)
+    old = cache.fetch("bucket", "a/file", client=s3)
+    objects["a/file"] = b"new data"
+    new = cache.fetch("bucket", "a/file", client=s3)
+    assert old != new and len(s3.ranges) == 2, "Stale object served"
+    with open(new, "rb") as f:
+        assert f.read() == b"new data"
+
+
+def test_cache_lru_eviction(tmp_path, fake_s3):
+    """The least recently used objects are evicted beyond max_size."""
+    cache = DownloadCache(tmp_path, max_size=2500)
+    s3 = fake_s3(OBJECTS)
+    keys = list(OBJECTS)
+    first = cache.fetch("bucket", keys[0], client=s3)
+    second = cache.fetch("bucket", keys[1], client=s3)
+    os.utime(first, (0, 0))
+    os.utime(second, (1, 1))
+    etag = s3.head_object(Bucket="bucket", Key=keys[0])["ETag"]
+    assert cache.get("bucket", keys[0], etag) == first, "Expected a hit"
+    third = cache.fetch("bucket", keys[2], client=s3)
+    assert os.path.exists(first) and os.path.exists(third)
+    assert not os.path.exists(second), "The least recently used was kept"
+    assert cache.size == 2000
+
+    assert cache.clear() == 2 and len(cache) == 0
+
+
+def test_cache_partial_downloads(tmp_path):
+    """Partial downloads count towards the size, stale ones are evicted."""
+    cache = DownloadCache(tmp_path, max_size=10000)
+    parts = {}
+    for name in ["stale", "fresh", "locked"]:
+        digest = cache._digest("bucket", name, "etag")
+        folder = tmp_path / "objects" / digest
+        folder.mkdir()
+        (folder / f"{name}.part").write_bytes(b"x" * 1000)
+        (folder / f"{name}.part.etag").write_text("etag")
+        parts[name] = (digest, folder)
+    assert cache.size == 3012 and len(cache) == 0
+
+    for name in ["stale", "locked"]:
+        for path in parts[name][1].iterdir():
+            os.utime(path, (0, 0))
+    with cache._lock(parts["locked"][0]):
+        assert cache.evict() == 1
+    assert not parts["stale"][1].exists(), "Stale partial download kept"
+    assert (parts["fresh"][1] / "fresh.part").exists()
+    assert (parts["locked"][1] / "locked.part").exists(), "Locked download evicted"
+    assert cache.size == 2008
+
+    assert cache.clear() == 2 and cache.size == 0
+
+
+def test_cache_processes(tmp_path, fake_s3):
+    """Processes sharing a cache download an object only once."""
+    with ProcessPoolExecutor(max_workers=4) as pool:
+        results = list(pool.map(_fetch_in_process, [fake_s3] * 4, [tmp_path] * 4))
+    assert len({path for path, _ in results}) == 1
+    assert sum(count for _, count in results) == 1, "Downloaded more than once"
+
+
+def test_download_requires_target():
+    """A save_dir or a cache is required."""
+    with pytest.raises(ValueError, match="save_dir"):
+        download_file("bucket", "a/file")
+    with pytest.raises(ValueError, match="save_dir"):
+        download_files("bucket", ["a/file"])
@@ -0,0 +1,119 @@
+#!/usr/bin/env python
+# Copyright (c) 2024-2025, Radarx developers.
+# Distributed under the MIT License. See LICENSE for more info.
+
+import os
+from unittest import mock
+
+import netCDF4
+import pytest
+
+from radarx.io import SweepCatalog
+from radarx.io.imd import _determine_nsweeps
+
+
+@pytest.fixture
+def catalog(tmp_path):
+    with SweepCatalog(tmp_path / "catalog.sqlite") as catalog:
+        yield catalog
+
+
+def test_catalog_update(imd_files, catalog, tmp_path):
+    """Files are recorded with their header metadata."""
+    files = imd_files(nvolumes=2)
+    assert catalog.update(tmp_path) == 4, "Expected all files to be scanned"
+    assert len(catalog) == 4 and files[0] in catalog
+
+    record = catalog.query()[1]
+    assert record["site"] == "GOA", "Unexpected site code"
+    assert record["start_time"] == "2024-01-01T00:01:00"
+    assert record["elevation_number"] == 1
+    assert record["elevation"] == pytest.approx(1.5)
+    assert (record["nrays"], record["ngates"]) == (36, 50)
+    assert record["gate_size"] == 300.0
+
+
+def test_catalog_incremental_update(imd_files, catalog, tmp_path):
+    """Only new or changed files are scanned again."""
+    files = imd_files(nvolumes=1)
+    catalog.update(tmp_path)
+    with mock.patch(
+        "radarx.io.catalog._scan_record", side_effect=AssertionError
+    ) as scanned:
+        assert catalog.update(tmp_path) == 0
+    scanned.assert_not_called()
+
+    stat = os.stat(files[0])
+    os.utime(files[0], (stat.st_atime, stat.st_mtime + 10))
+    os.remove(files[1])
+    assert catalog.update(tmp_path) == 1, "Expected the touched file only"
+    assert len(catalog) == 1, "Removed file should be pruned"
+
+
+def test_catalog_volumes_and_time_range(imd_files, catalog, tmp_path):
+    """Volumes and time queries are answered from the index."""
+    files = imd_files(nvolumes=3)
+    catalog.update(files)
+    assert catalog.volumes() == _determine_nsweeps(files)
+    selected = catalog.files(start="2024-01-01T00:10", end="2024-01-01T00:15")
+    assert selected == files[2:4], "Unexpected files in time range"
+    assert catalog.files(site="xyz") == []
+
+
+def test_catalog_volumes_nsweeps(imd_files, catalog, tmp_path):
+    """The recorded number of sweeps groups volumes, as read_volume does."""
+    files = imd_files(nvolumes=2, elevations=(0.5, 1.5, 1.0))
+    for file in files:
+        with netCDF4.Dataset(file, "a") as nc:
+            nc.setncattr("nsweeps", 3)
+    catalog.update(tmp_path)
+    assert catalog.volumes() == [files[:3], files[3:]]
+    assert catalog.volumes() == _determine_nsweeps(files)
+
+
+def test_catalog_volumes_partial(imd_files, catalog, tmp_path):
+    """Missing sweeps and mid-volume time ranges do not shift later volumes."""
+    files = imd_files(nvolumes=3, elevations=(0.5, 1.5, 2.5))
+    for file in files:
+        with netCDF4.Dataset(file, "a") as nc:
+            nc.setncattr("nsweeps", 3)
+    os.remove(files[4])
+    catalog.update(tmp_path)
+    assert catalog.volumes() == [files[:3], [files[3], files[5]], files[6:]]
+    assert catalog.volumes(start="2024-01-01T00:01") == [
+        files[1:3],
+        [files[3], files[5]],
+        files[6:],
+    ]
+
+
+def test_catalog_time_range_inclusive(imd_files, catalog, tmp_path):
+    """Partial time bounds include sweeps starting exactly at them."""
+    files = imd_files(nvolumes=2)
+    catalog.update(tmp_path)
+    assert catalog.files(end="2024-01-01T00:10") == files[:3]
+    assert catalog.files(start="2024-01-01T00:01", end="2024-01-01T00:10") == (
+        files[1:3]
+    )
+
+
+def test_catalog_update_vanished_file(imd_files, catalog, tmp_path):
+    """Files removed while the catalog is updated are skipped."""
+    files = imd_files(nvolumes=1)
+    stat = os.stat
+
+    def vanishing(path, *args, **kwargs):
+        if path == files[0]:
+            raise FileNotFoundError(path)
+        return stat(path, *args, **kwargs)
+
+    with mock.patch("radarx.io.catalog.os.stat", side_effect=vanishing):
+        assert catalog.update(tmp_path) == 1
+    assert files[0] not in catalog and files[1] in catalog
+
+
+def test_catalog_skips_unreadable_files(catalog, tmp_path):
+    """Unreadable files are skipped with a warning."""
+    (tmp_path / "GOA240101000000-IMD-C.nc").write_bytes(b"not netcdf")
+    assert catalog.update(tmp_path) == 0
+    assert len(catalog) == 0
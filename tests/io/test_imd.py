@@ -1,26 +1,38 @@
-import pytest
+import io
+import mmap
+from concurrent.futures import ThreadPoolExecutor
 from unittest import mock
 from unittest.mock import patch
 
+import numpy as np
+import pytest
+import xarray as xr
+
 from radarx.io.imd import (
-    read_sweep,
-    read_volume,
-    _merge_file_lists,
+    LazyVolumes,
+    _angle_resolution,
+    _assign_metadata,
+    _compute_range,
+    _create_volume_concat,
+    _create_volume_fast,
+    _dataset_metadata,
     _determine_nsweeps,
     _determine_volumes,
-    create_volume,
-    _compute_range,
-    _angle_resolution,
+    _merge_file_lists,
+    _scan_header,
     _scantype,
-    _time_coverage,
     _sweep_number,
-    _assign_metadata,
+    _time_coverage,
+    create_cfradial2_volume,
+    create_volume,
+    iter_volumes,
+    read_sweep,
+    read_volume,
     to_cfradial2,
     to_cfradial2_volumes,
+    unpack,
 )
 from radarx.testing.test_data_imd import fetch_imd_test_data
-import xarray as xr
-import numpy as np
 
 
 @pytest.fixture(scope="module")
@@ -518,5 +530,339 @@ def test_to_cfradial2_volumes(imd_test_data):
     ), "Expected '/volume_0/radar_parameters' in DataTree"
 
 
+@pytest.mark.parametrize("parallel", ["processes", "threads"])
+def test_read_volume_parallel(imd_files, parallel):
+    """
+    Test that concurrent sweep decoding gives the same volumes in file order.
+    """
+    files = imd_files(nvolumes=3)
+    expected = read_volume(files)
+    if parallel == "processes":
+        vol = read_volume(files, max_workers=2)
+    else:
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            vol = read_volume(files, executor=executor)
+
+    assert list(vol.children) == ["volume_0", "volume_1", "volume_2"]
+    for name in vol.children:
+        xr.testing.assert_identical(
+            vol[name].to_dataset().load(), expected[name].to_dataset().load()
+        )
+
+
+def test_determine_volumes_parallel_fallback(mock_read_sweep, imd_files):
+    """
+    Test that the fallback to `xr.open_dataset` is kept with an executor.
+    """
+    files = imd_files(nvolumes=1)
+    sweep = xr.Dataset({"DBZ": (("time", "range"), [[1, 2], [3, 4]])})
+
+    def fake_read_sweep(file):
+        if file == files[0]:
+            raise OSError("read_sweep failed")
+        return sweep
+
+    mock_read_sweep.side_effect = fake_read_sweep
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        volumes = _determine_volumes(files, executor=executor)
+
+    assert len(volumes) == 1 and len(volumes[0]) == 2, "Unexpected grouping"
+    assert "Z" in volumes[0][0], "Expected the raw file after the fallback"
+    assert "DBZ" in volumes[0][1], "Expected the decoded second sweep"
+
+
+def test_scan_header(imd_files):
+    """
+    Test that the header scan reads the sweep metadata without xarray.
+    """
+    files = imd_files(nvolumes=1)
+    meta = _scan_header(files[1])
+    assert meta["elevation"] == pytest.approx(1.5), "Unexpected elevation"
+    assert meta["time"] == "2024-01-01T00:01:00", "Unexpected start time"
+    assert meta["nsweeps"] is None, "Unexpected nsweeps"
+    assert _dataset_metadata(read_sweep(files[1])) == meta
+
+
+@pytest.mark.parametrize("max_workers", [None, 2])
+def test_determine_nsweeps_header_scan(imd_files, max_workers):
+    """
+    Test that the elevation fallback opens only the first file with xarray.
+    """
+    files = imd_files(nvolumes=3)
+    with mock.patch("xarray.open_dataset", wraps=xr.open_dataset) as opened:
+        sweep_groups = _determine_nsweeps(files[::-1], max_workers=max_workers)
+    assert opened.call_count == 1, "Headers should not be decoded by xarray"
+    assert sweep_groups == [files[i : i + 2] for i in range(0, 6, 2)]
+
+
+def test_determine_volumes_reuses_decoded_metadata(imd_files):
+    """
+    Test that grouping reuses the decoded sweeps instead of rescanning files.
+    """
+    files = imd_files(nvolumes=2)
+    with mock.patch("radarx.io.imd._scan_header") as scanned:
+        volumes = _determine_volumes(files)
+    scanned.assert_not_called()
+    assert [len(volume) for volume in volumes] == [2, 2], "Unexpected grouping"
+
+
+def test_read_sweep_selection(imd_files):
+    """
+    Test that moments and gates are selected when the sweep is opened.
+    """
+    file = imd_files(nvolumes=1)[0]
+    ds = read_sweep(file, variables=["DBZ", "V"], max_range=3000.0)
+    assert {"DBZ", "VEL"} <= set(ds.data_vars), "Selected moments missing"
+    assert not {"DBT", "WIDTH"} & set(ds.data_vars), "Unselected moments kept"
+    assert ds.sizes["range"] == 10, "Unexpected number of gates"
+    assert ds["range"].max() <= 3000.0, "Gates beyond max_range"
+    full = read_sweep(file)
+    xr.testing.assert_identical(
+        ds["DBZ"].load(), full["DBZ"].isel(range=slice(0, 10)).load()
+    )
+
+
+@pytest.mark.parametrize("kind", ["bytes", "bytesio", "mmap"])
+def test_read_sweep_memory(imd_files, kind):
+    """
+    Test that sweeps held in memory read like the file on disk.
+    """
+    file = imd_files(nvolumes=1)[0]
+    with open(file, "rb") as f:
+        if kind == "mmap":
+            source = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        else:
+            source = f.read()
+    if kind == "bytesio":
+        source = io.BytesIO(source)
+    ds = read_sweep(source, variables=["DBZ"], max_range=3000.0).load()
+    expected = read_sweep(file, variables=["DBZ"], max_range=3000.0).load()
+    xr.testing.assert_identical(ds, expected)
+
+
+def test_read_sweep_memory_warning(imd_files, caplog):
+    """
+    Test that warnings name an in-memory sweep without dumping its content.
+    """
+    with open(imd_files(nvolumes=1)[0], "rb") as f:
+        source = f.read()
+    read_sweep(source, variables=["DBZ", "XYZ"])
+    assert "not found in bytes." in caplog.text
+    assert len(caplog.text) < 1000, "File content logged"
+
+
+def test_read_sweep_chunks(imd_files):
+    """
+    Test that the moments are dask arrays with `chunks`.
+    """
+    pytest.importorskip("dask")
+    file = imd_files(nvolumes=1)[0]
+    ds = read_sweep(file, chunks={"bin": 25})
+    assert ds["DBZ"].chunks is not None, "Expected dask-backed moments"
+    assert ds["DBZ"].chunks[1] == (25, 25), "Unexpected chunks"
+
+
+@pytest.mark.parametrize("max_workers", [None, 2])
+def test_read_volume_selection(imd_files, max_workers):
+    """
+    Test that the selection is passed on to every sweep of the volumes.
+    """
+    files = imd_files(nvolumes=2)
+    vol = read_volume(
+        files, max_workers=max_workers, variables=["DBZ"], max_range=6000.0
+    )
+    assert list(vol.children) == ["volume_0", "volume_1"]
+    for name in vol.children:
+        ds = vol[name].to_dataset()
+        assert "DBZ" in ds and "VEL" not in ds, "Unexpected moments"
+        assert ds.sizes["range"] == 20, "Unexpected number of gates"
+
+
+def test_create_volume_fast_matches_concat(imd_files):
+    """
+    Test that the preallocated volume equals the concatenated volume.
+    """
+    files = imd_files(nvolumes=1, elevations=(0.5, 1.5, 2.5))
+    sweeps = [read_sweep(file).load() for file in files]
+    sweeps[1] = sweeps[1].isel(time=slice(0, 30))
+    vol = _create_volume_fast(sweeps)
+    assert vol is not None, "Compatible sweeps should use the fast path"
+    xr.testing.assert_identical(vol, _create_volume_concat(sweeps))
+    assert vol["DBZ"].dtype == np.float32, "Moment dtype changed"
+    np.testing.assert_array_equal(vol["sweep_start_ray_index"], [0, 36, 66])
+    np.testing.assert_array_equal(vol["sweep_end_ray_index"], [35, 65, 101])
+
+
+def test_create_volume_falls_back_to_concat(imd_files):
+    """
+    Test that sweeps with different range gates are aligned by concat.
+    """
+    files = imd_files(nvolumes=1)
+    sweeps = [read_sweep(files[0]), read_sweep(files[1], max_range=6000.0)]
+    assert _create_volume_fast(sweeps) is None, "Gates differ, expected fallback"
+    vol = create_volume(sweeps)
+    assert vol.sizes["range"] == 50, "Expected the outer join of the gates"
+    assert vol["DBZ"].isel(time=slice(36, None), range=slice(20, None)).isnull().all()
+
+
+@pytest.mark.parametrize("prefetch", [True, False])
+def test_iter_volumes(imd_files, prefetch):
+    """
+    Test that volumes are yielded one by one, the same as `read_volume`.
+    """
+    files = imd_files(nvolumes=3)
+    expected = read_volume(files)
+    volumes = list(iter_volumes(files[::-1], prefetch=prefetch))
+    assert len(volumes) == 3, "Unexpected number of volumes"
+    for vol, name in zip(volumes, expected.children):
+        xr.testing.assert_identical(vol, expected[name].to_dataset().load())
+
+
+@pytest.mark.parametrize("prefetch", [True, False])
+def test_iter_volumes_empty(tmp_path, prefetch):
+    """
+    Test that no volumes are yielded without files.
+    """
+    from radarx.io import SweepCatalog
+
+    assert list(iter_volumes([], prefetch=prefetch)) == []
+    with SweepCatalog(tmp_path / "catalog.sqlite") as catalog:
+        assert list(iter_volumes(catalog, prefetch=prefetch)) == []
+
+
+def test_iter_volumes_cfradial2(imd_files, tmp_path):
+    """
+    Test CfRadial2 volumes, grouped from a sweep catalog.
+    """
+    from radarx.io import SweepCatalog
+
+    imd_files(nvolumes=2, elevations=(0.5, 1.5, 2.5))
+    with SweepCatalog(tmp_path / "catalog.sqlite") as catalog:
+        catalog.update(tmp_path)
+        volumes = iter_volumes(catalog, cfradial2=True, variables=["DBZ"])
+        first = next(volumes)
+        assert {"sweep_0", "sweep_1", "sweep_2"} <= set(first.children)
+        assert "VEL" not in first["sweep_0"].ds, "Unselected moment read"
+        assert len(list(volumes)) == 1, "Expected one more volume"
+
+
+def test_create_cfradial2_volume(imd_files):
+    """
+    Test that the CfRadial2 volume built from the sweeps equals the round trip.
+    """
+    files = imd_files(nvolumes=1, elevations=(0.5, 1.5, 2.5))
+    sweeps = [read_sweep(file) for file in files]
+    dtree = create_cfradial2_volume(sweeps)
+    expected = to_cfradial2(create_volume(sweeps))
+    assert set(dtree.children) == set(expected.children), "Groups differ"
+    xr.testing.assert_identical(dtree.load(), expected.load())
+
+
+def test_read_volume_cfradial2(imd_files):
+    """
+    Test the CfRadial2 reader mode against `to_cfradial2_volumes`.
+    """
+    files = imd_files(nvolumes=2)
+    dtree = read_volume(files, cfradial2=True)
+    expected = to_cfradial2_volumes(read_volume(files))
+    assert list(dtree.children) == ["volume_0", "volume_1"]
+    xr.testing.assert_identical(dtree.load(), expected.load())
+
+
+@pytest.mark.parametrize("parallel", ["processes", "threads"])
+def test_to_cfradial2_volumes_parallel(imd_files, parallel):
+    """
+    Test that volumes converted concurrently equal the serial conversion.
+    """
+    volumes = read_volume(imd_files(nvolumes=3))
+    expected = to_cfradial2_volumes(volumes)
+    if parallel == "processes":
+        dtree = to_cfradial2_volumes(volumes, max_workers=2)
+    else:
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            dtree = to_cfradial2_volumes(volumes, executor=executor)
+    assert list(dtree.children) == ["volume_0", "volume_1", "volume_2"]
+    xr.testing.assert_identical(dtree.load(), expected.load())
+
+
+def test_to_cfradial2_volumes_lazy(imd_files):
+    """
+    Test that lazy volumes are converted only when accessed.
+    """
+    volumes = read_volume(imd_files(nvolumes=3))
+    expected = to_cfradial2_volumes(volumes)
+    with mock.patch("radarx.io.imd.to_cfradial2", wraps=to_cfradial2) as convert:
+        lazy = to_cfradial2_volumes(volumes, lazy=True)
+        assert isinstance(lazy, LazyVolumes) and len(lazy) == 3
+        assert "volume_0" in lazy and lazy.get("volume_3") is None
+        convert.assert_not_called()
+        latest = lazy[-1]
+        assert lazy["volume_2"] is latest, "Converted volume should be kept"
+        assert convert.call_count == 1, "Only the accessed volume is converted"
+    xr.testing.assert_identical(latest, to_cfradial2(volumes["volume_2"].to_dataset()))
+    assert "volume_3" not in lazy and "sweep_0" not in lazy
+    xr.testing.assert_identical(lazy.to_datatree(), expected)
+
+
+def test_read_sweep_packed(imd_files):
+    """
+    Test that packed moments keep their integers and unpack to the floats.
+    """
+    file = imd_files(nvolumes=1, packed=True)[0]
+    ds = read_sweep(file, decode="packed")
+    assert ds["DBZ"].dtype == np.int16, "Expected the packed integers"
+    assert ds["DBZ"].attrs["scale_factor"] == 0.01, "Packing attributes missing"
+    assert ds["azimuth"].dtype == np.float32, "Only moments stay packed"
+    xr.testing.assert_allclose(unpack(ds), read_sweep(file))
+    with pytest.raises(ValueError, match="Unknown decode"):
+        read_sweep(file, decode="int")
+
+
+def test_create_volume_packed(imd_files, tmp_path):
+    """
+    Test that packed moments stay packed in volumes and exported files.
+    """
+    files = imd_files(nvolumes=1, packed=True)
+    vol = create_volume([read_sweep(file, decode="packed") for file in files])
+    expected = create_volume([read_sweep(file) for file in files])
+    assert vol["DBZ"].dtype == np.int16, "Volume should stay packed"
+    xr.testing.assert_allclose(unpack(vol), expected)
+
+    vol.to_netcdf(tmp_path / "volume.nc")
+    with xr.open_dataset(tmp_path / "volume.nc") as exported:
+        assert exported["DBZ"].encoding["dtype"] == np.int16, "Export unpacked"
+        xr.testing.assert_allclose(exported["DBZ"], expected["DBZ"])
+
+
+def test_create_volume_unpacks_differing_packing(imd_files):
+    """
+    Test that moments packed differently per sweep are unpacked.
+    """
+    files = imd_files(nvolumes=1, packed=True)
+    sweeps = [read_sweep(file, decode="packed") for file in files]
+    sweeps[1]["DBZ"] = (sweeps[1]["DBZ"] // 2).assign_attrs(
+        sweeps[1]["DBZ"].attrs, scale_factor=0.02
+    )
+    vol = create_volume(sweeps)
+    assert vol["DBZ"].dtype.kind == "f", "Differing packing should be unpacked"
+    assert vol["VEL"].dtype == np.int16, "Equal packing should stay packed"
+    expected = create_volume([read_sweep(file) for file in files])
+    xr.testing.assert_allclose(vol["DBZ"], expected["DBZ"], atol=0.02)
+
+
+def test_read_volume_packed_cfradial2(imd_files):
+    """
+    Test that packed moments stay packed in CfRadial2 volumes.
+    """
+    files = imd_files(nvolumes=1, packed=True)
+    dtree = read_volume(files, decode="packed", cfradial2=True)
+    sweep = dtree["volume_0/sweep_1"]
+    assert sweep["DBZ"].dtype == np.int16, "Sweep should stay packed"
+    xr.testing.assert_allclose(
+        unpack(dtree)["volume_0/sweep_1"].to_dataset(),
+        read_volume(files, cfradial2=True)["volume_0/sweep_1"].to_dataset(),
+    )
+
+
 if __name__ == "__main__":
     pytest.main()
@@ -0,0 +1,133 @@
+#!/usr/bin/env python
+# Copyright (c) 2024-2025, Radarx developers.
+# Distributed under the MIT License. See LICENSE for more info.
+
+import asyncio
+import os
+import threading
+from queue import Queue
+
+import pytest
+import xarray as xr
+
+from radarx.io import VolumeWatcher, read_volume
+
+
+@pytest.fixture
+def spool(tmp_path, imd_files):
+    """Sweep files written elsewhere and a spool directory to move them to."""
+    files = imd_files(nvolumes=2, elevations=(0.5, 1.5, 2.5))
+    directory = tmp_path / "spool"
+    directory.mkdir()
+
+    def deliver(file):
+        target = directory / os.path.basename(file)
+        os.rename(file, target)
+        return str(target)
+
+    return files, directory, deliver
+
+
+def test_watcher_emits_on_elevation_decrease(spool):
+    """
+    The first volume is complete when the next one starts, the second one
+    with its last sweep.
+    """
+    files, directory, deliver = spool
+    expected = read_volume(files)
+    volumes = []
+    watcher = VolumeWatcher(directory, callback=volumes.append, use_watchdog=False)
+
+    for i, file in enumerate(files):
+        deliver(file)
+        assert watcher.poll() == 0, "Files are added once their size is stable"
+        assert watcher.poll() == 1, "Expected the delivered file"
+        count = (i >= 3) + (i >= 5)
+        assert len(volumes) == count, f"Unexpected volumes after sweep {i}"
+
+    watcher.flush()
+    assert len(volumes) == 2, "Nothing left to flush"
+    for vol, name in zip(volumes, expected.children):
+        xr.testing.assert_identical(vol, expected[name].to_dataset().load())
+
+
+def test_watcher_nsweeps(spool):
+    """Volumes are emitted with their last sweep when nsweeps is known."""
+    files, directory, deliver = spool
+    volumes = []
+    watcher = VolumeWatcher(
+        directory, callback=volumes.append, nsweeps=3, variables=["DBZ"]
+    )
+    for i, file in enumerate(files):
+        watcher.add_file(deliver(file))
+        assert len(volumes) == (i + 1) // 3, f"Unexpected volumes after sweep {i}"
+    assert "VEL" not in volumes[0], "Unselected moment read"
+
+
+def test_watcher_starts_mid_volume(tmp_path, imd_files):
+    """A partial first volume does not set the number of sweeps."""
+    files = imd_files(nvolumes=3, elevations=(0.5, 1.5, 2.5, 3.5))
+    volumes = []
+    watcher = VolumeWatcher(tmp_path, callback=volumes.append, existing=True)
+    for file in files[2:]:
+        watcher.add_file(file)
+    assert [vol.sizes["sweep"] for vol in volumes] == [2, 4, 4]
+
+
+def test_watcher_events(spool):
+    """Files reported as created or modified are read once their size is stable."""
+    files, directory, deliver = spool
+    volumes = []
+    events = Queue()
+    watcher = VolumeWatcher(
+        directory, callback=volumes.append, nsweeps=3, poll_interval=0.05
+    )
+    thread = threading.Thread(target=watcher._consume, args=(events,))
+    thread.start()
+    try:
+        for file in files[:3]:
+            events.put((deliver(file), False))
+        for _ in range(200):
+            if volumes:
+                break
+            watcher._stop.wait(0.05)
+    finally:
+        watcher._stop.set()
+        thread.join()
+    assert [vol.sizes["sweep"] for vol in volumes] == [3]
+
+
+def test_watcher_flush(spool):
+    """Incomplete volumes are emitted when stopping with flush."""
+    files, directory, deliver = spool
+    volumes = []
+    watcher = VolumeWatcher(directory, callback=volumes.append)
+    for file in files[:2]:
+        watcher.add_file(deliver(file))
+    assert not volumes, "The volume is not complete"
+    watcher.stop(flush=True)
+    assert [vol.sizes["sweep"] for vol in volumes] == [2]
+
+
+def test_watcher_asyncio_queue(spool):
+    """Volumes are put into an asyncio queue by the polling thread."""
+    files, directory, deliver = spool
+
+    async def main():
+        volumes = asyncio.Queue()
+        watcher = VolumeWatcher(
+            directory, queue=volumes, nsweeps=3, poll_interval=0.05, use_watchdog=False
+        )
+        with watcher:
+            for file in files[:3]:
+                deliver(file)
+            return await asyncio.wait_for(volumes.get(), timeout=30)
+
+    vol = asyncio.run(main())
+    assert vol.sizes["sweep"] == 3, "Unexpected volume"
+
+
+def test_watcher_requires_output(tmp_path):
+    """A callback or a queue is required."""
+    with pytest.raises(ValueError, match="callback"):
+        VolumeWatcher(tmp_path)